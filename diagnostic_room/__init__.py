@@ -1,23 +1,28 @@
 """
-Diagnostic Room Module
-Implements the Diagnostic Room Protocol and Contract for Lichen Protocol Room Architecture (PRA)
+Diagnostic Room (compatibility alias)
+The Diagnostic Room lives in rooms.diagnostic_room. This package maps the
+old import paths onto those modules, so each module is loaded once per process.
 """
 
-from .diagnostic_room import DiagnosticRoom, run_diagnostic_room
-from .types import (
-    DiagnosticRoomInput,
-    DiagnosticRoomOutput,
-    DiagnosticSignals,
-    ReadinessState,
-    ProtocolMapping
-)
+import importlib
+import sys
 
-__all__ = [
-    'DiagnosticRoom',
-    'run_diagnostic_room',
-    'DiagnosticRoomInput',
-    'DiagnosticRoomOutput',
-    'DiagnosticSignals',
-    'ReadinessState',
-    'ProtocolMapping'
-]
+from rooms.diagnostic_room import *  # noqa: F401,F403
+from rooms.diagnostic_room import __all__
+
+# Old submodule name -> module in rooms.diagnostic_room
+_SUBMODULES = {
+    "diagnostic_room": "diagnostic_room",
+    "types": "room_types",
+    "room_types": "room_types",
+    "capture": "capture",
+    "completion": "completion",
+    "mapping": "mapping",
+    "readiness": "readiness",
+    "sensing": "sensing",
+}
+
+for _name, _target in _SUBMODULES.items():
+    _module = importlib.import_module(f"rooms.diagnostic_room.{_target}")
+    sys.modules[f"{__name__}.{_name}"] = _module
+    globals()[_name] = _module
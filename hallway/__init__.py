@@ -3,7 +3,17 @@ Hallway Protocol Module
 Deterministic multi-room session orchestrator with gate enforcement and audit trails
 """
 
-from .hallway import HallwayOrchestrator, run_hallway
+from .hallway import HallwayOrchestrator, run_hallway, run_hallway_to_bytes
+from .envelope import EnvelopeTemplate, encode_json
+from .checkpoint import (
+    CheckpointStore, InMemoryCheckpointStore, FileCheckpointStore, CheckpointVerificationError
+)
+from .idempotency import IdempotencyCache, IdempotencyBackend, FileIdempotencyBackend, request_key
+from .sharding import HashRing
+from .supervisor import ShardSupervisor, WorkerError
+from .service import HallwayService
+from .admission import AdmissionController, RateLimit, TokenBucket, ConcurrencyLimiter
+from rooms.refusals import RefusalLibrary, get_refusal_library
 from .gates import GateDecision, GateInterface, CoherenceGate, evaluate_gate_chain
 from .upcaster import upcast_v01_to_v02, downcast_v02_to_v01, verify_roundtrip
 from .audit import canonical_json, sha256_hex, compute_step_hash, build_audit_chain
@@ -11,6 +21,27 @@ from .audit import canonical_json, sha256_hex, compute_step_hash, build_audit_ch
 __all__ = [
     "HallwayOrchestrator",
     "run_hallway",
+    "run_hallway_to_bytes",
+    "EnvelopeTemplate",
+    "encode_json",
+    "CheckpointStore",
+    "InMemoryCheckpointStore",
+    "FileCheckpointStore",
+    "CheckpointVerificationError",
+    "IdempotencyCache",
+    "IdempotencyBackend",
+    "FileIdempotencyBackend",
+    "request_key",
+    "HashRing",
+    "ShardSupervisor",
+    "WorkerError",
+    "HallwayService",
+    "AdmissionController",
+    "RateLimit",
+    "TokenBucket",
+    "ConcurrencyLimiter",
+    "RefusalLibrary",
+    "get_refusal_library",
     "GateDecision",
     "GateInterface", 
     "CoherenceGate",
@@ -0,0 +1,282 @@
+"""
+Admission Control for the Hallway Protocol
+Token buckets per room and per backend plus a bounded concurrency limiter
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+
+# Gate name admission refusals are recorded under in a step's gate_decisions
+ADMISSION_GATE = "admission_control"
+
+
+class RateLimit(NamedTuple):
+    """Sustained rate in units per second and the burst a bucket can hold"""
+    rate: float
+    burst: float
+
+
+class TokenBucket:
+    """
+    Token bucket refilled lazily from a monotonic clock.
+    Starts full, so a burst is admitted before the rate applies.
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Token bucket rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = burst
+        self._updated = clock()
+
+    def wait_time(self, amount: float = 1.0) -> float:
+        """Seconds until amount tokens are available; 0 if they are now"""
+        self._refill()
+        if amount > self.burst:
+            return float("inf")
+        return max(amount - self.tokens, 0.0) / self.rate
+
+    def consume(self, amount: float = 1.0):
+        """Take tokens; callers check wait_time first"""
+        self._refill()
+        self.tokens -= amount
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class ConcurrencyLimiter:
+    """
+    Limits concurrent holders, with a bounded FIFO queue of waiters.
+
+    When all slots are taken a request waits only if fewer than
+    ``max_waiting`` are already waiting, and for at most ``wait_timeout``
+    seconds; otherwise it is refused at once.
+    """
+
+    def __init__(self, max_concurrent: int, max_waiting: int = 0, wait_timeout: Optional[float] = None):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_waiting < 0:
+            raise ValueError("max_waiting cannot be negative")
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the bounded queue if needed; returns False if refused"""
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.max_waiting:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.wait_timeout)
+            return True
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+
+    def release(self):
+        """Free a slot, handing it straight to the longest waiter"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+def _release(limiters: List[ConcurrencyLimiter]):
+    for limiter in reversed(limiters):
+        limiter.release()
+
+
+class AdmissionDecision(NamedTuple):
+    """Why a request was refused admission"""
+    reason: str
+    scope: str
+    retry_after: float
+
+
+class AdmissionTicket:
+    """Result of an admission attempt; admitted tickets must be released when the work ends"""
+
+    def __init__(self, decision: Optional[AdmissionDecision] = None, limiters: Tuple[ConcurrencyLimiter, ...] = ()):
+        self.decision = decision
+        self._limiters = limiters
+
+    @property
+    def admitted(self) -> bool:
+        return self.decision is None
+
+    def release(self):
+        """Return any concurrency slots; safe to call more than once"""
+        limiters, self._limiters = self._limiters, ()
+        _release(list(limiters))
+
+
+class AdmissionController:
+    """
+    Admits or refuses room and backend calls before any work starts.
+
+    A call must find a token in its room's bucket, in its backend's bucket,
+    and enough budget in its backend's spend bucket. It must then get a
+    slot in the global limiter and in its backend's limiter. Refusals are
+    immediate, except for the bounded wait for a concurrency slot, so
+    bursts are shed early instead of queueing. admit_room() admits a room
+    under the backend and cost configured for it.
+    """
+
+    def __init__(
+        self,
+        room_limits: Optional[Dict[str, RateLimit]] = None,
+        backend_limits: Optional[Dict[str, RateLimit]] = None,
+        backend_budgets: Optional[Dict[str, RateLimit]] = None,
+        max_concurrent: Optional[int] = None,
+        backend_concurrency: Optional[Dict[str, int]] = None,
+        max_waiting: int = 0,
+        wait_timeout: Optional[float] = None,
+        room_backends: Optional[Dict[str, str]] = None,
+        room_costs: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the AdmissionController.
+
+        Args:
+            room_limits: Calls per second and burst per room_id
+            backend_limits: Calls per second and burst per backend
+            backend_budgets: Spend per second and maximum balance per backend, charged by call cost
+            max_concurrent: Calls in flight across all rooms (None for unlimited)
+            backend_concurrency: Calls in flight per backend
+            max_waiting: Calls each concurrency limiter may queue once full
+            wait_timeout: Seconds a queued call waits for a slot before it is refused
+            room_backends: Backend each room_id calls, for admit_room
+            room_costs: Cost charged to the backend's budget per call of each room_id, for admit_room
+            clock: Monotonic clock for the token buckets
+        """
+        self.room_buckets = {room_id: TokenBucket(*limit, clock=clock) for room_id, limit in (room_limits or {}).items()}
+        self.backend_buckets = {name: TokenBucket(*limit, clock=clock) for name, limit in (backend_limits or {}).items()}
+        self.budget_buckets = {name: TokenBucket(*limit, clock=clock) for name, limit in (backend_budgets or {}).items()}
+        self.limiter = ConcurrencyLimiter(max_concurrent, max_waiting, wait_timeout) if max_concurrent else None
+        self.backend_limiters = {
+            name: ConcurrencyLimiter(limit, max_waiting, wait_timeout)
+            for name, limit in (backend_concurrency or {}).items()
+        }
+        self.room_backends = dict(room_backends or {})
+        self.room_costs = dict(room_costs or {})
+
+    @classmethod
+    def from_experiment_config(cls, config: Dict[str, Any], **kwargs) -> "AdmissionController":
+        """
+        Build a controller from a champion/challenger experiment config.
+
+        Each challenger gets shadow_limits.per_model_qps (burst of one call),
+        a per_model_daily_usd spend budget and shadow_limits.max_parallel.
+        ensemble_selection.max_parallel bounds calls overall, and each room
+        is charged its budgets.max_cost_per_call_usd. The config does not
+        say which backend a room calls; pass room_backends for that. Keyword
+        arguments override or extend what the config provides.
+        """
+        shadow = config.get("shadow_limits", {})
+        challengers = config.get("challengers", [])
+        options: Dict[str, Any] = {}
+        if "per_model_qps" in shadow:
+            qps = shadow["per_model_qps"]
+            options["backend_limits"] = {model: RateLimit(qps, 1.0) for model in challengers}
+        if "per_model_daily_usd" in shadow:
+            daily = shadow["per_model_daily_usd"]
+            options["backend_budgets"] = {model: RateLimit(daily / 86400.0, daily) for model in challengers}
+        if "max_parallel" in shadow:
+            options["backend_concurrency"] = {model: shadow["max_parallel"] for model in challengers}
+        if "max_parallel" in config.get("ensemble_selection", {}):
+            options["max_concurrent"] = config["ensemble_selection"]["max_parallel"]
+        room_costs = {
+            room_id: budget["max_cost_per_call_usd"]
+            for room_id, budget in config.get("budgets", {}).items()
+            if "max_cost_per_call_usd" in budget
+        }
+        if room_costs:
+            options["room_costs"] = room_costs
+        options.update(kwargs)
+        return cls(**options)
+
+    async def admit_room(self, room_id: str) -> AdmissionTicket:
+        """Admit one call of a room under its configured backend and cost"""
+        return await self.admit(room_id, self.room_backends.get(room_id), self.room_costs.get(room_id, 0.0))
+
+    async def admit(self, room_id: str, backend: Optional[str] = None, cost: float = 0.0) -> AdmissionTicket:
+        """Try to admit one call; check ``ticket.admitted`` and release admitted tickets when done"""
+        decision = self._check_buckets(room_id, backend, cost)
+        if decision is not None:
+            return AdmissionTicket(decision)
+
+        limiters: List[ConcurrencyLimiter] = []
+        candidates = [("global", self.limiter), (f"backend:{backend}", self.backend_limiters.get(backend))]
+        for scope, limiter in candidates:
+            if limiter is None:
+                continue
+            if not await limiter.acquire():
+                _release(limiters)
+                return AdmissionTicket(AdmissionDecision("concurrency_limited", scope, 0.0))
+            limiters.append(limiter)
+
+        # A queued call may have outwaited its rate window; check again before spending
+        decision = self._check_buckets(room_id, backend, cost)
+        if decision is not None:
+            _release(limiters)
+            return AdmissionTicket(decision)
+
+        for bucket, amount in self._buckets(room_id, backend, cost):
+            bucket.consume(amount)
+        return AdmissionTicket(None, tuple(limiters))
+
+    def _buckets(self, room_id: str, backend: Optional[str], cost: float) -> List[Tuple[TokenBucket, float]]:
+        buckets = []
+        if room_id in self.room_buckets:
+            buckets.append((self.room_buckets[room_id], 1.0))
+        if backend in self.backend_buckets:
+            buckets.append((self.backend_buckets[backend], 1.0))
+        if backend in self.budget_buckets and cost > 0:
+            buckets.append((self.budget_buckets[backend], cost))
+        return buckets
+
+    def _check_buckets(self, room_id: str, backend: Optional[str], cost: float) -> Optional[AdmissionDecision]:
+        checks = [
+            ("rate_limited", f"room:{room_id}", self.room_buckets.get(room_id), 1.0),
+            ("rate_limited", f"backend:{backend}", self.backend_buckets.get(backend), 1.0),
+            ("budget_exhausted", f"backend:{backend}", self.budget_buckets.get(backend), cost),
+        ]
+        for reason, scope, bucket, amount in checks:
+            if bucket is None or amount <= 0:
+                continue
+            wait = bucket.wait_time(amount)
+            if wait > 0:
+                return AdmissionDecision(reason, scope, wait)
+        return None
@@ -4,8 +4,8 @@ Provides canonical JSON serialization and SHA256 hashing for audit trails
 """
 
 import hashlib
-import json
 from typing import Any, Dict
+from rooms.json_codec import canonical_dumps
 
 
 def canonical_json(obj: Dict[str, Any]) -> str:
@@ -18,7 +18,7 @@ def canonical_json(obj: Dict[str, Any]) -> str:
     Returns:
         Canonical JSON string with sorted keys and no whitespace
     """
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return canonical_dumps(obj)
 
 
 def sha256_hex(payload: str) -> str:
@@ -0,0 +1,151 @@
+"""
+Checkpoints for the Hallway Protocol
+Persists StepResults as they are produced and verifies a stored prefix for resume
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List
+from rooms import json_codec
+from .audit import compute_step_hash
+from .upcaster import upcast_v01_to_v02
+
+
+class CheckpointVerificationError(ValueError):
+    """Raised when a stored step prefix does not form a valid audit chain"""
+
+
+class CheckpointStore:
+    """
+    Storage for the StepResults of hallway runs, keyed by checkpoint id.
+    Implementations must accept appends from a worker thread.
+    """
+
+    def load(self, checkpoint_id: str) -> List[Dict[str, Any]]:
+        """Get the stored steps of a run, oldest first"""
+        raise NotImplementedError
+
+    def append(self, checkpoint_id: str, step: Dict[str, Any]):
+        """Persist one completed step after those already stored"""
+        raise NotImplementedError
+
+    def reset(self, checkpoint_id: str):
+        """Discard the stored steps of a run"""
+        raise NotImplementedError
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Process-local checkpoint store"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Dict[str, List[Dict[str, Any]]] = {}
+
+    def load(self, checkpoint_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._steps.get(checkpoint_id, []))
+
+    def append(self, checkpoint_id: str, step: Dict[str, Any]):
+        with self._lock:
+            self._steps.setdefault(checkpoint_id, []).append(step)
+
+    def reset(self, checkpoint_id: str):
+        with self._lock:
+            self._steps.pop(checkpoint_id, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    File-backed checkpoint store: one append-only JSONL file per run.
+    A torn final line from a crash is ignored on load, so the run resumes
+    from the last step that was fully written.
+    """
+
+    def __init__(self, base_dir: str, fsync: bool = False):
+        self.base_dir = base_dir
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        os.makedirs(base_dir, exist_ok=True)
+
+    def load(self, checkpoint_id: str) -> List[Dict[str, Any]]:
+        path = self._path(checkpoint_id)
+        if not os.path.exists(path):
+            return []
+
+        steps = []
+        with open(path, "r", encoding="utf-8") as checkpoint_file:
+            for line in checkpoint_file:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    steps.append(json_codec.loads(line))
+                except ValueError:
+                    break
+        return steps
+
+    def append(self, checkpoint_id: str, step: Dict[str, Any]):
+        line = json_codec.dumps(step)
+        with self._lock:
+            with open(self._path(checkpoint_id), "a", encoding="utf-8") as checkpoint_file:
+                checkpoint_file.write(line + "\n")
+                checkpoint_file.flush()
+                if self.fsync:
+                    os.fsync(checkpoint_file.fileno())
+
+    def reset(self, checkpoint_id: str):
+        with self._lock:
+            path = self._path(checkpoint_id)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _path(self, checkpoint_id: str) -> str:
+        # Hash the id so arbitrary session references are safe file names
+        return os.path.join(self.base_dir, hashlib.sha256(checkpoint_id.encode("utf-8")).hexdigest() + ".steps.jsonl")
+
+
+def verify_step_prefix(steps: List[Dict[str, Any]], rooms_to_run: List[str]) -> List[Dict[str, Any]]:
+    """
+    Verify stored steps against the planned rooms and their audit chain.
+
+    Each step must be for the room planned at its position, hash to its
+    step_hash, link to the previous step through prev_hash, and be exactly
+    the StepResult the upcaster builds from its data. Returns the steps;
+    raises CheckpointVerificationError on the first mismatch.
+    """
+    if len(steps) > len(rooms_to_run):
+        raise CheckpointVerificationError(
+            f"Checkpoint has {len(steps)} steps but the run plans only {len(rooms_to_run)} rooms"
+        )
+
+    prev_hash = None
+    for index, step in enumerate(steps):
+        try:
+            room_id = step["room_id"]
+            audit = step["audit"]
+            data = step["data"]
+        except (KeyError, TypeError):
+            raise CheckpointVerificationError(f"Checkpoint step {index} is not a StepResult")
+
+        if room_id != rooms_to_run[index]:
+            raise CheckpointVerificationError(
+                f"Checkpoint step {index} is for room {room_id}, expected {rooms_to_run[index]}"
+            )
+        if audit.get("prev_hash") != prev_hash:
+            raise CheckpointVerificationError(f"Checkpoint step {index} ({room_id}) breaks the prev_hash chain")
+        if audit.get("step_hash") != compute_step_hash(data):
+            raise CheckpointVerificationError(f"Checkpoint step {index} ({room_id}) does not match its step_hash")
+
+        rebuilt = upcast_v01_to_v02(
+            room_id=room_id,
+            room_output_v01=data,
+            status=step.get("status"),
+            gate_decisions=step.get("gate_decisions", []),
+            prev_hash=prev_hash
+        )
+        if rebuilt != step:
+            raise CheckpointVerificationError(f"Checkpoint step {index} ({room_id}) is not a valid StepResult")
+
+        prev_hash = audit["step_hash"]
+
+    return steps
@@ -0,0 +1,108 @@
+"""
+Hallway Envelope Template
+Pre-serialized v0.2 output envelope; only the per-run sections are encoded per call
+"""
+
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, List
+from rooms import json_codec
+
+
+HALLWAY_CONTRACT_VERSION = "0.2.0"
+
+# Placeholders marking where the dynamic sections are spliced in
+_SESSION_REF_SLOT = "\x00session_state_ref\x00"
+_STEPS_SLOT = "\x00steps\x00"
+_FINAL_STATE_SLOT = "\x00final_state_ref\x00"
+_EXIT_SUMMARY_SLOT = "\x00exit_summary\x00"
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode an object the way hallway outputs are emitted as bytes (compact, ASCII-safe)"""
+    return json_codec.dumps_bytes(obj)
+
+
+def _encode_section(obj: Any) -> bytes:
+    # Steps and exit summaries always carry nulls (first prev_hash, decline),
+    # which the accelerated encoder cannot emit safely; go straight to stdlib
+    return json_codec.stdlib_dumps_bytes(obj)
+
+
+def valid_session_ref(session_state_ref: str) -> str:
+    """Ensure session_state_ref is valid (non-empty) for the v0.2 contract"""
+    if session_state_ref and session_state_ref.strip():
+        return session_state_ref
+    return "invalid-session-ref"
+
+
+class EnvelopeTemplate:
+    """
+    Hallway output envelope for one contract.
+
+    The static header (room_id, title, version, purpose, stone_alignment,
+    sequence, mini_walk_supported, gate_profile) is built and serialized
+    once. ``build`` returns the envelope dict; ``to_bytes`` splices the
+    encoded steps, final_state_ref and exit_summary into the precomputed
+    bytes and equals ``encode_json(build(...))`` byte for byte.
+    """
+
+    def __init__(self, contract: Dict[str, Any], sequence: List[str], gate_profile: Dict[str, Any]):
+        self._header = {
+            "room_id": "hallway",
+            "title": "Hallway",
+            "version": HALLWAY_CONTRACT_VERSION,
+            "purpose": "Deterministic multi-room session orchestrator",
+            "stone_alignment": contract.get("stone_alignment", []),
+            "sequence": sequence,
+            "mini_walk_supported": contract.get("mini_walk_supported", False),
+            "gate_profile": gate_profile
+        }
+        self._segments = self._serialize_segments()
+
+    def _serialize_segments(self) -> List[bytes]:
+        skeleton = self._envelope(_SESSION_REF_SLOT, _STEPS_SLOT, _FINAL_STATE_SLOT, _EXIT_SUMMARY_SLOT)
+        text = json_codec.dumps(skeleton)
+
+        segments = []
+        for slot in (_SESSION_REF_SLOT, _STEPS_SLOT, _FINAL_STATE_SLOT, _EXIT_SUMMARY_SLOT):
+            head, _, text = text.partition(json_codec.dumps(slot))
+            segments.append(head.encode("utf-8"))
+        segments.append(text.encode("utf-8"))
+        return segments
+
+    def _envelope(self, session_ref: Any, steps: Any, final_state_ref: Any, exit_summary: Any) -> Dict[str, Any]:
+        envelope = dict(self._header)
+        envelope["inputs"] = {
+            "session_state_ref": session_ref,
+            "payloads": {},
+            "options": {}
+        }
+        envelope["outputs"] = {
+            "contract_version": HALLWAY_CONTRACT_VERSION,
+            "steps": steps,
+            "final_state_ref": final_state_ref,
+            "exit_summary": exit_summary
+        }
+        return envelope
+
+    def build(self, steps: List[Dict[str, Any]], final_state_ref: str, exit_summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the hallway output dict that validates against the v0.2 contract"""
+        session_ref = valid_session_ref(final_state_ref)
+        return self._envelope(session_ref, steps, session_ref, exit_summary)
+
+    def to_bytes(self, steps: List[Dict[str, Any]], final_state_ref: str, exit_summary: Dict[str, Any]) -> bytes:
+        """Serialize the hallway output, encoding only the dynamic sections"""
+        session_ref = encode_basestring_ascii(valid_session_ref(final_state_ref)).encode("utf-8")
+        before_ref, before_steps, before_final, before_exit, tail = self._segments
+        return b"".join((
+            before_ref, session_ref,
+            before_steps, _encode_section(steps),
+            before_final, session_ref,
+            before_exit, _encode_section(exit_summary),
+            tail
+        ))
+
+    def output_to_bytes(self, output: Dict[str, Any]) -> bytes:
+        """Serialize an envelope previously returned by ``build``"""
+        outputs = output["outputs"]
+        return self.to_bytes(outputs["steps"], outputs["final_state_ref"], outputs["exit_summary"])
@@ -5,10 +5,19 @@ Deterministic multi-room session orchestrator with gate enforcement and audit tr
 
 import asyncio
 import importlib
-from typing import Dict, Any, List, Optional
+import math
+import os
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple
 from .gates import evaluate_gate_chain, CoherenceGate
-from .upcaster import upcast_v01_to_v02
+from .step_chain import StepChain, get_pipeline_executor
+from .scheduler import RoomOutcome, build_dependencies, iter_dag, iter_resumed, iter_sequential
+from .checkpoint import CheckpointStore, verify_step_prefix
+from .idempotency import IdempotencyCache, request_key
+from .admission import ADMISSION_GATE, AdmissionController, AdmissionDecision
 from .audit import build_audit_chain
+from .envelope import EnvelopeTemplate
+from rooms import json_codec
+from rooms.refusals import get_refusal_library
 
 
 class HallwayOrchestrator:
@@ -17,18 +26,36 @@ class HallwayOrchestrator:
     Runs the canonical sequence of rooms, enforces gate chains, and returns v0.2 envelopes.
     """
     
-    def __init__(self, contract: Dict[str, Any], gates: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        contract: Dict[str, Any],
+        gates: Optional[Dict[str, Any]] = None,
+        memory_room: Optional[Any] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        idempotency_cache: Optional[IdempotencyCache] = None,
+        admission: Optional[AdmissionController] = None
+    ):
         """
         Initialize the HallwayOrchestrator.
         
         Args:
-            contract: Hallway contract configuration
+            contract: Hallway contract configuration (an optional depends_on map enables concurrent scheduling)
             gates: Dictionary mapping gate names to gate implementations
+            memory_room: Optional MemoryRoom whose context for the next room is prefetched while the current room runs
+            checkpoint_store: Optional store that persists each step under session_state_ref as it is produced
+            idempotency_cache: Optional cache that replays the envelope of a repeated request instead of rerunning it
+            admission: Optional admission controller; rooms it refuses decline at once with a refusal
         """
         self.contract = contract
         self.gates = gates or {"coherence_gate": CoherenceGate()}
         self.sequence = contract.get("sequence", [])
         self.gate_profile = contract.get("gate_profile", {"chain": [], "overrides": {}})
+        self.memory_room = memory_room
+        self.checkpoint_store = checkpoint_store
+        self.idempotency_cache = idempotency_cache
+        self.admission = admission
+        self.envelope = EnvelopeTemplate(contract, self.sequence, self.gate_profile)
+        self.dependencies = build_dependencies(self.sequence, contract.get("depends_on"))
     
     async def run(
         self, 
@@ -47,137 +74,388 @@ class HallwayOrchestrator:
         Returns:
             Dict that validates against the Hallway v0.2 contract
         """
+        if self.idempotency_cache is not None:
+            # Decode the replayed bytes so callers never share a cached envelope
+            return json_codec.loads(await self.run_to_bytes(session_state_ref, payloads, options))
+        
+        steps, final_state_ref, exit_summary = await self._run_sequence(session_state_ref, payloads, options)
+        return self._build_hallway_output(steps, final_state_ref, exit_summary)
+    
+    async def run_to_bytes(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Run the hallway protocol and return the output as compact JSON bytes.
+        Only steps, final_state_ref and exit_summary are serialized per run;
+        the rest of the envelope comes from the contract's precomputed template.
+        
+        Args:
+            session_state_ref: Reference to the session state
+            payloads: Optional per-room payload map keyed by room_id
+            options: Optional configuration options
+            
+        Returns:
+            UTF-8 JSON equal to the compact encoding of ``run``'s output
+        """
+        if self.idempotency_cache is not None:
+            key = request_key(session_state_ref, payloads, options)
+            return await self.idempotency_cache.get_or_run(
+                key, lambda: self._run_sequence_to_bytes(session_state_ref, payloads, options)
+            )
+        
+        return await self._run_sequence_to_bytes(session_state_ref, payloads, options)
+    
+    async def stream(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Run the hallway protocol, yielding each StepResult as soon as it is produced.
+        
+        Args:
+            session_state_ref: Reference to the session state
+            payloads: Optional per-room payload map keyed by room_id
+            options: Optional configuration options
+            
+        Yields:
+            ("step", step) for each StepResult in order, then
+            ("exit", {"final_state_ref": ..., "exit_summary": ...}) once the walk ends
+        
+        With an idempotency cache, a cached or in-flight response for the same
+        request is replayed step by step from its envelope instead of running
+        the rooms again, and a fresh run is shared like ``run_to_bytes``, so a
+        consumer that stops early no longer stops the walk.
+        """
+        loop = asyncio.get_running_loop()
+        produced: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        
+        def observe(step: Dict[str, Any]):
+            # Pipelined runs produce steps on the worker thread
+            loop.call_soon_threadsafe(produced.put_nowait, step)
+        
+        if self.idempotency_cache is not None:
+            key = request_key(session_state_ref, payloads, options)
+            run = asyncio.ensure_future(self.idempotency_cache.get_or_run(
+                key, lambda: self._run_sequence_to_bytes(session_state_ref, payloads, options, observe)
+            ))
+        else:
+            run = asyncio.ensure_future(self._run_sequence(session_state_ref, payloads, options, observe))
+        run.add_done_callback(lambda _: loop.call_soon_threadsafe(produced.put_nowait, None))
+        try:
+            streamed = 0
+            while True:
+                step = await produced.get()
+                if step is None:
+                    break
+                streamed += 1
+                yield "step", step
+            result = run.result()
+            if isinstance(result, bytes):
+                # Steps this stream did not see live come from the replayed envelope
+                outputs = json_codec.loads(result)["outputs"]
+                for step in outputs["steps"][streamed:]:
+                    yield "step", step
+                final_state_ref, exit_summary = outputs["final_state_ref"], outputs["exit_summary"]
+            else:
+                _, final_state_ref, exit_summary = result
+            yield "exit", {"final_state_ref": final_state_ref, "exit_summary": exit_summary}
+        finally:
+            # A consumer that stops early (disconnect, deadline) stops the walk
+            if not run.done():
+                run.cancel()
+                await asyncio.gather(run, return_exceptions=True)
+    
+    async def _run_sequence_to_bytes(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        options: Optional[Dict[str, Any]],
+        step_observer: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> bytes:
+        """Run the rooms and serialize the envelope, reporting each step to step_observer."""
+        steps, final_state_ref, exit_summary = await self._run_sequence(
+            session_state_ref, payloads, options, step_observer
+        )
+        return self.envelope.to_bytes(steps, final_state_ref, exit_summary)
+    
+    async def _run_sequence(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        options: Optional[Dict[str, Any]],
+        step_observer: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Tuple[List[Dict[str, Any]], str, Dict[str, Any]]:
+        """Run the rooms and return (steps, final_state_ref, exit_summary), reporting each step to step_observer."""
         # Prepare options with defaults
         options = options or {}
         stop_on_decline = options.get("stop_on_decline", True)
         dry_run = options.get("dry_run", False)
         mini_walk = options.get("mini_walk", False)
         rooms_subset = options.get("rooms_subset", [])
+        pipeline = options.get("pipeline", False)
+        resume_from = options.get("resume_from")
         
         # Determine which rooms to run
         rooms_to_run = self._determine_rooms_to_run(rooms_subset, mini_walk)
         
-        # Initialize results
-        steps = []
-        last_hash = None
+        # Load and verify the completed steps of an interrupted run
+        restored = self._restore_checkpoint(resume_from, session_state_ref, rooms_to_run, dry_run)
+        
+        # Initialize results; pipelined runs upcast each step on the worker
+        # thread while the next room's gates and execution proceed
+        on_step = step_observer
+        if self.checkpoint_store is not None:
+            def on_step(step: Dict[str, Any]):
+                self.checkpoint_store.append(session_state_ref, step)
+                if step_observer is not None:
+                    step_observer(step)
+        chain = StepChain(get_pipeline_executor() if pipeline else None, on_step)
         final_state_ref = session_state_ref
         
-        # Run each room in sequence
-        for room_id in rooms_to_run:
-            # Evaluate gate chain
-            gate_decisions, gates_passed = evaluate_gate_chain(
-                self.gate_profile["chain"],
-                room_id,
-                session_state_ref,
-                payloads.get(room_id) if payloads else None,
-                self.gates
-            )
-            
-            # Convert gate decisions to dict format
-            gate_decisions_dict = [gd.to_dict() if hasattr(gd, 'to_dict') else gd for gd in gate_decisions]
-            
-            # If gates failed and we should stop on decline
-            if not gates_passed:
-                # Create decline step result
-                decline_step = upcast_v01_to_v02(
-                    room_id=room_id,
-                    room_output_v01={
-                        "error": "Gate chain evaluation failed",
-                        "gate_decisions": gate_decisions_dict
-                    },
-                    status="decline",
-                    gate_decisions=gate_decisions_dict,
-                    prev_hash=last_hash
-                )
-                steps.append(decline_step)
-                last_hash = decline_step["audit"]["step_hash"]
+        # Gate and run each room; with declared depends_on edges, ready rooms
+        # run concurrently but outcomes still arrive in canonical order
+        prefetches: Dict[str, "asyncio.Task[Any]"] = {}
+        evaluated = set()
+        
+        async def evaluate(room_id: str) -> RoomOutcome:
+            evaluated.add(room_id)
+            self._prefetch_next_context(rooms_to_run, room_id, session_state_ref, payloads, prefetches)
+            return await self._evaluate_room(room_id, session_state_ref, payloads, dry_run)
+        
+        remaining_rooms = rooms_to_run[len(restored):]
+        if self.dependencies is None:
+            outcomes = iter_sequential(remaining_rooms, evaluate)
+        else:
+            outcomes = iter_dag(remaining_rooms, self.dependencies, evaluate, stop_on_decline)
+        if restored:
+            outcomes = iter_resumed(restored, outcomes)
+        
+        try:
+            async for outcome in outcomes:
+                room_id = outcome.room_id
+                
+                # Create step result (restored steps are reused, not rebuilt)
+                if outcome.step is not None:
+                    chain.restore(outcome.step)
+                    if step_observer is not None:
+                        step_observer(outcome.step)
+                else:
+                    chain.append(room_id, outcome.room_output, outcome.status, outcome.gate_decisions)
+                
+                # If gates failed and we should stop on decline
+                if not outcome.gates_passed:
+                    # If we should stop on decline, exit now
+                    if stop_on_decline:
+                        steps = await chain.steps()
+                        exit_summary = self._build_exit_summary(
+                            completed=False,
+                            decline=self._gate_failure_decline(room_id, outcome.gate_decisions),
+                            steps=steps
+                        )
+                        
+                        return steps, final_state_ref, exit_summary
+                    
+                    # If not stopping on decline, continue to next room
+                    continue
                 
-                # If we should stop on decline, exit now
-                if stop_on_decline:
+                # Update final state ref if room provides one
+                if outcome.executed and "session_state_ref" in outcome.room_output:
+                    final_state_ref = outcome.room_output["session_state_ref"]
+                
+                # If room declined and we should stop on decline
+                if outcome.declined and stop_on_decline:
+                    steps = await chain.steps()
                     exit_summary = self._build_exit_summary(
                         completed=False,
                         decline={
-                            "reason": "gate_chain_failed",
-                            "message": f"Gate chain evaluation failed for room {room_id}",
-                            "details": {"room_id": room_id, "gate_decisions": gate_decisions_dict}
+                            "reason": "room_declined",
+                            "message": f"Room {room_id} declined to proceed",
+                            "details": {"room_id": room_id, "room_output": outcome.room_output}
                         },
                         steps=steps
                     )
                     
-                    return self._build_hallway_output(steps, final_state_ref, exit_summary)
-                
-                # If not stopping on decline, continue to next room
-                continue
-            
-            # If dry run, skip actual room execution
-            if dry_run:
-                mock_output = {"dry_run": True, "room_id": room_id}
-                step_result = upcast_v01_to_v02(
-                    room_id=room_id,
-                    room_output_v01=mock_output,
-                    status="ok",
-                    gate_decisions=gate_decisions_dict,
-                    prev_hash=last_hash
-                )
-                steps.append(step_result)
-                last_hash = step_result["audit"]["step_hash"]
-                continue
-            
-            # For now, always use mock output to avoid room execution issues
-            # This will be replaced with proper room integration later
-            mock_output = {"dry_run": True, "room_id": room_id}
-            room_output = mock_output
-            
-            # Run the room (commented out for now)
-            # try:
-            #     room_output = await self._run_room(room_id, session_state_ref, payloads)
-            
-            # Determine status based on room output
-            status = "ok"
-            if self._is_room_decline(room_output):
-                status = "decline"
-            
-            # Create step result
-            step_result = upcast_v01_to_v02(
-                room_id=room_id,
-                room_output_v01=room_output,
-                status=status,
-                gate_decisions=gate_decisions_dict,
-                prev_hash=last_hash
-            )
-            
-            steps.append(step_result)
-            last_hash = step_result["audit"]["step_hash"]
-            
-            # Update final state ref if room provides one
-            if "session_state_ref" in room_output:
-                final_state_ref = room_output["session_state_ref"]
-            
-            # If room declined and we should stop on decline
-            if status == "decline" and stop_on_decline:
-                exit_summary = self._build_exit_summary(
-                    completed=False,
-                    decline={
-                        "reason": "room_declined",
-                        "message": f"Room {room_id} declined to proceed",
-                        "details": {"room_id": room_id, "room_output": room_output}
-                    },
-                    steps=steps
-                )
-                
-                return self._build_hallway_output(steps, final_state_ref, exit_summary)
-            
-            # Note: Exception handling is commented out since we're using mock output
-            # The mock output approach avoids room execution errors
+                    return steps, final_state_ref, exit_summary
+        finally:
+            # Cancels rooms still in flight when the walk stops early
+            await outcomes.aclose()
+            # Prefetches for rooms the walk never reached are not needed
+            for room_id, prefetch in prefetches.items():
+                if room_id not in evaluated:
+                    prefetch.cancel()
+            await asyncio.gather(*prefetches.values(), return_exceptions=True)
+            # A run that fails part way still checkpoints every step it built
+            await chain.settle()
         
         # All rooms completed successfully
+        steps = await chain.steps()
         exit_summary = self._build_exit_summary(
             completed=True,
             decline=None,
             steps=steps
         )
         
-        return self._build_hallway_output(steps, final_state_ref, exit_summary)
+        return steps, final_state_ref, exit_summary
+    
+    async def _evaluate_room(
+        self,
+        room_id: str,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        dry_run: bool
+    ) -> RoomOutcome:
+        """Admit the room, evaluate its gate chain and, if it passes, run the room."""
+        if self.admission is None:
+            return await self._evaluate_admitted_room(room_id, session_state_ref, payloads, dry_run)
+        
+        # Over-limit rooms are refused before any gate or room work starts
+        ticket = await self.admission.admit_room(room_id)
+        if not ticket.admitted:
+            return self._admission_decline(room_id, ticket.decision)
+        try:
+            return await self._evaluate_admitted_room(room_id, session_state_ref, payloads, dry_run)
+        finally:
+            ticket.release()
+    
+    def _admission_decline(self, room_id: str, decision: AdmissionDecision) -> RoomOutcome:
+        """Build the declined outcome of a room refused admission, worded by the refusal library."""
+        retry_after = decision.retry_after if math.isfinite(decision.retry_after) else None
+        gate_decisions_dict = [{
+            "gate": ADMISSION_GATE,
+            "allow": False,
+            "reason": decision.reason,
+            "details": {"room_id": room_id, "scope": decision.scope, "retry_after_s": retry_after}
+        }]
+        decline_output = {
+            "error": "Admission denied",
+            "gate_decisions": gate_decisions_dict,
+            "refusal": get_refusal_library().refuse("not_now")
+        }
+        return RoomOutcome(room_id, decline_output, "decline", gate_decisions_dict, False, False)
+    
+    @staticmethod
+    def _gate_failure_decline(room_id: str, gate_decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the exit decline for a room whose gates failed, telling admission refusals apart."""
+        if gate_decisions and gate_decisions[0]["gate"] == ADMISSION_GATE:
+            refusal = gate_decisions[0]
+            return {
+                "reason": "admission_denied",
+                "message": f"Room {room_id} was refused admission ({refusal['reason']})",
+                "details": {
+                    "room_id": room_id,
+                    "admission_reason": refusal["reason"],
+                    "scope": refusal["details"]["scope"],
+                    "retry_after_s": refusal["details"]["retry_after_s"]
+                }
+            }
+        return {
+            "reason": "gate_chain_failed",
+            "message": f"Gate chain evaluation failed for room {room_id}",
+            "details": {"room_id": room_id, "gate_decisions": gate_decisions}
+        }
+    
+    async def _evaluate_admitted_room(
+        self,
+        room_id: str,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        dry_run: bool
+    ) -> RoomOutcome:
+        """Evaluate a room's gate chain and, if it passes, run the room."""
+        # Evaluate gate chain
+        gate_decisions, gates_passed = evaluate_gate_chain(
+            self.gate_profile["chain"],
+            room_id,
+            session_state_ref,
+            payloads.get(room_id) if payloads else None,
+            self.gates
+        )
+        
+        # Convert gate decisions to dict format
+        gate_decisions_dict = [gd.to_dict() if hasattr(gd, 'to_dict') else gd for gd in gate_decisions]
+        
+        if not gates_passed:
+            decline_output = {
+                "error": "Gate chain evaluation failed",
+                "gate_decisions": gate_decisions_dict
+            }
+            return RoomOutcome(room_id, decline_output, "decline", gate_decisions_dict, False, False)
+        
+        # If dry run, skip actual room execution
+        if dry_run:
+            mock_output = {"dry_run": True, "room_id": room_id}
+            return RoomOutcome(room_id, mock_output, "ok", gate_decisions_dict, True, False)
+        
+        # For now, always use mock output to avoid room execution issues
+        # This will be replaced with proper room integration later
+        mock_output = {"dry_run": True, "room_id": room_id}
+        room_output = mock_output
+        
+        # Run the room (commented out for now)
+        # try:
+        #     room_output = await self._run_room(room_id, session_state_ref, payloads)
+        
+        # Determine status based on room output
+        status = "ok"
+        if self._is_room_decline(room_output):
+            status = "decline"
+        
+        return RoomOutcome(room_id, room_output, status, gate_decisions_dict, True, True)
+    
+    def _restore_checkpoint(
+        self,
+        resume_from: Optional[str],
+        session_state_ref: str,
+        rooms_to_run: List[str],
+        dry_run: bool
+    ) -> List[RoomOutcome]:
+        """Reset this run's checkpoint, or seed it from a verified prefix when resuming."""
+        if self.checkpoint_store is None:
+            if resume_from is not None:
+                raise ValueError("resume_from requires an orchestrator with a checkpoint_store")
+            return []
+        
+        if resume_from is None:
+            self.checkpoint_store.reset(session_state_ref)
+            return []
+        
+        # Raises CheckpointVerificationError rather than resuming from a broken chain
+        steps = verify_step_prefix(self.checkpoint_store.load(resume_from), rooms_to_run)
+        # Rewrite the verified prefix so new steps never follow a torn write
+        self.checkpoint_store.reset(session_state_ref)
+        for step in steps:
+            self.checkpoint_store.append(session_state_ref, step)
+        return [RoomOutcome.from_step(step, dry_run) for step in steps]
+    
+    def _prefetch_next_context(
+        self,
+        rooms_to_run: List[str],
+        room_id: str,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        prefetches: Dict[str, "asyncio.Task[Any]"]
+    ):
+        """Start computing the next room's memory context in the background while this room runs."""
+        if self.memory_room is None:
+            return
+        
+        position = rooms_to_run.index(room_id) + 1
+        if position >= len(rooms_to_run):
+            return
+        
+        next_room = rooms_to_run[position]
+        if next_room in prefetches:
+            return
+        next_payload = payloads.get(next_room) if payloads else None
+        protocol_id = next_payload.get("protocol_id") if isinstance(next_payload, dict) else None
+        prefetches[next_room] = asyncio.ensure_future(
+            self.memory_room.prefetch_memory_for_room(next_room, session_state_ref, protocol_id)
+        )
     
     def _determine_rooms_to_run(self, rooms_subset: List[str], mini_walk: bool) -> List[str]:
         """Determine which rooms to run based on options."""
@@ -273,30 +551,7 @@ class HallwayOrchestrator:
     
     def _build_hallway_output(self, steps: List[Dict[str, Any]], final_state_ref: str, exit_summary: Dict[str, Any]) -> Dict[str, Any]:
         """Build the final hallway output that validates against the v0.2 contract."""
-        # Ensure session_state_ref is valid (non-empty)
-        valid_session_ref = final_state_ref if final_state_ref and final_state_ref.strip() else "invalid-session-ref"
-        
-        return {
-            "room_id": "hallway",
-            "title": "Hallway",
-            "version": "0.2.0",
-            "purpose": "Deterministic multi-room session orchestrator",
-            "stone_alignment": self.contract.get("stone_alignment", []),
-            "sequence": self.sequence,
-            "mini_walk_supported": self.contract.get("mini_walk_supported", False),
-            "gate_profile": self.gate_profile,
-            "inputs": {
-                "session_state_ref": valid_session_ref,
-                "payloads": {},
-                "options": {}
-            },
-            "outputs": {
-                "contract_version": "0.2.0",
-                "steps": steps,
-                "final_state_ref": valid_session_ref,
-                "exit_summary": exit_summary
-            }
-        }
+        return self.envelope.build(steps, final_state_ref, exit_summary)
 
 
 # Convenience function for external use
@@ -319,12 +574,39 @@ async def run_hallway(
         Dict that validates against the Hallway v0.2 contract
     """
     if contract is None:
-        # Load default contract
-        import json
-        import os
-        contract_path = os.path.join(os.path.dirname(__file__), "config", "hallway.contract.json")
-        with open(contract_path, 'r') as f:
-            contract = json.load(f)
-    
-    orchestrator = HallwayOrchestrator(contract)
+        orchestrator = _get_default_orchestrator()
+    else:
+        orchestrator = HallwayOrchestrator(contract)
     return await orchestrator.run(session_state_ref, payloads, options)
+
+
+async def run_hallway_to_bytes(
+    session_state_ref: str,
+    payloads: Optional[Dict[str, Any]] = None,
+    options: Optional[Dict[str, Any]] = None,
+    contract: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Convenience function returning the hallway output as JSON bytes.
+    See ``HallwayOrchestrator.run_to_bytes``.
+    """
+    if contract is None:
+        orchestrator = _get_default_orchestrator()
+    else:
+        orchestrator = HallwayOrchestrator(contract)
+    return await orchestrator.run_to_bytes(session_state_ref, payloads, options)
+
+
+DEFAULT_CONTRACT_PATH = os.path.join(os.path.dirname(__file__), "config", "hallway.contract.json")
+
+_default_orchestrator: Optional[HallwayOrchestrator] = None
+
+
+def _get_default_orchestrator() -> HallwayOrchestrator:
+    """Get the orchestrator for the default contract, loading it and its envelope template once"""
+    global _default_orchestrator
+    if _default_orchestrator is None:
+        with open(DEFAULT_CONTRACT_PATH, 'r') as f:
+            contract = json_codec.load(f)
+        _default_orchestrator = HallwayOrchestrator(contract)
+    return _default_orchestrator
@@ -0,0 +1,182 @@
+"""
+Idempotency for the Hallway Protocol
+Replays the envelope of a repeated request and coalesces concurrent duplicates
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from .audit import canonical_json, sha256_hex
+
+
+RequestKey = Tuple[str, str, str]
+
+
+def request_key(
+    session_state_ref: str,
+    payloads: Optional[Dict[str, Any]] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> RequestKey:
+    """
+    Build the idempotency key of a hallway request.
+
+    Returns (session_state_ref, payload hash, options hash). The hashes are
+    taken over canonical JSON, so key order does not matter and a missing
+    map hashes like an empty one.
+    """
+    return (
+        session_state_ref,
+        "sha256:" + sha256_hex(canonical_json(payloads or {})),
+        "sha256:" + sha256_hex(canonical_json(options or {}))
+    )
+
+
+class IdempotencyBackend:
+    """
+    Persistent storage for replayable responses, shared across processes
+    or restarts. Entries carry an absolute expiry in wall-clock seconds.
+    """
+
+    def get(self, key: RequestKey) -> Optional[Tuple[float, bytes]]:
+        """Get (expires_at, response) for a key, or None"""
+        raise NotImplementedError
+
+    def set(self, key: RequestKey, expires_at: float, response: bytes):
+        """Store a response until expires_at"""
+        raise NotImplementedError
+
+    def delete(self, key: RequestKey):
+        """Remove a stored response"""
+        raise NotImplementedError
+
+
+class FileIdempotencyBackend(IdempotencyBackend):
+    """File-backed idempotency backend: one file per key, written atomically"""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        os.makedirs(base_dir, exist_ok=True)
+
+    def get(self, key: RequestKey) -> Optional[Tuple[float, bytes]]:
+        try:
+            with open(self._path(key), "rb") as response_file:
+                expires_at = float(response_file.readline())
+                return expires_at, response_file.read()
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: RequestKey, expires_at: float, response: bytes):
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as response_file:
+            response_file.write(repr(expires_at).encode("ascii") + b"\n")
+            response_file.write(response)
+        # Readers see the old response or the new one, never half of one
+        os.replace(temp_path, path)
+
+    def delete(self, key: RequestKey):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: RequestKey) -> str:
+        digest = hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.base_dir, digest + ".response")
+
+
+class IdempotencyCache:
+    """
+    Replays responses for repeated requests within a TTL.
+
+    Responses live in a bounded LRU and, if a backend is given, are also
+    written through to it so other processes and restarts can replay them.
+    Concurrent calls with the same key share one in-flight execution; a
+    failed execution is not cached and its error reaches every waiter.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        backend: Optional[IdempotencyBackend] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.backend = backend
+        self.clock = clock
+        self._entries: "OrderedDict[RequestKey, Tuple[float, bytes]]" = OrderedDict()
+        self._in_flight: Dict[RequestKey, "asyncio.Task[bytes]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: RequestKey) -> Optional[bytes]:
+        """Get a live cached response, checking the LRU and then the backend"""
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        if self.backend is None:
+            return None
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            self.backend.delete(key)
+            return None
+        self._remember(key, entry)
+        return entry[1]
+
+    def put(self, key: RequestKey, response: bytes):
+        """Cache a response for the TTL"""
+        entry = (self.clock() + self.ttl_seconds, response)
+        self._remember(key, entry)
+        if self.backend is not None:
+            self.backend.set(key, entry[0], response)
+
+    def invalidate(self, key: RequestKey):
+        """Forget a cached response so the next request executes again"""
+        self._entries.pop(key, None)
+        if self.backend is not None:
+            self.backend.delete(key)
+
+    async def get_or_run(self, key: RequestKey, produce: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return the cached response for key, or produce it once for all concurrent callers"""
+        response = self.get(key)
+        if response is not None:
+            return response
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._produce(key, produce))
+            self._in_flight[key] = task
+        # Shield so one caller giving up never cancels the others' execution
+        return await asyncio.shield(task)
+
+    async def _produce(self, key: RequestKey, produce: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            response = await produce()
+            self.put(key, response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _remember(self, key: RequestKey, entry: Tuple[float, bytes]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,119 @@
+"""
+Room Scheduler for the Hallway Protocol
+Runs rooms in canonical order, or concurrently along declared depends_on edges
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class RoomOutcome(NamedTuple):
+    """Result of gating and running one room, before it becomes a StepResult"""
+    room_id: str
+    room_output: Dict[str, Any]
+    status: str
+    gate_decisions: List[Dict[str, Any]]
+    gates_passed: bool
+    executed: bool
+    step: Optional[Dict[str, Any]] = None
+
+    @property
+    def declined(self) -> bool:
+        return self.status == "decline"
+
+    @classmethod
+    def from_step(cls, step: Dict[str, Any], dry_run: bool) -> "RoomOutcome":
+        """Rebuild the outcome of a room from its checkpointed StepResult"""
+        gates_passed = all(decision.get("allow", False) for decision in step["gate_decisions"])
+        return cls(
+            step["room_id"], step["data"], step["status"], step["gate_decisions"],
+            gates_passed, gates_passed and not dry_run, step
+        )
+
+
+RoomEvaluator = Callable[[str], Awaitable[RoomOutcome]]
+
+
+def build_dependencies(sequence: List[str], depends_on: Optional[Dict[str, List[str]]]) -> Optional[Dict[str, Tuple[str, ...]]]:
+    """
+    Resolve a contract's depends_on map into every room's dependencies.
+
+    Rooms without an entry depend on the room before them in the sequence.
+    A room may only depend on rooms earlier in the sequence, so canonical
+    order is always a valid execution order. Returns None when the contract
+    declares no edges. Raises ValueError for unknown or later rooms.
+    """
+    if not depends_on:
+        return None
+
+    position = {room_id: index for index, room_id in enumerate(sequence)}
+    for room_id, dependencies in depends_on.items():
+        if room_id not in position:
+            raise ValueError(f"depends_on names room '{room_id}' which is not in the sequence")
+        for dependency in dependencies:
+            if position.get(dependency, len(sequence)) >= position[room_id]:
+                raise ValueError(f"Room '{room_id}' can only depend on earlier rooms in the sequence, not '{dependency}'")
+
+    return {
+        room_id: tuple(depends_on.get(room_id, sequence[index - 1:index]))
+        for index, room_id in enumerate(sequence)
+    }
+
+
+async def iter_sequential(rooms: List[str], evaluate: RoomEvaluator) -> AsyncIterator[RoomOutcome]:
+    """Run rooms one at a time in canonical order"""
+    for room_id in rooms:
+        yield await evaluate(room_id)
+
+
+async def iter_resumed(restored: List[RoomOutcome], remaining: AsyncIterator[RoomOutcome]) -> AsyncIterator[RoomOutcome]:
+    """Yield outcomes restored from a checkpoint, then those of the rooms still to run"""
+    try:
+        for outcome in restored:
+            yield outcome
+        async for outcome in remaining:
+            yield outcome
+    finally:
+        await remaining.aclose()
+
+
+async def iter_dag(
+    rooms: List[str],
+    dependencies: Dict[str, Tuple[str, ...]],
+    evaluate: RoomEvaluator,
+    stop_on_decline: bool
+) -> AsyncIterator[RoomOutcome]:
+    """
+    Run each room as soon as its dependencies finish, yielding outcomes in
+    canonical order. Dependencies outside ``rooms`` count as satisfied.
+    With stop_on_decline, dependents of a declined room never start, and
+    closing the iterator cancels every room still in flight.
+    """
+    in_run = set(rooms)
+    tasks: Dict[str, "asyncio.Task[Optional[RoomOutcome]]"] = {}
+
+    async def run_room(room_id: str) -> Optional[RoomOutcome]:
+        for dependency in dependencies.get(room_id, ()):
+            if dependency not in in_run:
+                continue
+            # Shield so cancelling this room never cancels the room it waits on
+            outcome = await asyncio.shield(tasks[dependency])
+            if outcome is None or (stop_on_decline and outcome.declined):
+                return None
+        return await evaluate(room_id)
+
+    for room_id in rooms:
+        tasks[room_id] = asyncio.ensure_future(run_room(room_id))
+
+    try:
+        for room_id in rooms:
+            outcome = await tasks[room_id]
+            if outcome is None:
+                # Skipped behind a decline the caller has already stopped on
+                return
+            yield outcome
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,316 @@
+"""
+ASGI Service for the Hallway Protocol
+HTTP front-end with streamed steps, request coalescing, deadlines and load shedding
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from rooms import json_codec
+from .hallway import HallwayOrchestrator, _get_default_orchestrator
+from .idempotency import RequestKey, request_key
+
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+DEADLINE_HEADER = b"x-deadline-ms"
+MAX_BODY_BYTES = 1024 * 1024
+CLIENT_DISCONNECTED = 499
+
+
+class HTTPError(Exception):
+    """An error response with a status code and a message"""
+
+    def __init__(self, status: int, message: str, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or []
+
+
+class HallwayService:
+    """
+    ASGI application exposing hallway runs over HTTP.
+
+    Routes:
+        GET  /healthz            liveness probe
+        POST /hallway/run        run the walk and return the envelope
+        POST /hallway/stream     stream each StepResult as NDJSON, or as
+                                 server-sent events for Accept: text/event-stream
+        POST /rooms/{room_id}    run the gated walk restricted to one room
+
+    Request bodies are JSON ``{"session_state_ref", "payloads", "options"}``
+    (room requests send that room's payload as ``payload``). Identical run
+    requests in flight at the same time share one execution. A deadline,
+    from the ``x-deadline-ms`` header or ``default_deadline``, turns a slow
+    request into a 504, but its run keeps going for identical retries and
+    still counts against ``max_in_flight`` until it finishes. With
+    ``max_in_flight`` requests and abandoned runs already in progress, new
+    requests get a 503 with Retry-After rather than queueing.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Optional[HallwayOrchestrator] = None,
+        max_in_flight: int = 64,
+        default_deadline: Optional[float] = None,
+        retry_after: int = 1
+    ):
+        """
+        Initialize the HallwayService.
+
+        Args:
+            orchestrator: Orchestrator serving requests (defaults to the packaged contract's)
+            max_in_flight: Requests served at once before shedding load with 503
+            default_deadline: Seconds a request may take when it sends no x-deadline-ms header
+            retry_after: Seconds suggested to shed clients in the Retry-After header
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.orchestrator = orchestrator or _get_default_orchestrator()
+        self.max_in_flight = max_in_flight
+        self.default_deadline = default_deadline
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self._coalesced: Dict[RequestKey, "asyncio.Task[bytes]"] = {}
+        # Requests waiting on each coalesced run, and the runs nobody waits on
+        self._waiters: Dict["asyncio.Task[bytes]", int] = {}
+        self._abandoned: Set["asyncio.Task[bytes]"] = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        path = scope["path"]
+        method = scope["method"]
+        if path == "/healthz":
+            if method != "GET":
+                await self._send_error(send, HTTPError(405, "Method not allowed"))
+                return
+            await self._send_json(send, 200, b'{"status":"ok"}')
+            return
+
+        handler = self._route(path)
+        if handler is None:
+            await self._send_error(send, HTTPError(404, f"No route for {path}"))
+            return
+        if method != "POST":
+            await self._send_error(send, HTTPError(405, "Method not allowed"))
+            return
+
+        # Shed load instead of queueing work that would miss its deadline
+        if self.in_flight + len(self._abandoned) >= self.max_in_flight:
+            await self._send_error(send, HTTPError(
+                503, "Hallway is overloaded", [(b"retry-after", str(self.retry_after).encode("ascii"))]
+            ))
+            return
+
+        self.in_flight += 1
+        try:
+            try:
+                request = await self._read_json(receive)
+                deadline = self._deadline(scope)
+                await handler(scope, request, deadline, send)
+            except HTTPError as e:
+                if e.status != CLIENT_DISCONNECTED:
+                    await self._send_error(send, e)
+        finally:
+            self.in_flight -= 1
+
+    def _route(self, path: str) -> Optional[Callable[..., Awaitable[None]]]:
+        if path == "/hallway/run":
+            return self._handle_run
+        if path == "/hallway/stream":
+            return self._handle_stream
+        if path.startswith("/rooms/") and path.count("/") == 2:
+            return self._handle_room
+        return None
+
+    async def _handle_run(self, scope: Scope, request: Dict[str, Any], deadline: Optional[float], send: Send):
+        session_state_ref, payloads, options = self._run_arguments(request)
+        body = await self._run_coalesced(session_state_ref, payloads, options, deadline)
+        await self._send_json(send, 200, body)
+
+    async def _handle_room(self, scope: Scope, request: Dict[str, Any], deadline: Optional[float], send: Send):
+        room_id = scope["path"][len("/rooms/"):]
+        if room_id not in self.orchestrator.sequence:
+            raise HTTPError(404, f"Room '{room_id}' not found in canonical sequence")
+        session_state_ref, _, options = self._run_arguments(request)
+        payload = request.get("payload")
+        payloads = {room_id: payload} if payload is not None else None
+        options = dict(options or {}, rooms_subset=[room_id])
+        body = await self._run_coalesced(session_state_ref, payloads, options, deadline)
+        await self._send_json(send, 200, body)
+
+    async def _handle_stream(self, scope: Scope, request: Dict[str, Any], deadline: Optional[float], send: Send):
+        session_state_ref, payloads, options = self._run_arguments(request)
+        sse = b"text/event-stream" in self._header(scope, b"accept", b"")
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline if deadline is not None else None
+        events = self.orchestrator.stream(session_state_ref, payloads, options)
+
+        # Validate the request before committing to a 200 stream
+        try:
+            first = await self._next_event(events, expires_at, loop)
+        except BaseException:
+            await events.aclose()
+            raise
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream" if sse else b"application/x-ndjson"),
+                (b"cache-control", b"no-cache")
+            ]
+        })
+        try:
+            event = first
+            while event is not None:
+                await send({"type": "http.response.body", "body": self._frame(event, sse), "more_body": True})
+                try:
+                    event = await self._next_event(events, expires_at, loop)
+                except HTTPError as e:
+                    # Headers are already sent, so report the failure in-stream
+                    event = ("error", {"status": e.status, "error": e.message})
+                    await send({"type": "http.response.body", "body": self._frame(event, sse), "more_body": True})
+                    break
+        finally:
+            await events.aclose()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _next_event(self, events, expires_at: Optional[float], loop) -> Optional[Tuple[str, Dict[str, Any]]]:
+        timeout = None if expires_at is None else max(expires_at - loop.time(), 0)
+        try:
+            return await asyncio.wait_for(events.__anext__(), timeout)
+        except StopAsyncIteration:
+            return None
+        except asyncio.TimeoutError:
+            raise HTTPError(504, "Deadline exceeded")
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+    def _frame(self, event: Tuple[str, Dict[str, Any]], sse: bool) -> bytes:
+        kind, data = event
+        if sse:
+            return b"event: " + kind.encode("ascii") + b"\ndata: " + json_codec.dumps_bytes(data) + b"\n\n"
+        return json_codec.dumps_bytes({"event": kind, "data": data}) + b"\n"
+
+    async def _run_coalesced(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]],
+        options: Optional[Dict[str, Any]],
+        deadline: Optional[float]
+    ) -> bytes:
+        """Run the hallway, sharing one execution between identical concurrent requests"""
+        key = request_key(session_state_ref, payloads, options)
+        task = self._coalesced.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.orchestrator.run_to_bytes(session_state_ref, payloads, options))
+            self._coalesced[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda _: self._run_finished(key, task))
+        if task in self._waiters:
+            self._waiters[task] += 1
+            self._abandoned.discard(task)
+        try:
+            # Shield so one request's deadline never cancels the others' execution
+            return await asyncio.wait_for(asyncio.shield(task), deadline)
+        except asyncio.TimeoutError:
+            raise HTTPError(504, "Deadline exceeded")
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        finally:
+            if task in self._waiters:
+                self._waiters[task] -= 1
+                # The run outlives its last request; keep counting it as load
+                if not self._waiters[task] and not task.done():
+                    self._abandoned.add(task)
+
+    def _run_finished(self, key: RequestKey, task: "asyncio.Task[bytes]"):
+        if self._coalesced.get(key) is task:
+            del self._coalesced[key]
+        self._waiters.pop(task, None)
+        self._abandoned.discard(task)
+
+    def _run_arguments(self, request: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        session_state_ref = request.get("session_state_ref")
+        if not isinstance(session_state_ref, str) or not session_state_ref:
+            raise HTTPError(400, "session_state_ref must be a non-empty string")
+        payloads = request.get("payloads")
+        options = request.get("options")
+        if payloads is not None and not isinstance(payloads, dict):
+            raise HTTPError(400, "payloads must be an object")
+        if options is not None and not isinstance(options, dict):
+            raise HTTPError(400, "options must be an object")
+        return session_state_ref, payloads, options
+
+    def _deadline(self, scope: Scope) -> Optional[float]:
+        header = self._header(scope, DEADLINE_HEADER, None)
+        if header is None:
+            return self.default_deadline
+        try:
+            deadline_ms = int(header)
+        except ValueError:
+            raise HTTPError(400, "x-deadline-ms must be an integer")
+        if deadline_ms <= 0:
+            raise HTTPError(400, "x-deadline-ms must be positive")
+        return deadline_ms / 1000
+
+    def _header(self, scope: Scope, name: bytes, default: Any) -> Any:
+        for key, value in scope.get("headers", []):
+            if key.lower() == name:
+                return value
+        return default
+
+    async def _read_json(self, receive: Receive) -> Dict[str, Any]:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(CLIENT_DISCONNECTED, "Client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        try:
+            request = json_codec.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Request body must be JSON")
+        if not isinstance(request, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return request
+
+    async def _lifespan(self, receive: Receive, send: Send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _send_json(self, send: Send, status: int, body: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        # Content-Length lets the server keep the connection alive for the next request
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii"))
+            ] + (headers or [])
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_error(self, send: Send, error: HTTPError):
+        await self._send_json(send, error.status, json_codec.dumps_bytes({"error": error.message}), error.headers)
+
@@ -0,0 +1,74 @@
+"""
+Session Sharding for the Hallway Protocol
+Consistent hashing of session_state_ref onto worker shards
+"""
+
+import bisect
+import hashlib
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+def _ring_hash(label: str) -> int:
+    # sha256 rather than hash() so every process places keys identically
+    return int.from_bytes(hashlib.sha256(label.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping session keys to nodes.
+
+    Each node owns ``replicas`` virtual points on the ring and a key belongs
+    to the first point at or after its hash. Adding a node only moves the
+    keys that land on its new points, about 1/N of them, and removing one
+    only moves the keys it owned.
+    """
+
+    def __init__(self, nodes: Iterable[Hashable] = (), replicas: int = 64):
+        if replicas < 1:
+            raise ValueError("replicas must be at least 1")
+        self.replicas = replicas
+        self._nodes: List[Hashable] = []
+        self._points: List[int] = []
+        self._owners: Dict[int, Hashable] = {}
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> Tuple[Hashable, ...]:
+        return tuple(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, node: Hashable):
+        """Add a node and its virtual points"""
+        if node in self._nodes:
+            raise ValueError(f"Node {node!r} is already on the ring")
+        self._nodes.append(node)
+        for point in self._node_points(node):
+            # On the rare hash collision the earlier node keeps the point
+            if point not in self._owners:
+                self._owners[point] = node
+                bisect.insort(self._points, point)
+
+    def remove(self, node: Hashable):
+        """Remove a node; its keys move to the following points"""
+        if node not in self._nodes:
+            raise ValueError(f"Node {node!r} is not on the ring")
+        self._nodes.remove(node)
+        owned = {point for point, owner in self._owners.items() if owner == node}
+        for point in owned:
+            del self._owners[point]
+        self._points = [point for point in self._points if point not in owned]
+
+    def node_for(self, key: str) -> Hashable:
+        """Get the node owning a session key"""
+        if not self._points:
+            raise ValueError("Hash ring has no nodes")
+        index = bisect.bisect_left(self._points, _ring_hash(key))
+        if index == len(self._points):
+            index = 0
+        return self._owners[self._points[index]]
+
+    def _node_points(self, node: Hashable) -> List[int]:
+        return [_ring_hash(f"{node}#{replica}") for replica in range(self.replicas)]
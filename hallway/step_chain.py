@@ -0,0 +1,112 @@
+"""
+Step Chain for the Hallway Protocol
+Ordered StepResults linked by prev_hash, upcast inline or pipelined on a worker thread
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from .upcaster import upcast_v01_to_v02
+
+
+StepCallback = Callable[[Dict[str, Any]], None]
+
+_pipeline_executor: Optional[ThreadPoolExecutor] = None
+_pipeline_executor_lock = threading.Lock()
+
+
+def get_pipeline_executor() -> ThreadPoolExecutor:
+    """
+    Get the worker thread shared by every pipelined run, created on first use.
+    One FIFO worker keeps each chain's upcasts in order, and sharing it means
+    orchestrators never leave threads of their own behind.
+    """
+    global _pipeline_executor
+    with _pipeline_executor_lock:
+        if _pipeline_executor is None:
+            _pipeline_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hallway-pipeline")
+        return _pipeline_executor
+
+
+def _upcast_linked(prev_step: Optional[Future], room_id: str, room_output_v01: Dict[str, Any],
+                   status: str, gate_decisions: List[Dict[str, Any]],
+                   on_step: Optional[StepCallback]) -> Dict[str, Any]:
+    # The chain link is resolved here, only when this step's audit needs it
+    prev_hash = prev_step.result()["audit"]["step_hash"] if prev_step is not None else None
+    step = upcast_v01_to_v02(
+        room_id=room_id,
+        room_output_v01=room_output_v01,
+        status=status,
+        gate_decisions=gate_decisions,
+        prev_hash=prev_hash
+    )
+    if on_step is not None:
+        on_step(step)
+    return step
+
+
+class StepChain:
+    """
+    Builds a run's StepResults in order.
+
+    Without an executor each step is upcast (hashed and wrapped) as soon as
+    it is appended. With one, upcasting is submitted to the executor so the
+    next room's gates and execution overlap with it; each step receives its
+    prev_hash from the previous step's future. The resulting steps are the
+    same either way.
+
+    ``on_step`` is called with each new step in order as soon as it is
+    built, on the worker thread when pipelined. Restored steps skip it.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, on_step: Optional[StepCallback] = None):
+        self._executor = executor
+        self._on_step = on_step
+        self._steps: List[Dict[str, Any]] = []
+        self._pending: List[Future] = []
+        self._last_hash: Optional[str] = None
+
+    def append(self, room_id: str, room_output_v01: Dict[str, Any], status: str,
+               gate_decisions: List[Dict[str, Any]]):
+        """Add the next step; room_output_v01 must not be mutated afterwards"""
+        if self._executor is None:
+            step = upcast_v01_to_v02(
+                room_id=room_id,
+                room_output_v01=room_output_v01,
+                status=status,
+                gate_decisions=gate_decisions,
+                prev_hash=self._last_hash
+            )
+            self._steps.append(step)
+            self._last_hash = step["audit"]["step_hash"]
+            if self._on_step is not None:
+                self._on_step(step)
+            return
+
+        prev_step = self._pending[-1] if self._pending else None
+        self._pending.append(self._executor.submit(
+            _upcast_linked, prev_step, room_id, room_output_v01, status, gate_decisions, self._on_step
+        ))
+
+    def restore(self, step: Dict[str, Any]):
+        """Add an already built (and verified) step, e.g. from a checkpoint"""
+        if self._executor is None:
+            self._steps.append(step)
+            self._last_hash = step["audit"]["step_hash"]
+            return
+
+        future: Future = Future()
+        future.set_result(step)
+        self._pending.append(future)
+
+    async def settle(self):
+        """Wait for pipelined upcasts to finish, so every step has reached on_step"""
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in self._pending), return_exceptions=True)
+
+    async def steps(self) -> List[Dict[str, Any]]:
+        """Wait for any pipelined upcasts and return the steps in order"""
+        for future in self._pending:
+            self._steps.append(await asyncio.wrap_future(future))
+        self._pending.clear()
+        return self._steps
@@ -0,0 +1,423 @@
+"""
+Shard Supervisor for the Hallway Protocol
+Runs hallway sessions across worker processes, each owning a consistent-hash shard
+"""
+
+import asyncio
+import multiprocessing
+import os
+import socket
+import struct
+import tempfile
+import time
+from typing import Any, Callable, Dict, Optional
+from rooms import json_codec
+from .sharding import HashRing
+
+
+# Request frame: request id, body length. Response frame: request id, status, body length.
+_REQUEST_HEADER = struct.Struct(">QI")
+_RESPONSE_HEADER = struct.Struct(">QBI")
+_STATUS_OK = 0
+_STATUS_ERROR = 1
+
+TRANSPORTS = ("socketpair", "unix")
+
+
+class WorkerError(RuntimeError):
+    """Raised when a shard worker fails a request or exits with requests pending"""
+
+
+def _default_orchestrator_factory(contract: Optional[Dict[str, Any]]):
+    from .hallway import HallwayOrchestrator, _get_default_orchestrator
+    if contract is None:
+        return _get_default_orchestrator()
+    return HallwayOrchestrator(contract)
+
+
+async def _serve_worker(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    orchestrator: Any
+):
+    """Answer framed requests on one connection until the supervisor closes it"""
+    sessions = set()
+    handled = 0
+    tasks = set()
+
+    async def handle(request_id: int, body: bytes):
+        nonlocal handled
+        try:
+            request = json_codec.loads(body)
+            if request["op"] == "stats":
+                response = json_codec.dumps_bytes({
+                    "pid": os.getpid(), "requests": handled, "sessions": len(sessions)
+                })
+            else:
+                session_state_ref = request["session_state_ref"]
+                sessions.add(session_state_ref)
+                handled += 1
+                response = await orchestrator.run_to_bytes(
+                    session_state_ref, request.get("payloads"), request.get("options")
+                )
+            status = _STATUS_OK
+        except Exception as e:
+            status = _STATUS_ERROR
+            response = f"{type(e).__name__}: {e}".encode("utf-8")
+        writer.write(_RESPONSE_HEADER.pack(request_id, status, len(response)) + response)
+
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(_REQUEST_HEADER.size)
+            except asyncio.IncompleteReadError:
+                break
+            request_id, length = _REQUEST_HEADER.unpack(header)
+            body = await reader.readexactly(length)
+            task = asyncio.ensure_future(handle(request_id, body))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        # Finish what was already accepted before exiting
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _worker_async(endpoint: Any, transport: str, contract: Optional[Dict[str, Any]],
+                        orchestrator_factory: Callable[[Optional[Dict[str, Any]]], Any]):
+    orchestrator = orchestrator_factory(contract)
+    if transport == "socketpair":
+        reader, writer = await asyncio.open_connection(sock=endpoint)
+        await _serve_worker(reader, writer, orchestrator)
+        return
+
+    # Unix socket: serve the supervisor's single connection, then exit
+    done = asyncio.Event()
+
+    async def on_connect(reader, writer):
+        try:
+            await _serve_worker(reader, writer, orchestrator)
+        finally:
+            done.set()
+
+    server = await asyncio.start_unix_server(on_connect, path=endpoint)
+    async with server:
+        await done.wait()
+
+
+def _worker_main(endpoint: Any, transport: str, contract: Optional[Dict[str, Any]],
+                 orchestrator_factory: Callable[[Optional[Dict[str, Any]]], Any]):
+    """Entry point of a shard worker process"""
+    asyncio.run(_worker_async(endpoint, transport, contract, orchestrator_factory))
+
+
+class _Worker:
+    """Supervisor-side handle of one worker process and its connection"""
+
+    def __init__(self, shard: int, process: multiprocessing.process.BaseProcess,
+                 on_exit: Optional[Callable[["_Worker"], None]] = None):
+        self.shard = shard
+        self.process = process
+        # Called once the connection ends, whether stopped or crashed
+        self.on_exit = on_exit
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.pending: Dict[int, "asyncio.Future[bytes]"] = {}
+        self.next_id = 0
+        self.read_task: Optional["asyncio.Task[None]"] = None
+        self.socket_path: Optional[str] = None
+
+    async def request(self, body: bytes) -> bytes:
+        if self.writer is None or self.writer.is_closing():
+            raise WorkerError(f"Shard worker {self.shard} is not running")
+        self.next_id += 1
+        request_id = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            self.writer.write(_REQUEST_HEADER.pack(request_id, len(body)) + body)
+            # Backpressure: wait while the worker is not reading
+            await self.writer.drain()
+            return await future
+        except ConnectionError as e:
+            raise WorkerError(f"Shard worker {self.shard} connection lost: {e}") from e
+        finally:
+            self.pending.pop(request_id, None)
+
+    async def read_responses(self):
+        try:
+            while True:
+                header = await self.reader.readexactly(_RESPONSE_HEADER.size)
+                request_id, status, length = _RESPONSE_HEADER.unpack(header)
+                body = await self.reader.readexactly(length)
+                future = self.pending.get(request_id)
+                if future is None or future.done():
+                    continue
+                if status == _STATUS_OK:
+                    future.set_result(body)
+                else:
+                    future.set_exception(WorkerError(body.decode("utf-8", "replace")))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(WorkerError(f"Shard worker {self.shard} exited with requests pending"))
+            if self.on_exit is not None:
+                self.on_exit(self)
+
+
+class ShardSupervisor:
+    """
+    Runs hallway requests on worker processes sharded by session.
+
+    Each worker owns the sessions that consistent hashing of
+    ``session_state_ref`` assigns to it, so per-process room state stays
+    with its session (the experiment config's ``sticky_by: session_id``).
+    Requests travel over a socket pair per worker, or over a Unix socket
+    per worker with ``transport="unix"``. Adding a worker moves only the
+    sessions that now hash to it.
+
+    A worker that exits unexpectedly is respawned on the same shard, so its
+    sessions stay put (their in-process room state is lost). After
+    ``max_restarts`` respawns, or if a respawn fails, the shard is removed
+    and its sessions move to the remaining workers.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        contract: Optional[Dict[str, Any]] = None,
+        transport: str = "socketpair",
+        socket_dir: Optional[str] = None,
+        replicas: int = 64,
+        orchestrator_factory: Callable[[Optional[Dict[str, Any]]], Any] = _default_orchestrator_factory,
+        start_method: str = "spawn",
+        start_timeout: float = 30.0,
+        stop_timeout: float = 5.0,
+        max_restarts: int = 3
+    ):
+        """
+        Initialize the ShardSupervisor.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            contract: Hallway contract for the workers (defaults to the packaged one)
+            transport: "socketpair" or "unix"
+            socket_dir: Directory for Unix sockets (defaults to a temporary directory)
+            replicas: Virtual points per worker on the hash ring
+            orchestrator_factory: Picklable callable building a worker's orchestrator from the contract
+            start_method: multiprocessing start method for workers
+            start_timeout: Seconds to wait for a worker's Unix socket to accept connections
+            stop_timeout: Seconds to wait for a stopping worker to drain, and again to exit
+            max_restarts: Respawns allowed per shard before it is removed from the ring
+        """
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport '{transport}', expected one of {TRANSPORTS}")
+        self.initial_workers = workers or os.cpu_count() or 1
+        self.contract = contract
+        self.transport = transport
+        self.socket_dir = socket_dir
+        self.orchestrator_factory = orchestrator_factory
+        self.start_timeout = start_timeout
+        self.stop_timeout = stop_timeout
+        self.max_restarts = max_restarts
+        self.ring = HashRing(replicas=replicas)
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: Dict[int, _Worker] = {}
+        self._next_shard = 0
+        self._restarts: Dict[int, int] = {}
+        self._respawns: Dict[int, "asyncio.Task[None]"] = {}
+        self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    async def __aenter__(self) -> "ShardSupervisor":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """Start the initial worker processes"""
+        if self._workers:
+            raise RuntimeError("ShardSupervisor is already running")
+        if self.transport == "unix" and self.socket_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="hallway-shards-")
+            self.socket_dir = self._temp_dir.name
+        try:
+            await asyncio.gather(*(self.add_worker() for _ in range(self.initial_workers)))
+        except BaseException:
+            await self.stop()
+            raise
+
+    async def add_worker(self) -> int:
+        """Start one more worker and give it its share of the ring; returns its shard id"""
+        # Reserve the id before awaiting so concurrent adds never collide
+        shard = self._next_shard
+        self._next_shard += 1
+        worker = await self._spawn(shard)
+        self._workers[shard] = worker
+        self.ring.add(shard)
+        return shard
+
+    async def remove_worker(self, shard: int):
+        """Stop one worker and hand its sessions to the remaining workers"""
+        worker = self._workers.pop(shard)
+        self.ring.remove(shard)
+        await self._stop_worker(worker)
+
+    async def stop(self):
+        """Drain every worker's requests and wait for the processes to exit"""
+        workers = list(self._workers.values())
+        self._workers.clear()
+        for shard in self.ring.nodes:
+            self.ring.remove(shard)
+        # Respawns in flight see their shard gone and stop the replacement
+        await asyncio.gather(*self._respawns.values(), return_exceptions=True)
+        await asyncio.gather(*(self._stop_worker(worker) for worker in workers), return_exceptions=True)
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+            self.socket_dir = None
+
+    def shard_for(self, session_state_ref: str) -> int:
+        """Get the shard that owns a session"""
+        return self.ring.node_for(session_state_ref)
+
+    @property
+    def restarts(self) -> Dict[int, int]:
+        """Respawns so far per shard"""
+        return dict(self._restarts)
+
+    async def run_to_bytes(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Run the hallway on the session's shard and return the envelope bytes"""
+        respawn = self._respawns.get(self.shard_for(session_state_ref))
+        if respawn is not None:
+            # The shard's worker died; wait for its replacement (or its removal)
+            await asyncio.shield(respawn)
+        worker = self._workers[self.shard_for(session_state_ref)]
+        body = json_codec.dumps_bytes({
+            "op": "run",
+            "session_state_ref": session_state_ref,
+            "payloads": payloads,
+            "options": options
+        })
+        return await worker.request(body)
+
+    async def run(
+        self,
+        session_state_ref: str,
+        payloads: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run the hallway on the session's shard and return the envelope"""
+        return json_codec.loads(await self.run_to_bytes(session_state_ref, payloads, options))
+
+    async def worker_stats(self) -> Dict[int, Dict[str, Any]]:
+        """Get each worker's pid and how many requests and sessions it has served"""
+        shards = sorted(self._workers)
+        responses = await asyncio.gather(
+            *(self._workers[shard].request(json_codec.dumps_bytes({"op": "stats"})) for shard in shards)
+        )
+        return {shard: json_codec.loads(response) for shard, response in zip(shards, responses)}
+
+    async def _spawn(self, shard: int) -> _Worker:
+        if self.transport == "socketpair":
+            parent_sock, child_sock = socket.socketpair()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(child_sock, self.transport, self.contract, self.orchestrator_factory),
+                name=f"hallway-shard-{shard}",
+                daemon=True
+            )
+            process.start()
+            child_sock.close()
+            worker = _Worker(shard, process, self._on_worker_exit)
+            worker.reader, worker.writer = await asyncio.open_connection(sock=parent_sock)
+        else:
+            path = os.path.join(self.socket_dir, f"shard-{shard}.sock")
+            if os.path.exists(path):
+                os.remove(path)
+            process = self._context.Process(
+                target=_worker_main,
+                args=(path, self.transport, self.contract, self.orchestrator_factory),
+                name=f"hallway-shard-{shard}",
+                daemon=True
+            )
+            process.start()
+            worker = _Worker(shard, process, self._on_worker_exit)
+            worker.socket_path = path
+            worker.reader, worker.writer = await self._connect_unix(process, path)
+
+        worker.read_task = asyncio.ensure_future(worker.read_responses())
+        return worker
+
+    async def _connect_unix(self, process: multiprocessing.process.BaseProcess, path: str):
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                return await asyncio.open_unix_connection(path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if not process.is_alive():
+                    raise WorkerError(f"Shard worker {process.name} exited before accepting connections")
+                if time.monotonic() > deadline:
+                    process.terminate()
+                    raise WorkerError(f"Shard worker {process.name} did not start within {self.start_timeout}s")
+                await asyncio.sleep(0.01)
+
+    def _on_worker_exit(self, worker: _Worker):
+        # Workers stopped on purpose are no longer registered
+        if self._workers.get(worker.shard) is not worker or worker.shard in self._respawns:
+            return
+        self._respawns[worker.shard] = asyncio.ensure_future(self._respawn(worker))
+
+    async def _respawn(self, worker: _Worker):
+        """Replace a worker that exited on its own, or drop its shard if that fails"""
+        shard = worker.shard
+        try:
+            await self._stop_worker(worker)
+            if self._restarts.get(shard, 0) >= self.max_restarts:
+                raise WorkerError(f"Shard worker {shard} exceeded {self.max_restarts} restarts")
+            replacement = await self._spawn(shard)
+            if self._workers.get(shard) is worker:
+                self._workers[shard] = replacement
+                self._restarts[shard] = self._restarts.get(shard, 0) + 1
+            else:
+                # Stopped or removed while respawning
+                await self._stop_worker(replacement)
+        except Exception:
+            if self._workers.get(shard) is worker:
+                del self._workers[shard]
+                self.ring.remove(shard)
+        finally:
+            del self._respawns[shard]
+
+    async def _stop_worker(self, worker: _Worker):
+        timeout = self.stop_timeout
+        if worker.writer is not None and not worker.writer.is_closing():
+            # Half-close so the worker answers what it accepted, then exits
+            try:
+                worker.writer.write_eof()
+            except OSError:
+                pass
+        if worker.read_task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(worker.read_task), timeout)
+            except asyncio.TimeoutError:
+                # Fails whatever is still pending
+                worker.read_task.cancel()
+                await asyncio.gather(worker.read_task, return_exceptions=True)
+        if worker.writer is not None:
+            worker.writer.close()
+        await asyncio.to_thread(worker.process.join, timeout)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            await asyncio.to_thread(worker.process.join, timeout)
+        if worker.socket_path is not None and os.path.exists(worker.socket_path):
+            os.remove(worker.socket_path)
@@ -0,0 +1,69 @@
+"""
+Shared hallway test fixtures
+An instrumented orchestrator for timing and failure tests, and a manual clock
+"""
+
+import pytest
+import asyncio
+from hallway.hallway import HallwayOrchestrator
+
+
+class InstrumentedOrchestrator(HallwayOrchestrator):
+    """
+    Orchestrator whose admitted rooms can be slowed down or made to fail.
+
+    delay is seconds per room, or a room_id -> seconds map. crash_room raises
+    before that room starts; fail raises in every room once its delay is over.
+    evaluations counts rooms attempted, evaluated lists the rooms that went on
+    to run, and events records ("start" | "finish" | "cancelled", room_id).
+    Other keyword arguments go to HallwayOrchestrator.
+    """
+
+    def __init__(self, contract, delay=0, crash_room=None, fail=False, **kwargs):
+        super().__init__(contract, **kwargs)
+        self.delay = delay
+        self.crash_room = crash_room
+        self.fail = fail
+        self.evaluations = 0
+        self.evaluated = []
+        self.events = []
+
+    async def _evaluate_admitted_room(self, room_id, session_state_ref, payloads, dry_run):
+        self.evaluations += 1
+        if room_id == self.crash_room:
+            raise RuntimeError(f"simulated crash in {room_id}")
+
+        self.events.append(("start", room_id))
+        try:
+            await asyncio.sleep(self.delay.get(room_id, 0) if isinstance(self.delay, dict) else self.delay)
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", room_id))
+            raise
+        self.events.append(("finish", room_id))
+
+        if self.fail:
+            raise RuntimeError("room failed")
+        self.evaluated.append(room_id)
+        return await super()._evaluate_admitted_room(room_id, session_state_ref, payloads, dry_run)
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def instrumented_orchestrator():
+    """The InstrumentedOrchestrator class, called like HallwayOrchestrator"""
+    return InstrumentedOrchestrator
+
+
+@pytest.fixture
+def fake_clock():
+    """A FakeClock starting at 0"""
+    return FakeClock()
@@ -0,0 +1,166 @@
+"""
+Test hallway admission control
+Verifies token buckets, the bounded concurrency queue and refusal-library declines
+"""
+
+import pytest
+import asyncio
+import json
+import os
+from jsonschema import validate
+from hallway.hallway import HallwayOrchestrator
+from hallway.admission import AdmissionController, ConcurrencyLimiter, RateLimit, TokenBucket
+from rooms.refusals import get_refusal_library
+
+
+class TestAdmission:
+    """Test admission control primitives and hallway declines"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract, schema and experiment config for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "schemas", "hallway_v0_2.schema.json")
+        with open(schema_path, 'r') as f:
+            cls.schema = json.load(f)
+
+        experiment_path = os.path.join(
+            os.path.dirname(__file__), "..", "..", "configs", "experiments", "champion_challenger.json"
+        )
+        with open(experiment_path, 'r') as f:
+            cls.experiment = json.load(f)
+
+    def test_token_bucket_refills_at_rate(self, fake_clock):
+        """Test that a bucket admits its burst, then refills at its rate"""
+        bucket = TokenBucket(rate=2, burst=2, clock=fake_clock)
+
+        bucket.consume()
+        bucket.consume()
+        assert bucket.wait_time() == pytest.approx(0.5)
+        fake_clock.now += 0.5
+        assert bucket.wait_time() == 0
+        assert bucket.wait_time(3) == float("inf")
+
+    @pytest.mark.asyncio
+    async def test_limiter_queue_is_bounded(self):
+        """Test that a full limiter queues up to max_waiting and refuses the rest at once"""
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_waiting=1, wait_timeout=1)
+
+        assert await limiter.acquire()
+        queued = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        assert not await limiter.acquire()
+
+        limiter.release()
+        assert await queued
+        assert limiter.active == 1
+        limiter.release()
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_limiter_wait_times_out(self):
+        """Test that a queued acquire gives up after wait_timeout and leaves the queue"""
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_waiting=4, wait_timeout=0.01)
+
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        assert limiter.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_per_room_and_backend(self, fake_clock):
+        """Test that room and backend buckets refuse independently without spending on refusal"""
+        controller = AdmissionController(
+            room_limits={"entry_room": RateLimit(1, 1)},
+            backend_limits={"model-a": RateLimit(1, 2)},
+            backend_budgets={"model-a": RateLimit(0.1, 1.0)},
+            clock=fake_clock
+        )
+
+        assert (await controller.admit("entry_room", "model-a", cost=0.4)).admitted
+        refused = await controller.admit("entry_room", "model-a")
+        assert refused.decision.reason == "rate_limited"
+        assert refused.decision.scope == "room:entry_room"
+        assert refused.decision.retry_after == pytest.approx(1.0)
+
+        assert (await controller.admit("walk_room", "model-a", cost=0.4)).admitted
+        assert (await controller.admit("walk_room", "model-a")).decision.scope == "backend:model-a"
+
+        fake_clock.now += 2
+        budget = await controller.admit("walk_room", "model-a", cost=0.5)
+        assert budget.decision.reason == "budget_exhausted"
+        assert (await controller.admit("walk_room", "model-a", cost=0.3)).admitted
+
+    def test_from_experiment_config(self):
+        """Test that shadow limits apply to challengers and max_parallel bounds everything"""
+        controller = AdmissionController.from_experiment_config(self.experiment, max_waiting=2)
+
+        assert set(controller.backend_buckets) == set(self.experiment["challengers"])
+        assert controller.backend_buckets["openai.gpt-4.1-mini@2025-09-01"].rate == 0.05
+        assert controller.budget_buckets["openai.gpt-4.1-mini@2025-09-01"].burst == 10
+        assert controller.backend_limiters["openai.gpt-4.1-mini@2025-09-01"].max_concurrent == 1
+        assert controller.limiter.max_concurrent == 3
+        assert controller.limiter.max_waiting == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_room_declines_with_refusal(self):
+        """Test that an over-limit room fails fast with a refusal-library decline"""
+        controller = AdmissionController(room_limits={"entry_room": RateLimit(0.001, 1)})
+        orchestrator = HallwayOrchestrator(self.contract, admission=controller)
+
+        first = await orchestrator.run("test-session-admit")
+        second = await orchestrator.run("test-session-admit")
+
+        assert first["outputs"]["exit_summary"]["completed"] is True
+        steps = second["outputs"]["steps"]
+        assert len(steps) == 1 and steps[0]["status"] == "decline"
+        assert steps[0]["gate_decisions"][0]["gate"] == "admission_control"
+        assert steps[0]["data"]["refusal"] == get_refusal_library().refuse("not_now")
+        decline = second["outputs"]["exit_summary"]["decline"]
+        assert decline["reason"] == "admission_denied"
+        assert decline["details"]["scope"] == "room:entry_room"
+        assert decline["details"]["retry_after_s"] > 0
+        validate(instance=second, schema=self.schema)
+
+    @pytest.mark.asyncio
+    async def test_room_backend_limits_apply(self):
+        """Test that rooms are admitted against the backend and budget configured for them"""
+        controller = AdmissionController(
+            backend_limits={"model-a": RateLimit(0.001, 1)},
+            room_backends={"entry_room": "model-a"}
+        )
+        orchestrator = HallwayOrchestrator(self.contract, admission=controller)
+
+        assert (await orchestrator.run("test-session-backend"))["outputs"]["exit_summary"]["completed"] is True
+        second = await orchestrator.run("test-session-backend-2")
+        decline = second["outputs"]["exit_summary"]["decline"]
+        assert decline["reason"] == "admission_denied"
+        assert decline["details"]["scope"] == "backend:model-a"
+
+        budgeted = AdmissionController.from_experiment_config(
+            self.experiment, room_backends={"entry_room": "openai.gpt-4.1-mini@2025-09-01"}
+        )
+        assert budgeted.room_costs["entry_room"] == 0.05
+        assert (await budgeted.admit_room("entry_room")).admitted
+        assert (await budgeted.admit_room("entry_room")).decision.scope == "backend:openai.gpt-4.1-mini@2025-09-01"
+
+    @pytest.mark.asyncio
+    async def test_burst_is_shed_not_queued(self, instrumented_orchestrator):
+        """Test that sessions beyond the concurrency limit and queue are declined at once"""
+        controller = AdmissionController(max_concurrent=2, max_waiting=1)
+        orchestrator = instrumented_orchestrator(self.contract, delay=0.01, admission=controller)
+
+        results = await asyncio.gather(
+            *(orchestrator.run(f"test-session-burst-{index}", options={"rooms_subset": ["entry_room"]})
+              for index in range(6))
+        )
+
+        completed = [result["outputs"]["exit_summary"]["completed"] for result in results]
+        assert completed.count(True) == 3
+        for result in results:
+            if not result["outputs"]["exit_summary"]["completed"]:
+                assert result["outputs"]["steps"][-1]["gate_decisions"][0]["reason"] == "concurrency_limited"
+        assert controller.limiter.active == 0
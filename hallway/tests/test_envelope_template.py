@@ -0,0 +1,74 @@
+"""
+Test envelope template
+Verifies pre-serialized hallway envelopes match the dict output byte for byte
+"""
+
+import pytest
+import json
+import os
+from jsonschema import validate
+from hallway.hallway import HallwayOrchestrator, run_hallway, run_hallway_to_bytes
+from hallway.envelope import EnvelopeTemplate, encode_json
+
+
+class TestEnvelopeTemplate:
+    """Test pre-serialized envelope output"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract and schema for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "schemas", "hallway_v0_2.schema.json")
+        with open(schema_path, 'r') as f:
+            cls.schema = json.load(f)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [
+        {},
+        {"mini_walk": True},
+        {"rooms_subset": ["entry_room", "exit_room"]},
+        {"dry_run": True, "stop_on_decline": False}
+    ])
+    async def test_run_to_bytes_matches_run(self, options):
+        """Test that run_to_bytes equals the compact encoding of run"""
+        orchestrator = HallwayOrchestrator(self.contract)
+
+        result = await orchestrator.run("test-session-bytes", options=options)
+        raw = await orchestrator.run_to_bytes("test-session-bytes", options=options)
+
+        assert raw == encode_json(result)
+        assert raw == json.dumps(result, separators=(",", ":")).encode("utf-8")
+        validate(instance=json.loads(raw), schema=self.schema)
+
+    def test_template_splices_dynamic_sections(self):
+        """Test that escaped and non-ASCII dynamic values splice correctly"""
+        contract = dict(self.contract, stone_alignment=["clarity \"over\" speed", "ünïcode"])
+        template = EnvelopeTemplate(contract, contract["sequence"], contract["gate_profile"])
+        steps = [{"room_id": "entry_room", "data": {"text": "line\nbreak ☃"}}]
+        exit_summary = {"completed": True, "decline": None, "auditable_hash_chain": []}
+
+        output = template.build(steps, "session-é", exit_summary)
+
+        assert template.to_bytes(steps, "session-é", exit_summary) == encode_json(output)
+        assert template.output_to_bytes(output) == encode_json(output)
+
+    def test_blank_session_ref_is_replaced(self):
+        """Test that an empty final_state_ref becomes the placeholder ref"""
+        template = EnvelopeTemplate(self.contract, self.contract["sequence"], self.contract["gate_profile"])
+        exit_summary = {"completed": True, "decline": None, "auditable_hash_chain": []}
+
+        output = json.loads(template.to_bytes([], "  ", exit_summary))
+
+        assert output["inputs"]["session_state_ref"] == "invalid-session-ref"
+        assert output["outputs"]["final_state_ref"] == "invalid-session-ref"
+
+    @pytest.mark.asyncio
+    async def test_run_hallway_to_bytes_default_contract(self):
+        """Test the convenience function against run_hallway"""
+        raw = await run_hallway_to_bytes("test-session-default", options={"mini_walk": True})
+        result = await run_hallway("test-session-default", options={"mini_walk": True})
+
+        assert raw == encode_json(result)
@@ -0,0 +1,125 @@
+"""
+Test hallway DAG scheduling
+Verifies depends_on edges run rooms concurrently while steps stay in canonical order
+"""
+
+import pytest
+import asyncio
+import json
+import os
+from jsonschema import validate
+from hallway.hallway import HallwayOrchestrator
+from hallway.gates import GateInterface, GateDecision
+from hallway.scheduler import build_dependencies
+
+
+# Example edges: memory_room only needs entry_room, so it can run alongside
+# the diagnostic, protocol and walk rooms
+DAG_EDGES = {
+    "memory_room": ["entry_room"],
+    "integration_commit_room": ["walk_room", "memory_room"]
+}
+
+
+class DenyRoomGate(GateInterface):
+    """Gate that denies one room"""
+
+    def __init__(self, deny_room):
+        self.deny_room = deny_room
+
+    def evaluate(self, room_id: str, session_state_ref: str, payload: dict = None) -> GateDecision:
+        return GateDecision(
+            gate="deny_room_gate",
+            allow=room_id != self.deny_room,
+            reason="denied" if room_id == self.deny_room else "allowed",
+            details={"room_id": room_id}
+        )
+
+
+class TestHallwayDag:
+    """Test dependency-aware room scheduling"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract and schema for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "schemas", "hallway_v0_2.schema.json")
+        with open(schema_path, 'r') as f:
+            cls.schema = json.load(f)
+
+        cls.dag_contract = dict(cls.contract, depends_on=DAG_EDGES)
+
+    def test_contract_edges_resolve(self):
+        """Test that declared edges resolve to a DAG with predecessor defaults"""
+        dependencies = HallwayOrchestrator(self.dag_contract).dependencies
+
+        assert dependencies["entry_room"] == ()
+        assert dependencies["diagnostic_room"] == ("entry_room",)
+        assert dependencies["memory_room"] == ("entry_room",)
+        assert dependencies["integration_commit_room"] == ("walk_room", "memory_room")
+        assert HallwayOrchestrator(self.contract).dependencies is None
+
+    def test_invalid_edges_rejected(self):
+        """Test that edges to unknown or later rooms raise ValueError"""
+        sequence = ["entry_room", "diagnostic_room", "exit_room"]
+
+        with pytest.raises(ValueError):
+            build_dependencies(sequence, {"entry_room": ["exit_room"]})
+        with pytest.raises(ValueError):
+            build_dependencies(sequence, {"exit_room": ["walk_room"]})
+        with pytest.raises(ValueError):
+            build_dependencies(sequence, {"walk_room": ["entry_room"]})
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [
+        {},
+        {"mini_walk": True},
+        {"rooms_subset": ["memory_room", "exit_room"]},
+        {"stop_on_decline": False},
+        {"pipeline": True}
+    ])
+    @pytest.mark.parametrize("deny_room", [None, "diagnostic_room", "memory_room"])
+    async def test_dag_output_matches_sequential(self, options, deny_room):
+        """Test that DAG scheduling emits the same bytes as a sequential walk"""
+        gates = {"coherence_gate": DenyRoomGate(deny_room)} if deny_room else None
+
+        dag = await HallwayOrchestrator(self.dag_contract, gates).run_to_bytes("test-session-dag", options=options)
+        sequential = await HallwayOrchestrator(self.contract, gates).run_to_bytes(
+            "test-session-dag", options=options
+        )
+
+        assert dag == sequential
+        validate(instance=json.loads(dag), schema=self.schema)
+
+    @pytest.mark.asyncio
+    async def test_independent_rooms_run_concurrently(self, instrumented_orchestrator):
+        """Test that memory_room runs alongside the diagnostic to walk chain"""
+        orchestrator = instrumented_orchestrator(
+            self.dag_contract, delay={"diagnostic_room": 0.02, "protocol_room": 0.02, "walk_room": 0.02, "memory_room": 0.02}
+        )
+
+        result = await orchestrator.run("test-session-concurrent")
+
+        events = orchestrator.events
+        assert events.index(("start", "memory_room")) < events.index(("finish", "diagnostic_room"))
+        assert events.index(("start", "integration_commit_room")) > events.index(("finish", "walk_room"))
+        assert [step["room_id"] for step in result["outputs"]["steps"]] == self.contract["sequence"]
+        assert result["outputs"]["exit_summary"]["completed"] is True
+
+    @pytest.mark.asyncio
+    async def test_decline_cancels_in_flight_rooms(self, instrumented_orchestrator):
+        """Test that stop_on_decline cancels running rooms and never starts dependents"""
+        orchestrator = instrumented_orchestrator(
+            self.dag_contract, delay={"memory_room": 10}, gates={"coherence_gate": DenyRoomGate("diagnostic_room")}
+        )
+
+        result = await asyncio.wait_for(orchestrator.run("test-session-cancel"), timeout=5)
+
+        assert [step["room_id"] for step in result["outputs"]["steps"]] == ["entry_room", "diagnostic_room"]
+        assert result["outputs"]["exit_summary"]["decline"]["reason"] == "gate_chain_failed"
+        assert ("cancelled", "memory_room") in orchestrator.events
+        assert ("start", "protocol_room") not in orchestrator.events
+        assert ("start", "integration_commit_room") not in orchestrator.events
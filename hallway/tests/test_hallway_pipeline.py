@@ -0,0 +1,106 @@
+"""
+Test hallway pipelining
+Verifies pipelined step upcasting produces the same envelopes as sequential runs
+"""
+
+import pytest
+import json
+import os
+import threading
+from jsonschema import validate
+from hallway.hallway import HallwayOrchestrator
+from hallway.gates import GateInterface, GateDecision
+from hallway.step_chain import StepChain, get_pipeline_executor
+from hallway import step_chain
+
+
+class DenyRoomGate(GateInterface):
+    """Gate that denies one room"""
+
+    def __init__(self, deny_room):
+        self.deny_room = deny_room
+
+    def evaluate(self, room_id: str, session_state_ref: str, payload: dict = None) -> GateDecision:
+        return GateDecision(
+            gate="deny_room_gate",
+            allow=room_id != self.deny_room,
+            reason="denied" if room_id == self.deny_room else "allowed",
+            details={"room_id": room_id}
+        )
+
+
+class TestHallwayPipeline:
+    """Test pipelined hallway runs"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract and schema for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "schemas", "hallway_v0_2.schema.json")
+        with open(schema_path, 'r') as f:
+            cls.schema = json.load(f)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [
+        {},
+        {"mini_walk": True},
+        {"dry_run": True},
+        {"stop_on_decline": False}
+    ])
+    @pytest.mark.parametrize("deny_room", [None, "walk_room"])
+    async def test_pipelined_bytes_identical(self, options, deny_room):
+        """Test that pipelined runs emit the same bytes as sequential runs"""
+        gates = {"coherence_gate": DenyRoomGate(deny_room)} if deny_room else None
+        orchestrator = HallwayOrchestrator(self.contract, gates)
+
+        sequential = await orchestrator.run_to_bytes("test-session-pipeline", options=options)
+        pipelined = await orchestrator.run_to_bytes("test-session-pipeline", options=dict(options, pipeline=True))
+
+        assert pipelined == sequential
+        validate(instance=json.loads(pipelined), schema=self.schema)
+
+    @pytest.mark.asyncio
+    async def test_upcasts_run_on_worker_thread(self, monkeypatch):
+        """Test that pipelined upcasts run off the event loop thread"""
+        upcast_threads = []
+        original = step_chain.upcast_v01_to_v02
+
+        def recording_upcast(*args, **kwargs):
+            upcast_threads.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(step_chain, "upcast_v01_to_v02", recording_upcast)
+        orchestrator = HallwayOrchestrator(self.contract)
+
+        result = await orchestrator.run("test-session-worker", options={"pipeline": True})
+
+        assert len(upcast_threads) == len(self.contract["sequence"])
+        assert all(name.startswith("hallway-pipeline") for name in upcast_threads)
+        assert result["outputs"]["steps"][0]["audit"]["prev_hash"] is None
+
+    @pytest.mark.asyncio
+    async def test_chain_links_prev_hash_through_futures(self):
+        """Test that each pipelined step's prev_hash is the previous step_hash"""
+        chain = StepChain(get_pipeline_executor())
+
+        for index in range(5):
+            chain.append(f"room_{index}", {"index": index, "payload": "x" * 10000}, "ok", [])
+        steps = await chain.steps()
+
+        assert [step["room_id"] for step in steps] == [f"room_{index}" for index in range(5)]
+        for previous, step in zip(steps, steps[1:]):
+            assert step["audit"]["prev_hash"] == previous["audit"]["step_hash"]
+
+    @pytest.mark.asyncio
+    async def test_orchestrators_share_one_worker(self):
+        """Test that pipelined runs reuse one worker thread instead of one per orchestrator"""
+        threads_before = threading.active_count()
+
+        for index in range(5):
+            await HallwayOrchestrator(self.contract).run(f"test-session-shared-{index}", options={"pipeline": True})
+
+        assert threading.active_count() <= threads_before + 1
+        assert get_pipeline_executor() is get_pipeline_executor()
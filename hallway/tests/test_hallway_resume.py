@@ -0,0 +1,128 @@
+"""
+Test hallway checkpoints and resume
+Verifies steps are persisted as produced and resumed runs reuse a verified prefix
+"""
+
+import pytest
+import json
+import os
+from jsonschema import validate
+from hallway.hallway import HallwayOrchestrator
+from hallway.checkpoint import (
+    InMemoryCheckpointStore, FileCheckpointStore, CheckpointVerificationError, verify_step_prefix
+)
+
+
+class TestHallwayResume:
+    """Test checkpointed and resumed hallway runs"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract and schema for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+        schema_path = os.path.join(os.path.dirname(__file__), "..", "schemas", "hallway_v0_2.schema.json")
+        with open(schema_path, 'r') as f:
+            cls.schema = json.load(f)
+
+    @pytest.mark.asyncio
+    async def test_steps_persisted_as_produced(self):
+        """Test that every step of a run is checkpointed under its session"""
+        store = InMemoryCheckpointStore()
+        orchestrator = HallwayOrchestrator(self.contract, checkpoint_store=store)
+
+        result = await orchestrator.run("test-session-checkpoint")
+
+        assert store.load("test-session-checkpoint") == result["outputs"]["steps"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [{}, {"pipeline": True}])
+    async def test_resume_skips_completed_rooms(self, instrumented_orchestrator, options):
+        """Test that a resumed run only evaluates rooms after the stored prefix"""
+        store = InMemoryCheckpointStore()
+        crashing = instrumented_orchestrator(self.contract, checkpoint_store=store, crash_room="walk_room")
+
+        with pytest.raises(RuntimeError):
+            await crashing.run("test-session-resume", options=options)
+        completed = [step["room_id"] for step in store.load("test-session-resume")]
+        assert "walk_room" not in completed
+
+        resumed = instrumented_orchestrator(self.contract, checkpoint_store=store)
+        output = await resumed.run_to_bytes(
+            "test-session-resume", options=dict(options, resume_from="test-session-resume")
+        )
+        uninterrupted = await HallwayOrchestrator(self.contract).run_to_bytes("test-session-resume")
+
+        assert resumed.evaluated == self.contract["sequence"][len(completed):]
+        assert output == uninterrupted
+        assert store.load("test-session-resume") == json.loads(output)["outputs"]["steps"]
+        validate(instance=json.loads(output), schema=self.schema)
+
+    @pytest.mark.asyncio
+    async def test_resume_into_new_session(self, instrumented_orchestrator):
+        """Test that resuming under another session copies the verified prefix"""
+        store = InMemoryCheckpointStore()
+        with pytest.raises(RuntimeError):
+            await instrumented_orchestrator(self.contract, checkpoint_store=store, crash_room="protocol_room").run("test-session-old")
+
+        orchestrator = instrumented_orchestrator(self.contract, checkpoint_store=store)
+        result = await orchestrator.run("test-session-new", options={"resume_from": "test-session-old"})
+
+        assert "entry_room" not in orchestrator.evaluated
+        assert store.load("test-session-new") == result["outputs"]["steps"]
+        assert len(store.load("test-session-old")) < len(result["outputs"]["steps"])
+
+    @pytest.mark.asyncio
+    async def test_tampered_checkpoint_rejected(self):
+        """Test that a prefix with altered data or a broken chain is not resumed"""
+        store = InMemoryCheckpointStore()
+        await HallwayOrchestrator(self.contract, checkpoint_store=store).run("test-session-tamper")
+        steps = store.load("test-session-tamper")
+
+        tampered = json.loads(json.dumps(steps[:3]))
+        tampered[1]["data"]["room_id"] = "entry_room"
+        with pytest.raises(CheckpointVerificationError):
+            verify_step_prefix(tampered, self.contract["sequence"])
+
+        relinked = json.loads(json.dumps(steps[:3]))
+        relinked[2]["audit"]["prev_hash"] = relinked[0]["audit"]["step_hash"]
+        with pytest.raises(CheckpointVerificationError):
+            verify_step_prefix(relinked, self.contract["sequence"])
+
+        with pytest.raises(CheckpointVerificationError):
+            verify_step_prefix(steps[:3], ["entry_room", "memory_room", "exit_room"])
+
+        store.reset("test-session-tamper")
+        for step in tampered:
+            store.append("test-session-tamper", step)
+        with pytest.raises(CheckpointVerificationError):
+            await HallwayOrchestrator(self.contract, checkpoint_store=store).run(
+                "test-session-tamper", options={"resume_from": "test-session-tamper"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_resume_requires_store(self):
+        """Test that resume_from without a checkpoint store raises ValueError"""
+        with pytest.raises(ValueError):
+            await HallwayOrchestrator(self.contract).run("test-session", options={"resume_from": "test-session"})
+
+    @pytest.mark.asyncio
+    async def test_file_store_roundtrip(self, instrumented_orchestrator, tmp_path):
+        """Test that the file store resumes after a crash and ignores a torn last line"""
+        store = FileCheckpointStore(str(tmp_path))
+        with pytest.raises(RuntimeError):
+            await instrumented_orchestrator(self.contract, checkpoint_store=store, crash_room="memory_room").run("test-session-file")
+        completed = store.load("test-session-file")
+        assert len(completed) == self.contract["sequence"].index("memory_room")
+
+        with open(store._path("test-session-file"), "a", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write('{"room_id": "memo')
+        assert store.load("test-session-file") == completed
+
+        output = await HallwayOrchestrator(self.contract, checkpoint_store=store).run_to_bytes(
+            "test-session-file", options={"resume_from": "test-session-file"}
+        )
+
+        assert output == await HallwayOrchestrator(self.contract).run_to_bytes("test-session-file")
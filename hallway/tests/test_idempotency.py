@@ -0,0 +1,141 @@
+"""
+Test hallway idempotency
+Verifies repeated requests replay their envelope and concurrent duplicates run once
+"""
+
+import pytest
+import asyncio
+import json
+import os
+from hallway.hallway import HallwayOrchestrator
+from hallway.idempotency import IdempotencyCache, FileIdempotencyBackend, request_key
+
+
+class TestIdempotency:
+    """Test the hallway idempotency cache"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+    def test_request_key_is_canonical(self):
+        """Test that key order and missing maps do not change the key"""
+        assert request_key("s", {"a": 1, "b": 2}, None) == request_key("s", {"b": 2, "a": 1}, {})
+        assert request_key("s") != request_key("t")
+        assert request_key("s", {"a": 1}) != request_key("s", {"a": 2})
+        assert request_key("s", options={"mini_walk": True}) != request_key("s")
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_replays_envelope(self, instrumented_orchestrator):
+        """Test that a retried request returns the same envelope without rerunning rooms"""
+        orchestrator = instrumented_orchestrator(self.contract, idempotency_cache=IdempotencyCache())
+
+        first = await orchestrator.run_to_bytes("test-session-idem")
+        evaluations = orchestrator.evaluations
+        second = await orchestrator.run_to_bytes("test-session-idem")
+        result = await orchestrator.run("test-session-idem")
+
+        assert second == first
+        assert orchestrator.evaluations == evaluations
+        assert result == await HallwayOrchestrator(self.contract).run("test-session-idem")
+
+        result["outputs"]["steps"].clear()
+        assert (await orchestrator.run("test-session-idem"))["outputs"]["steps"]
+
+        await orchestrator.run_to_bytes("test-session-idem", options={"mini_walk": True})
+        assert orchestrator.evaluations > evaluations
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_coalesce(self, instrumented_orchestrator):
+        """Test that concurrent identical requests share one execution"""
+        orchestrator = instrumented_orchestrator(self.contract, idempotency_cache=IdempotencyCache(), delay=0.01)
+
+        responses = await asyncio.gather(*(orchestrator.run_to_bytes("test-session-flight") for _ in range(5)))
+
+        assert len(set(responses)) == 1
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, instrumented_orchestrator):
+        """Test that a failed execution reaches every waiter and is retried next time"""
+        cache = IdempotencyCache()
+        orchestrator = instrumented_orchestrator(self.contract, idempotency_cache=cache, delay=0.01, fail=True)
+
+        results = await asyncio.gather(
+            orchestrator.run_to_bytes("test-session-fail"),
+            orchestrator.run_to_bytes("test-session-fail"),
+            return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(cache) == 0
+
+        orchestrator.fail = False
+        assert await orchestrator.run_to_bytes("test-session-fail")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_execution(self, instrumented_orchestrator):
+        """Test that a caller timing out leaves the shared execution running for its retry"""
+        cache = IdempotencyCache()
+        orchestrator = instrumented_orchestrator(self.contract, idempotency_cache=cache, delay=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(orchestrator.run_to_bytes("test-session-timeout"), timeout=0.005)
+        await orchestrator.run_to_bytes("test-session-timeout")
+
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+
+    @pytest.mark.asyncio
+    async def test_stream_shares_the_cache(self, instrumented_orchestrator):
+        """Test that streams store fresh runs and replay cached or in-flight ones step by step"""
+        orchestrator = instrumented_orchestrator(self.contract, idempotency_cache=IdempotencyCache(), delay=0.01)
+
+        async def collect():
+            return [event async for event in orchestrator.stream("test-session-stream")]
+
+        live, coalesced = await asyncio.gather(collect(), collect())
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+        replayed = await collect()
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+
+        envelope = json.loads(await orchestrator.run_to_bytes("test-session-stream"))
+        expected = [("step", step) for step in envelope["outputs"]["steps"]] + [("exit", {
+            "final_state_ref": envelope["outputs"]["final_state_ref"],
+            "exit_summary": envelope["outputs"]["exit_summary"]
+        })]
+        for events in (live, coalesced, replayed):
+            assert json.loads(json.dumps(events)) == json.loads(json.dumps(expected))
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+
+    def test_ttl_and_lru_bounds(self, fake_clock):
+        """Test that entries expire after the TTL and the LRU evicts the oldest"""
+        cache = IdempotencyCache(ttl_seconds=10, max_entries=2, clock=fake_clock)
+
+        cache.put(request_key("a"), b"A")
+        cache.put(request_key("b"), b"B")
+        assert cache.get(request_key("a")) == b"A"
+        cache.put(request_key("c"), b"C")
+
+        assert cache.get(request_key("b")) is None
+        assert cache.get(request_key("a")) == b"A"
+        fake_clock.now += 10
+        assert cache.get(request_key("a")) is None
+        assert len(cache) == 1
+
+        with pytest.raises(ValueError):
+            IdempotencyCache(ttl_seconds=0)
+
+    def test_file_backend_shared_across_caches(self, fake_clock, tmp_path):
+        """Test that a response written through the backend replays in another cache"""
+        backend = FileIdempotencyBackend(str(tmp_path))
+        key = request_key("test-session-file", {"entry_room": {"x": 1}})
+
+        IdempotencyCache(ttl_seconds=10, max_entries=1, backend=backend, clock=fake_clock).put(key, b'{"ok":true}')
+        other = IdempotencyCache(ttl_seconds=10, backend=backend, clock=fake_clock)
+
+        assert other.get(key) == b'{"ok":true}'
+        fake_clock.now += 10
+        assert IdempotencyCache(ttl_seconds=10, backend=backend, clock=fake_clock).get(key) is None
+        assert backend.get(key) is None
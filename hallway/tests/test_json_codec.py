@@ -0,0 +1,179 @@
+"""
+Test JSON codec conformance
+Verifies every codec backend emits byte-identical output to stdlib json
+"""
+
+import pytest
+import glob
+import hashlib
+import json
+import math
+import os
+import random
+import uuid
+from enum import Enum, IntEnum
+from rooms import json_codec
+from hallway.audit import canonical_json, compute_step_hash
+
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+FIXTURE_PATHS = sorted(
+    path
+    for pattern in ("contracts/**/*.json", "hallway/config/*.json", "hallway/schemas/*.json", "build_canon/**/*.json")
+    for path in glob.glob(os.path.join(REPO_ROOT, pattern), recursive=True)
+)
+
+EDGE_STRINGS = ["", "plain", "\x00\x1f\x7f", "quote\" back\\slash", "é ünï", "  ", "☃ \U0001f600", "null", "1.5e3"]
+EDGE_NUMBERS = [0, -1, 2 ** 53 + 1, 2 ** 63, -(2 ** 63), 2 ** 64, 10 ** 30, 0.0, -0.0, 0.1, 1e16, 1e-5, 5e-324,
+                1.7976931348623157e308, float("nan"), float("inf"), float("-inf")]
+
+
+def _random_scalar(rng):
+    choice = rng.randrange(7)
+    if choice == 0:
+        return rng.choice(EDGE_STRINGS)
+    if choice == 1:
+        return "".join(chr(rng.choice([rng.randrange(32, 127), rng.randrange(0x80, 0x3000)])) for _ in range(rng.randrange(8)))
+    if choice == 2:
+        return rng.choice(EDGE_NUMBERS)
+    if choice == 3:
+        return rng.randrange(-10 ** 6, 10 ** 6)
+    if choice == 4:
+        return rng.uniform(-1e6, 1e6) * 10 ** rng.randrange(-8, 20)
+    if choice == 5:
+        return rng.choice([True, False])
+    return None
+
+
+def _random_object(rng, depth=0):
+    if depth >= 4 or rng.random() < 0.3:
+        return _random_scalar(rng)
+    if rng.random() < 0.5:
+        return [_random_object(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return {
+        rng.choice(EDGE_STRINGS + ["k", "key_" + str(rng.randrange(100)), "Ä", "\U00010000", "￿"]): _random_object(rng, depth + 1)
+        for _ in range(rng.randrange(5))
+    }
+
+
+def _random_safe_object(rng, depth=0):
+    """Objects without floats or nulls, which the accelerated encoder keeps"""
+    if depth >= 4 or rng.random() < 0.3:
+        return rng.choice([rng.choice(EDGE_STRINGS[:-2]), rng.randrange(-2 ** 63, 2 ** 63), True, False])
+    if rng.random() < 0.5:
+        return [_random_safe_object(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return {"key_" + str(rng.randrange(1000)): _random_safe_object(rng, depth + 1) for _ in range(rng.randrange(5))}
+
+
+@pytest.fixture(params=json_codec.available_backends())
+def backend(request):
+    """Run a test once per installed backend, restoring the default after"""
+    previous = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+def _assert_conforms(obj):
+    for sort_keys in (False, True):
+        for ensure_ascii in (False, True):
+            expected = json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+            assert json_codec.dumps(obj, sort_keys=sort_keys, ensure_ascii=ensure_ascii) == expected
+            assert json_codec.dumps_bytes(obj, sort_keys=sort_keys, ensure_ascii=ensure_ascii) == expected.encode("utf-8")
+            assert json_codec.stdlib_dumps_bytes(obj, sort_keys=sort_keys, ensure_ascii=ensure_ascii) == expected.encode("utf-8")
+
+
+def _same_value(left, right):
+    """Equality that treats NaN as equal to NaN and tells -0.0 from 0.0"""
+    if isinstance(left, float) and isinstance(right, float):
+        if math.isnan(left):
+            return math.isnan(right)
+        return left == right and math.copysign(1, left) == math.copysign(1, right)
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, dict):
+        return list(left) == list(right) and all(_same_value(left[k], right[k]) for k in left)
+    if isinstance(left, list):
+        return len(left) == len(right) and all(_same_value(a, b) for a, b in zip(left, right))
+    return left == right
+
+
+class TestJsonCodecConformance:
+    """Test byte-identical encoding and value-identical decoding"""
+
+    def test_fixtures_found(self):
+        """Test that the conformance corpus includes the repository fixtures"""
+        assert len(FIXTURE_PATHS) >= 20
+
+    @pytest.mark.parametrize("path", FIXTURE_PATHS, ids=lambda path: os.path.relpath(path, REPO_ROOT))
+    def test_fixture_files(self, backend, path):
+        """Test every JSON fixture in the repository"""
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        assert json_codec.loads(text) == json.loads(text)
+        assert json_codec.loads(text.encode("utf-8")) == json.loads(text)
+        _assert_conforms(json.loads(text))
+
+    def test_random_objects(self, backend):
+        """Test seeded random objects covering floats, NaN, big integers and unicode"""
+        rng = random.Random(20261018)
+        for _ in range(2000):
+            obj = _random_object(rng)
+            _assert_conforms(obj)
+
+            text = json.dumps(obj)
+            assert _same_value(json_codec.loads(text), json.loads(text))
+
+    def test_random_accelerated_objects(self, backend):
+        """Test objects the accelerated encoder keeps, so its output is checked directly"""
+        rng = random.Random(38)
+        for _ in range(2000):
+            _assert_conforms(_random_safe_object(rng))
+
+    def test_audit_hashes_unchanged(self, backend):
+        """Test that canonical_json and step hashes match the stdlib definition"""
+        room_output = {"room_id": "entry_room", "dry_run": True, "nested": {"b": [1, 2], "a": "ü"}}
+
+        expected = json.dumps(room_output, sort_keys=True, separators=(",", ":"))
+        assert canonical_json(room_output) == expected
+        assert compute_step_hash(room_output) == "sha256:" + hashlib.sha256(expected.encode()).hexdigest()
+
+    def test_errors_match_stdlib(self, backend):
+        """Test that unencodable values and invalid documents raise as stdlib does"""
+        with pytest.raises(TypeError):
+            json_codec.dumps({"value": object()})
+        with pytest.raises(TypeError):
+            json_codec.dumps({1: "a", "b": 2}, sort_keys=True)
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{not json")
+        assert json_codec.dumps({"value": object()}, default=lambda obj: "x") == '{"value":"x"}'
+        assert json_codec.loads('{"a":{"b":1}}', object_hook=lambda obj: sorted(obj)) == ["a"]
+
+    def test_uuid_and_enum_encode_alike(self, backend):
+        """Test that UUIDs and Enum members encode the same under every backend"""
+        class Colour(Enum):
+            RED = "red"
+            DARK = ("dark", 0.5)
+
+        class Level(IntEnum):
+            HIGH = 3
+
+        obj = {"id": uuid.UUID(int=5), "colour": Colour.RED, "dark": Colour.DARK, "level": Level.HIGH, "é": Colour.RED}
+        for ensure_ascii in (False, True):
+            expected = json.dumps(
+                {"id": "00000000-0000-0000-0000-000000000005", "colour": "red", "dark": ["dark", 0.5], "level": 3, "é": "red"},
+                separators=(",", ":"), ensure_ascii=ensure_ascii
+            )
+            assert json_codec.dumps(obj, ensure_ascii=ensure_ascii) == expected
+            assert json_codec.dumps_bytes(obj, ensure_ascii=ensure_ascii) == expected.encode("utf-8")
+            assert json_codec.stdlib_dumps_bytes(obj, ensure_ascii=ensure_ascii) == expected.encode("utf-8")
+        assert json_codec.dumps(Colour.RED) == '"red"'
+        assert json_codec.dumps(uuid.UUID(int=5)) == '"00000000-0000-0000-0000-000000000005"'
+
+    def test_unknown_backend_rejected(self):
+        """Test that selecting an unavailable backend raises ValueError"""
+        with pytest.raises(ValueError):
+            json_codec.set_backend("no_such_backend")
+        assert json_codec.get_backend() in json_codec.available_backends()
@@ -0,0 +1,56 @@
+"""
+Test memory context prefetch
+Verifies the hallway prefetches the next room's memory context during a walk
+"""
+
+import pytest
+import json
+import os
+from hallway.hallway import HallwayOrchestrator
+from rooms.memory_room import MemoryRoom, MemoryRoomInput
+from rooms.memory_room.continuity import MemoryContinuity
+
+
+class TestMemoryPrefetch:
+    """Test hallway-driven memory context prefetch"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+    def _memory_room(self, session_id):
+        memory_room = MemoryRoom()
+        memory_room.run_memory_room(MemoryRoomInput(session_state_ref=session_id, payload={"tone_label": "calm"}))
+        return memory_room
+
+    @pytest.mark.asyncio
+    async def test_walk_prefetches_downstream_contexts(self, monkeypatch):
+        """Test that every room after the first finds its context already cached"""
+        memory_room = self._memory_room("test-session-prefetch")
+        orchestrator = HallwayOrchestrator(self.contract, memory_room=memory_room)
+
+        result = await orchestrator.run("test-session-prefetch", payloads={"walk_room": {"protocol_id": "p-1"}})
+
+        calls = []
+        monkeypatch.setattr(MemoryContinuity, "get_context_for_room", staticmethod(lambda *args: calls.append(args)))
+        for room_id in self.contract["sequence"][1:]:
+            protocol_id = "p-1" if room_id == "walk_room" else None
+            context = memory_room.get_memory_for_room(room_id, "test-session-prefetch", protocol_id)
+            assert context["room_id"] == room_id
+            assert context["session_context"]["count"] == 1
+        assert calls == []
+        assert memory_room.context_cache.get("test-session-prefetch", "entry_room") is None
+        assert result["outputs"]["exit_summary"]["completed"] is True
+
+    @pytest.mark.asyncio
+    async def test_output_unchanged_by_prefetch(self):
+        """Test that prefetching leaves the hallway output bytes unchanged"""
+        memory_room = self._memory_room("test-session-same")
+
+        with_prefetch = await HallwayOrchestrator(self.contract, memory_room=memory_room).run_to_bytes("test-session-same")
+        without_prefetch = await HallwayOrchestrator(self.contract).run_to_bytes("test-session-same")
+
+        assert with_prefetch == without_prefetch
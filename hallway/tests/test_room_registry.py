@@ -0,0 +1,77 @@
+"""
+Test room registry
+Verifies contract-driven room resolution and lazy room imports
+"""
+
+import pytest
+import json
+import os
+import subprocess
+import sys
+from rooms.registry import RoomRegistry, get_room_registry
+
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+class TestRoomRegistry:
+    """Test room registry resolution and caching"""
+
+    def _write_contract(self, directory, room_id, **extra):
+        with open(os.path.join(directory, f"{room_id}.json"), "w") as f:
+            json.dump({"room_id": room_id, **extra}, f)
+
+    def test_registry_lists_contract_rooms(self):
+        """Test that every room contract is declared"""
+        room_ids = get_room_registry().room_ids()
+
+        for room_id in ["entry_room", "walk_room", "memory_room", "exit_room", "integration_commit_room"]:
+            assert room_id in room_ids
+        entry = get_room_registry().get_entry("walk_room")
+        assert entry.module == "rooms.walk_room"
+        assert entry.attribute == "run_walk_room"
+
+    def test_resolve_caches_callable(self):
+        """Test that a resolved run function is reused"""
+        registry = RoomRegistry()
+
+        run_func = registry.resolve("walk_room")
+
+        assert run_func.__name__ == "run_walk_room"
+        assert registry.resolve("walk_room") is run_func
+        assert registry._resolved == {"walk_room": run_func}
+
+    def test_contract_entry_point_override(self, tmp_path):
+        """Test that a contract can name its entry point explicitly"""
+        self._write_contract(tmp_path, "custom_room", entry_point="rooms.memory_room.memory_room:run_memory_room")
+        registry = RoomRegistry(contracts_dir=str(tmp_path))
+
+        assert registry.resolve("custom_room").__name__ == "run_memory_room"
+
+    def test_unknown_and_unimportable_rooms(self, tmp_path):
+        """Test that undeclared and missing rooms raise ImportError"""
+        self._write_contract(tmp_path, "missing_room")
+        with open(os.path.join(tmp_path, "broken.json"), "w") as f:
+            f.write("{not json")
+        registry = RoomRegistry(contracts_dir=str(tmp_path))
+
+        assert registry.room_ids() == ["missing_room"]
+        with pytest.raises(ImportError):
+            registry.resolve("undeclared_room")
+        with pytest.raises(ImportError):
+            registry.resolve("missing_room")
+
+    def test_rooms_index_imports_lazily(self):
+        """Test that importing rooms.index loads no room modules until a name is used"""
+        code = (
+            "import sys, rooms.index as index\n"
+            "print(sorted(m for m in sys.modules if m.startswith('rooms.') and m.endswith('_room')))\n"
+            "index.EntryRoomConfig\n"
+            "print('rooms.entry_room' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.split("\n")
+
+        assert output[0] == "[]"
+        assert output[1] == "True"
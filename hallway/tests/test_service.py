@@ -0,0 +1,180 @@
+"""
+Test the hallway ASGI service
+Drives the app in-process to verify runs, streamed steps, coalescing, deadlines and load shedding
+"""
+
+import pytest
+import asyncio
+import json
+import os
+from hallway.hallway import HallwayOrchestrator
+from hallway.service import HallwayService
+
+
+async def call(app, method, path, body=None, headers=None):
+    """Send one HTTP request through an ASGI app and collect the response"""
+    raw = json.dumps(body).encode("utf-8") if body is not None else b""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(key.encode("ascii"), value.encode("ascii")) for key, value in (headers or {}).items()]
+    }
+    requests = [{"type": "http.request", "body": raw[:10], "more_body": True},
+                {"type": "http.request", "body": raw[10:], "more_body": False}]
+    response = {"status": None, "headers": {}, "chunks": []}
+
+    async def receive():
+        if requests:
+            return requests.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {key.decode(): value.decode() for key, value in message["headers"]}
+        else:
+            response["chunks"].append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    response["body"] = b"".join(response["chunks"])
+    return response
+
+
+class TestHallwayService:
+    """Test the hallway HTTP front-end"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+    @pytest.mark.asyncio
+    async def test_run_returns_envelope(self):
+        """Test that /hallway/run returns the orchestrator's envelope bytes"""
+        orchestrator = HallwayOrchestrator(self.contract)
+        app = HallwayService(orchestrator)
+
+        response = await call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-http"})
+
+        assert response["status"] == 200
+        assert response["headers"]["content-length"] == str(len(response["body"]))
+        assert response["body"] == await orchestrator.run_to_bytes("test-session-http")
+
+    @pytest.mark.asyncio
+    async def test_room_route_runs_one_room(self):
+        """Test that /rooms/{room_id} runs the gated walk for that room only"""
+        app = HallwayService(HallwayOrchestrator(self.contract))
+
+        response = await call(app, "POST", "/rooms/memory_room", {"session_state_ref": "test-session-room"})
+        missing = await call(app, "POST", "/rooms/no_room", {"session_state_ref": "test-session-room"})
+
+        steps = json.loads(response["body"])["outputs"]["steps"]
+        assert [step["room_id"] for step in steps] == ["memory_room"]
+        assert missing["status"] == 404
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("accept", ["application/x-ndjson", "text/event-stream"])
+    async def test_stream_emits_each_step(self, accept):
+        """Test that streamed steps and exit summary match the buffered envelope"""
+        orchestrator = HallwayOrchestrator(self.contract)
+        app = HallwayService(orchestrator)
+
+        response = await call(app, "POST", "/hallway/stream", {
+            "session_state_ref": "test-session-stream", "options": {"pipeline": True}
+        }, headers={"accept": accept})
+
+        if accept == "text/event-stream":
+            events = []
+            for chunk in response["chunks"][:-1]:
+                kind, data = chunk.decode().strip().split("\n")
+                events.append({"event": kind[len("event: "):], "data": json.loads(data[len("data: "):])})
+        else:
+            events = [json.loads(line) for line in response["body"].splitlines()]
+
+        expected = await orchestrator.run("test-session-stream")
+        assert response["status"] == 200
+        assert response["headers"]["content-type"] == accept
+        assert [event["data"] for event in events[:-1]] == expected["outputs"]["steps"]
+        assert events[-1]["event"] == "exit"
+        assert events[-1]["data"]["exit_summary"] == expected["outputs"]["exit_summary"]
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesce(self, instrumented_orchestrator):
+        """Test that concurrent identical runs share one execution"""
+        orchestrator = instrumented_orchestrator(self.contract, delay=0.01)
+        app = HallwayService(orchestrator)
+
+        responses = await asyncio.gather(*(
+            call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-coalesce"}) for _ in range(4)
+        ))
+
+        assert len({response["body"] for response in responses}) == 1
+        assert orchestrator.evaluations == len(self.contract["sequence"])
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded(self, instrumented_orchestrator):
+        """Test that a slow request returns 504, in-stream once headers are sent"""
+        app = HallwayService(instrumented_orchestrator(self.contract, delay=0.05))
+
+        run = await call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-slow"},
+                         headers={"x-deadline-ms": "20"})
+        stream = await call(app, "POST", "/hallway/stream", {"session_state_ref": "test-session-slow"},
+                            headers={"x-deadline-ms": "120"})
+
+        assert run["status"] == 504
+        events = [json.loads(line) for line in stream["body"].splitlines()]
+        assert stream["status"] == 200
+        assert events[0]["event"] == "step"
+        assert events[-1] == {"event": "error", "data": {"status": 504, "error": "Deadline exceeded"}}
+
+    @pytest.mark.asyncio
+    async def test_overload_returns_503(self, instrumented_orchestrator):
+        """Test that requests beyond max_in_flight are shed with Retry-After"""
+        app = HallwayService(instrumented_orchestrator(self.contract, delay=0.01), max_in_flight=1, retry_after=2)
+
+        first = asyncio.ensure_future(call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-a"}))
+        await asyncio.sleep(0)
+        shed = await call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-b"})
+
+        assert shed["status"] == 503
+        assert shed["headers"]["retry-after"] == "2"
+        assert (await first)["status"] == 200
+        assert app.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_runs_count_until_they_finish(self, instrumented_orchestrator):
+        """Test that runs left behind by 504s still shed load until they finish"""
+        app = HallwayService(instrumented_orchestrator(self.contract, delay=0.02), max_in_flight=2)
+
+        timed_out = await asyncio.gather(*(
+            call(app, "POST", "/hallway/run", {"session_state_ref": f"test-session-late-{i}"},
+                 headers={"x-deadline-ms": "5"})
+            for i in range(2)
+        ))
+        assert [response["status"] for response in timed_out] == [504, 504]
+        assert app.in_flight == 0
+
+        shed = await call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-next"})
+        assert shed["status"] == 503
+        while app._abandoned:
+            await asyncio.sleep(0.01)
+        assert (await call(app, "POST", "/hallway/run", {"session_state_ref": "test-session-next"}))["status"] == 200
+
+    @pytest.mark.asyncio
+    async def test_bad_requests_rejected(self):
+        """Test that malformed requests get 4xx responses"""
+        app = HallwayService(HallwayOrchestrator(self.contract))
+
+        assert (await call(app, "GET", "/healthz"))["status"] == 200
+        assert (await call(app, "GET", "/hallway/run"))["status"] == 405
+        assert (await call(app, "POST", "/nowhere", {}))["status"] == 404
+        assert (await call(app, "POST", "/hallway/run", {}))["status"] == 400
+        assert (await call(app, "POST", "/hallway/run", {"session_state_ref": "s"},
+                           headers={"x-deadline-ms": "soon"}))["status"] == 400
+        invalid = await call(app, "POST", "/hallway/stream", {
+            "session_state_ref": "s", "options": {"rooms_subset": ["no_room"]}
+        })
+        assert invalid["status"] == 400
@@ -0,0 +1,196 @@
+"""
+Test session-sharded hallway workers
+Verifies consistent hashing and that the supervisor routes each session to one worker process
+"""
+
+import pytest
+import asyncio
+import json
+import os
+from hallway.hallway import HallwayOrchestrator
+from hallway.sharding import HashRing
+from hallway.supervisor import ShardSupervisor, WorkerError
+
+
+class HangingOrchestrator:
+    """Orchestrator whose runs never finish"""
+
+    async def run_to_bytes(self, session_state_ref, payloads=None, options=None):
+        await asyncio.Event().wait()
+
+
+def hanging_orchestrator_factory(contract):
+    return HangingOrchestrator()
+
+
+class TestHashRing:
+    """Test the consistent hash ring"""
+
+    def test_assignment_is_deterministic(self):
+        """Test that rings built the same way place every key on the same node"""
+        keys = [f"session-{index}" for index in range(200)]
+        first = HashRing(range(4))
+        second = HashRing(range(4))
+
+        assert [first.node_for(key) for key in keys] == [second.node_for(key) for key in keys]
+        assert set(first.node_for(key) for key in keys) == {0, 1, 2, 3}
+
+    def test_adding_node_moves_minimal_keys(self):
+        """Test that a new node only takes keys, about 1/N of them"""
+        keys = [f"session-{index}" for index in range(4000)]
+        ring = HashRing(range(4))
+        before = {key: ring.node_for(key) for key in keys}
+
+        ring.add(4)
+        moved = [key for key in keys if ring.node_for(key) != before[key]]
+
+        assert all(ring.node_for(key) == 4 for key in moved)
+        assert 0.1 < len(moved) / len(keys) < 0.3
+
+        ring.remove(4)
+        assert {key: ring.node_for(key) for key in keys} == before
+
+    def test_invalid_changes_rejected(self):
+        """Test that duplicate, unknown and empty ring operations raise ValueError"""
+        ring = HashRing([0])
+        with pytest.raises(ValueError):
+            ring.add(0)
+        with pytest.raises(ValueError):
+            ring.remove(1)
+        ring.remove(0)
+        with pytest.raises(ValueError):
+            ring.node_for("session")
+
+
+class TestShardSupervisor:
+    """Test hallway runs across shard worker processes"""
+
+    @classmethod
+    def setup_class(cls):
+        """Load the hallway contract for testing"""
+        contract_path = os.path.join(os.path.dirname(__file__), "..", "config", "hallway.contract.json")
+        with open(contract_path, 'r') as f:
+            cls.contract = json.load(f)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("transport", ["socketpair", "unix"])
+    async def test_output_matches_in_process(self, transport):
+        """Test that sharded runs emit the same bytes as an in-process orchestrator"""
+        orchestrator = HallwayOrchestrator(self.contract)
+        sessions = [f"test-session-shard-{index}" for index in range(12)]
+
+        async with ShardSupervisor(workers=2, contract=self.contract, transport=transport) as supervisor:
+            outputs = await asyncio.gather(
+                *(supervisor.run_to_bytes(session, options={"mini_walk": True}) for session in sessions)
+            )
+            result = await supervisor.run(sessions[0])
+
+        for session, output in zip(sessions, outputs):
+            assert output == await orchestrator.run_to_bytes(session, options={"mini_walk": True})
+        assert result == await orchestrator.run(sessions[0])
+
+    @pytest.mark.asyncio
+    async def test_sessions_stick_to_one_worker(self):
+        """Test that each session is always served by the worker its hash selects"""
+        sessions = [f"test-session-sticky-{index}" for index in range(20)]
+
+        async with ShardSupervisor(workers=3, contract=self.contract) as supervisor:
+            for _ in range(2):
+                await asyncio.gather(*(supervisor.run_to_bytes(session) for session in sessions))
+            stats = await supervisor.worker_stats()
+
+            expected = {shard: 0 for shard in stats}
+            for session in sessions:
+                expected[supervisor.shard_for(session)] += 1
+
+            assert {shard: stat["sessions"] for shard, stat in stats.items()} == expected
+            assert {shard: stat["requests"] for shard, stat in stats.items()} == {
+                shard: 2 * count for shard, count in expected.items()
+            }
+            assert len({stat["pid"] for stat in stats.values()}) == 3
+            assert os.getpid() not in {stat["pid"] for stat in stats.values()}
+
+    @pytest.mark.asyncio
+    async def test_add_worker_rebalances(self):
+        """Test that a new worker takes over only the sessions that now hash to it"""
+        sessions = [f"test-session-grow-{index}" for index in range(200)]
+
+        async with ShardSupervisor(workers=2, contract=self.contract) as supervisor:
+            before = {session: supervisor.shard_for(session) for session in sessions}
+            shard = await supervisor.add_worker()
+            moved = [session for session in sessions if supervisor.shard_for(session) != before[session]]
+
+            assert moved and all(supervisor.shard_for(session) == shard for session in moved)
+            assert await supervisor.run_to_bytes(moved[0])
+            assert (await supervisor.worker_stats())[shard]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_propagate(self):
+        """Test that a request failing in a worker raises WorkerError and the worker keeps serving"""
+        async with ShardSupervisor(workers=1, contract=self.contract) as supervisor:
+            with pytest.raises(WorkerError, match="not found in canonical sequence"):
+                await supervisor.run_to_bytes("test-session-error", options={"rooms_subset": ["no_room"]})
+            assert await supervisor.run_to_bytes("test-session-error")
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_respawned(self):
+        """Test that a worker that dies is replaced on the same shard and requests only see WorkerError"""
+        async with ShardSupervisor(workers=1, contract=self.contract) as supervisor:
+            old_pid = (await supervisor.worker_stats())[0]["pid"]
+            supervisor._workers[0].process.kill()
+
+            for _ in range(500):
+                try:
+                    assert await supervisor.run_to_bytes("test-session-respawn")
+                    break
+                except WorkerError:
+                    await asyncio.sleep(0.01)
+
+            assert (await supervisor.worker_stats())[0]["pid"] != old_pid
+            assert supervisor.restarts == {0: 1}
+
+    @pytest.mark.asyncio
+    async def test_shard_removed_after_max_restarts(self):
+        """Test that a shard out of restarts is dropped and its sessions move"""
+        async with ShardSupervisor(workers=2, contract=self.contract, max_restarts=0) as supervisor:
+            supervisor._workers[0].process.kill()
+            for _ in range(500):
+                if 0 not in supervisor.ring.nodes:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert supervisor.ring.nodes == (1,)
+            assert supervisor.shard_for("test-session-moved") == 1
+            assert await supervisor.run_to_bytes("test-session-moved")
+
+    @pytest.mark.asyncio
+    async def test_remove_worker(self):
+        """Test that removing a worker hands its sessions to the others"""
+        async with ShardSupervisor(workers=2, contract=self.contract) as supervisor:
+            await supervisor.remove_worker(0)
+
+            assert supervisor.ring.nodes == (1,)
+            assert await supervisor.run_to_bytes("test-session-removed")
+            assert sorted(await supervisor.worker_stats()) == [1]
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_wait_forever_on_hung_worker(self):
+        """Test that stopping a worker stuck on a request times out and fails the request"""
+        supervisor = ShardSupervisor(
+            workers=1, orchestrator_factory=hanging_orchestrator_factory, stop_timeout=0.2
+        )
+        await supervisor.start()
+        process = supervisor._workers[0].process
+        request = asyncio.ensure_future(supervisor.run_to_bytes("test-session-hung"))
+        await asyncio.sleep(0.1)
+
+        await asyncio.wait_for(supervisor.stop(), timeout=5)
+
+        with pytest.raises(WorkerError):
+            await request
+        assert not process.is_alive()
+
+    def test_unknown_transport_rejected(self):
+        """Test that an unknown transport raises ValueError"""
+        with pytest.raises(ValueError):
+            ShardSupervisor(transport="tcp")
@@ -1,25 +1,28 @@
 """
-Protocol Room Module
-Implements the Protocol Room Protocol and Contract for Lichen Protocol Room Architecture (PRA)
+Protocol Room (compatibility alias)
+The Protocol Room lives in rooms.protocol_room. This package maps the old
+import paths onto those modules, so each module is loaded once per process.
 """
 
-from .protocol_room import ProtocolRoom, run_protocol_room
-from .types import (
-    ProtocolRoomInput,
-    ProtocolRoomOutput,
-    ProtocolDepth,
-    ProtocolText,
-    ScenarioMapping,
-    IntegrityResult
-)
+import importlib
+import sys
 
-__all__ = [
-    'ProtocolRoom',
-    'run_protocol_room',
-    'ProtocolRoomInput',
-    'ProtocolRoomOutput',
-    'ProtocolDepth',
-    'ProtocolText',
-    'ScenarioMapping',
-    'IntegrityResult'
-]
+from rooms.protocol_room import *  # noqa: F401,F403
+from rooms.protocol_room import __all__
+
+# Old submodule name -> module in rooms.protocol_room
+_SUBMODULES = {
+    "protocol_room": "protocol_room",
+    "types": "room_types",
+    "room_types": "room_types",
+    "canon": "canon",
+    "completion": "completion",
+    "depth": "depth",
+    "integrity": "integrity",
+    "mapping": "mapping",
+}
+
+for _name, _target in _SUBMODULES.items():
+    _module = importlib.import_module(f"rooms.protocol_room.{_target}")
+    sys.modules[f"{__name__}.{_name}"] = _module
+    globals()[_name] = _module
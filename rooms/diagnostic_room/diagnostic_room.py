@@ -4,12 +4,12 @@ Main orchestrator that implements the Diagnostic Room Protocol and Contract
 """
 
 from typing import Optional
-from room_types import DiagnosticRoomInput, DiagnosticRoomOutput
-from sensing import capture_tone_and_residue
-from readiness import assess_readiness, readiness_to_action
-from mapping import map_to_protocol
-from capture import capture_diagnostics, format_display_text
-from completion import append_fixed_marker
+from .room_types import DiagnosticRoomInput, DiagnosticRoomOutput
+from .sensing import capture_tone_and_residue
+from .readiness import assess_readiness, readiness_to_action
+from .mapping import map_to_protocol
+from .capture import capture_diagnostics, format_display_text
+from .completion import append_fixed_marker
 
 
 class DiagnosticRoom:
@@ -18,6 +18,10 @@ class DiagnosticRoom:
     def __init__(self, diagnostics_enabled: bool = True):
         self.diagnostics_enabled = diagnostics_enabled
     
+    async def run(self, input_data: DiagnosticRoomInput) -> DiagnosticRoomOutput:
+        """Async room protocol entry point; sensing is pure computation and runs inline"""
+        return self.run_diagnostic_room(input_data)
+    
     def run_diagnostic_room(self, input_data: DiagnosticRoomInput) -> DiagnosticRoomOutput:
         """
         Main entry point that orchestrates the Diagnostic Room protocol.
@@ -3,7 +3,7 @@ Mapping Module
 Implements Protocol Mapping theme from Diagnostic Room Protocol
 """
 
-from room_types import ProtocolMapping, DiagnosticSignals, Protocols
+from .room_types import ProtocolMapping, DiagnosticSignals, Protocols
 
 
 def map_to_protocol(signals: DiagnosticSignals) -> ProtocolMapping:
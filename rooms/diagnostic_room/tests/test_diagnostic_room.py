@@ -4,19 +4,15 @@ Tests all behavioral invariants and edge cases using pytest
 """
 
 import pytest
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from diagnostic_room.diagnostic_room import DiagnosticRoom, run_diagnostic_room
-from types import DiagnosticRoomInput, DiagnosticRoomOutput, DiagnosticSignals, ProtocolMapping
-from sensing import capture_tone_and_residue
-from readiness import assess_readiness
-from mapping import map_to_protocol
-from capture import capture_diagnostics, format_display_text
-from completion import append_fixed_marker
+from rooms.diagnostic_room.diagnostic_room import DiagnosticRoom, run_diagnostic_room
+from rooms.diagnostic_room.room_types import DiagnosticRoomInput, DiagnosticRoomOutput, DiagnosticSignals, ProtocolMapping
+from rooms.diagnostic_room.sensing import capture_tone_and_residue
+from rooms.diagnostic_room.readiness import assess_readiness
+from rooms.diagnostic_room.mapping import map_to_protocol
+from rooms.diagnostic_room.capture import capture_diagnostics, format_display_text
+from rooms.diagnostic_room.completion import append_fixed_marker
 
 
 class TestDiagnosticRoom:
@@ -358,6 +354,20 @@ class TestRunDiagnosticRoomFunction:
         assert result.next_action == "continue"
 
 
+class TestLegacyImportPath:
+    """Test suite for the top-level diagnostic_room alias package"""
+    
+    def test_legacy_imports_share_modules(self):
+        """Test that old import paths resolve to the rooms.diagnostic_room modules"""
+        import diagnostic_room
+        from diagnostic_room.types import DiagnosticRoomInput as LegacyInput
+        from diagnostic_room.sensing import capture_tone_and_residue as legacy_sensing
+        
+        assert LegacyInput is DiagnosticRoomInput
+        assert legacy_sensing is capture_tone_and_residue
+        assert diagnostic_room.run_diagnostic_room is run_diagnostic_room
+
+
 class TestNoTypeScriptArtifacts:
     """Test suite to ensure no TypeScript artifacts remain"""
     
@@ -3,19 +3,29 @@ Entry Room Module
 Implements the Entry Room Protocol and Contract for Lichen Protocol Room Architecture (PRA)
 """
 
-from .entry_room import EntryRoom, run_entry_room
+from .entry_room import EntryRoom, get_entry_room, run_entry_room
+from .reflection import StreamingReflection, PayloadTooLargeError
+from .fallback import GateFailurePolicy, GateFailureHandler, NoRegeneration
 from .types import (
     EntryRoomInput,
     EntryRoomOutput,
     PaceState,
     GateResult,
     DiagnosticRecord,
-    EntryRoomContext
+    EntryRoomContext,
+    RegenerationPolicy
 )
 
 __all__ = [
     'EntryRoom',
+    'get_entry_room',
     'run_entry_room',
+    'StreamingReflection',
+    'PayloadTooLargeError',
+    'GateFailurePolicy',
+    'GateFailureHandler',
+    'NoRegeneration',
+    'RegenerationPolicy',
     'EntryRoomInput',
     'EntryRoomOutput',
     'PaceState',
@@ -0,0 +1,50 @@
+"""
+Entry Room Benchmark
+Measures requests per second for the default configuration
+
+Run with: python -m rooms.entry_room.benchmark
+"""
+
+import asyncio
+import time
+from .entry_room import EntryRoom, get_entry_room
+from .types import EntryRoomInput
+
+
+PAYLOAD = "First concern about timing\nSecond concern about quality\nThird concern about resources"
+
+
+async def _bench(requests: int, shared: bool) -> float:
+    inputs = [
+        EntryRoomInput(session_state_ref=f"bench_{i}", payload=PAYLOAD)
+        for i in range(requests)
+    ]
+
+    start = time.perf_counter()
+    for input_data in inputs:
+        room = get_entry_room() if shared else EntryRoom()
+        await room.run_entry_room(input_data)
+    elapsed = time.perf_counter() - start
+
+    return requests / elapsed if elapsed > 0 else float("inf")
+
+
+def bench_requests(requests: int, shared: bool) -> float:
+    """
+    Return requests per second.
+    shared reuses the process-wide room; otherwise a room is built per request.
+    """
+    return asyncio.run(_bench(requests, shared))
+
+
+def run_benchmark(requests: int = 20000):
+    """Print requests per second for shared and per-request rooms"""
+    print("=== Entry Room Benchmark (requests/sec) ===")
+    print(f"{'requests':>8} {'shared room':>14} {'room per call':>14}")
+    shared = bench_requests(requests, shared=True)
+    per_call = bench_requests(requests, shared=False)
+    print(f"{requests:>8} {shared:>14.1f} {per_call:>14.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -4,7 +4,7 @@ Main orchestrator that implements the Entry Room Protocol and Contract
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from .types import (
     EntryRoomInput,
     EntryRoomOutput,
@@ -12,12 +12,13 @@ from .types import (
     PaceState,
     GateResult
 )
-from .reflection import VerbatimReflection
+from .reflection import VerbatimReflection, StreamingReflection, PayloadTooLargeError
 from .gates import GateChain, GateChainConfig, StubIntegrityLinter, StubPlainLanguageRewriter, StubStonesAlignmentFilter, StubCoherenceGate
 from .pace import PacePolicy, pace_state_to_next_action, DefaultPacePolicy
 from .consent import ConsentPolicy, DefaultConsentPolicy
 from .diagnostics import DiagnosticsPolicy, DefaultDiagnosticsPolicy
 from .completion import CompletionPolicy, DefaultCompletionPolicy
+from .fallback import GateFailurePolicy, GateFailureHandler
 
 
 class EntryRoomConfig:
@@ -31,7 +32,8 @@ class EntryRoomConfig:
         consent: Optional[ConsentPolicy] = None,
         diagnostics: Optional[DiagnosticsPolicy] = None,
         completion: Optional[CompletionPolicy] = None,
-        diagnostics_default: bool = True
+        diagnostics_default: bool = True,
+        gate_failure: Optional[GateFailurePolicy] = None
     ):
         self.reflection = reflection
         self.gates = gates
@@ -40,6 +42,7 @@ class EntryRoomConfig:
         self.diagnostics = diagnostics
         self.completion = completion
         self.diagnostics_default = diagnostics_default
+        self.gate_failure = gate_failure
 
 
 class EntryRoom:
@@ -57,19 +60,41 @@ class EntryRoom:
         self.diagnostics_policy = config.diagnostics or self._create_default_diagnostics_policy()
         self.completion_policy = config.completion or self._create_default_completion_policy()
         self.diagnostics_default = config.diagnostics_default
+        # Without a policy, gate failures decline with the failing gate's notes
+        self.gate_failure = GateFailureHandler(self.gate_chain, config.gate_failure) if config.gate_failure else None
+    
+    async def prepare(self) -> None:
+        """Pre-render refusal texts through the gate chain; call once at startup"""
+        if self.gate_failure is not None:
+            await self.gate_failure.prepare()
+    
+    async def run(self, input_data: EntryRoomInput) -> EntryRoomOutput:
+        """Async room protocol entry point"""
+        return await self.run_entry_room(input_data)
+    
+    def run_entry_room_sync(self, input_data: EntryRoomInput) -> EntryRoomOutput:
+        """Synchronous wrapper for callers without a running event loop"""
+        return asyncio.run(self.run_entry_room(input_data))
     
     async def run_entry_room(self, input_data: EntryRoomInput) -> EntryRoomOutput:
         """
         Main entry point that orchestrates the Entry Room protocol.
         Implements: Faithful Reflection → Pre-Gate Chain → Pace Setting → Consent Anchor → Diagnostics → Completion Prompt → Output
         """
+        # One context per request, updated in place as the protocol advances
+        context = EntryRoomContext(
+            session_id=input_data.session_state_ref,
+            pace_state="NOW",
+            consent_granted=False,
+            diagnostics_enabled=self.diagnostics_default
+        )
+        
         try:
-            # 1. Faithful Reflection: Mirror input exactly
-            reflected_ideas = self.reflection.reflect_verbatim(input_data.payload)
-            display_text = '\n'.join(reflected_ideas)
-            
-            # 2. Pre-Gate Chain: Run gates in order
-            gate_result = await self._run_gate_chain(display_text, input_data)
+            # 1-2. Faithful Reflection and Pre-Gate Chain
+            gate_result, reflected_text = await self._reflect_and_gate(input_data.payload, context)
+            if not gate_result.ok and self.gate_failure is not None:
+                # Regenerate within the deadline, else fall back to a refusal
+                gate_result = await self.gate_failure.handle(reflected_text, gate_result, context)
             if not gate_result.ok:
                 # Gate failed - return decline with hold action
                 return EntryRoomOutput(
@@ -79,11 +104,11 @@ class EntryRoom:
             display_text = gate_result.text
             
             # 3. Pace Setting: Determine session pacing
-            pace_state = await self._set_pace(input_data)
+            pace_state = await self._set_pace(context)
             next_action = pace_state_to_next_action(pace_state)
             
             # 4. Consent Anchor: Require explicit consent
-            consent_result = await self._enforce_consent(input_data, pace_state)
+            consent_result = await self._enforce_consent(context, pace_state)
             if consent_result != "YES":
                 # Consent not granted - return consent request
                 return EntryRoomOutput(
@@ -99,13 +124,20 @@ class EntryRoom:
             
             # Only capture diagnostics if enabled
             if self.diagnostics_default:
-                await self._capture_diagnostics(input_data, pace_state, output)
+                await self._capture_diagnostics(input_data, context, output)
             
             # 6. Completion Prompt: Add completion marker
             output.display_text = self.completion_policy.append_completion_marker(output.display_text)
             
             return output
             
+        except PayloadTooLargeError as error:
+            # Oversized input under the decline truncation policy
+            return EntryRoomOutput(
+                display_text=f"Entry Room declined: {str(error)}. Please shorten your input and try again.",
+                next_action="hold"
+            )
+            
         except Exception as error:
             # Handle unexpected errors gracefully
             print(f"Entry Room error: {error}")
@@ -114,53 +146,46 @@ class EntryRoom:
                 next_action="hold"
             )
     
-    async def _run_gate_chain(self, text: str, input_data: EntryRoomInput) -> GateResult:
-        """Run the gate chain with proper context"""
-        context = EntryRoomContext(
-            session_id=input_data.session_state_ref,
-            pace_state="NOW",
-            consent_granted=False,
-            diagnostics_enabled=self.diagnostics_default
-        )
+    async def _reflect_and_gate(self, payload: Any, context: EntryRoomContext) -> Tuple[GateResult, str]:
+        """
+        Reflect the payload and run the gate chain, streaming chunks when supported.
+        Returns the gate result and the reflected text it was gated on, which
+        after a failure is everything read up to and including the failing chunk.
+        """
+        if isinstance(self.reflection, StreamingReflection):
+            seen: List[str] = []
+            chunks = self.reflection.iter_chunks(payload)
+            gate_result = await self.gate_chain.run_chain_chunks(chunks, context, seen)
+            return gate_result, '\n'.join(seen)
         
+        # Mirror input exactly
+        reflected_ideas = self.reflection.reflect_verbatim(payload)
+        display_text = '\n'.join(reflected_ideas)
+        return await self._run_gate_chain(display_text, context), display_text
+    
+    async def _run_gate_chain(self, text: str, context: EntryRoomContext) -> GateResult:
+        """Run the gate chain with the request context"""
         return await self.gate_chain.run_chain(text, context)
     
-    async def _set_pace(self, input_data: EntryRoomInput) -> PaceState:
+    async def _set_pace(self, context: EntryRoomContext) -> PaceState:
         """Set the pace for the session"""
-        context = EntryRoomContext(
-            session_id=input_data.session_state_ref,
-            pace_state="NOW",
-            consent_granted=False,
-            diagnostics_enabled=self.diagnostics_default
-        )
-        
         return await self.pace_policy.apply_pace_gate(context)
     
-    async def _enforce_consent(self, input_data: EntryRoomInput, pace_state: PaceState) -> str:
+    async def _enforce_consent(self, context: EntryRoomContext, pace_state: PaceState) -> str:
         """Enforce explicit consent before proceeding"""
-        context = EntryRoomContext(
-            session_id=input_data.session_state_ref,
-            pace_state=pace_state,
-            consent_granted=False,
-            diagnostics_enabled=self.diagnostics_default
-        )
-        
+        context.pace_state = pace_state
         return await self.consent_policy.enforce_consent(context)
     
     async def _capture_diagnostics(
         self,
         input_data: EntryRoomInput,
-        pace_state: PaceState,
+        context: EntryRoomContext,
         output: EntryRoomOutput
     ) -> None:
         """Capture diagnostic information"""
         try:
-            context = EntryRoomContext(
-                session_id=input_data.session_state_ref,
-                pace_state=pace_state,
-                consent_granted=True,
-                diagnostics_enabled=True
-            )
+            context.consent_granted = True
+            context.diagnostics_enabled = True
             
             await self.diagnostics_policy.capture_diagnostics(input_data, context, output)
         except Exception as error:
@@ -201,7 +226,24 @@ class EntryRoom:
         return DefaultCompletionPolicy()
 
 
+_default_entry_room: Optional[EntryRoom] = None
+
+
+def get_entry_room(config: Optional[EntryRoomConfig] = None) -> EntryRoom:
+    """
+    Get an Entry Room instance.
+    Without a config, returns the process-wide default room, built once and
+    reused; the room keeps no per-request state, so sharing it is safe.
+    """
+    global _default_entry_room
+    if config is not None:
+        return EntryRoom(config)
+    if _default_entry_room is None:
+        _default_entry_room = EntryRoom()
+    return _default_entry_room
+
+
 async def run_entry_room(input_data: EntryRoomInput, config: Optional[EntryRoomConfig] = None) -> EntryRoomOutput:
     """Standalone function for external use"""
-    room = EntryRoom(config)
+    room = get_entry_room(config)
     return await room.run_entry_room(input_data)
@@ -0,0 +1,165 @@
+"""
+Gate Failure Module
+Regenerate-then-fallback handling of gate chain failures, per on_gate_failure in contracts/orchestrator.json
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from ..refusals import ORCHESTRATOR_CONTRACT_PATH, DEFAULT_REFUSAL_MODE, RefusalLibrary, get_refusal_library, load_on_gate_failure
+from .types import EntryRoomContext, GateResult, RegenerationPolicy
+from .gates import GateChain
+
+
+# Which refusal a failing gate maps to; gate errors and deadlines use not_now
+DEFAULT_REFUSAL_MODES = {
+    'integrity_linter': 'not_like_this',
+    'plain_language_rewriter': 'not_like_this',
+    'stones_alignment_filter': 'not_us',
+    'coherence_gate': 'not_like_this'
+}
+
+DEFAULT_DEADLINE_S = 1.0
+
+
+class NoRegeneration(RegenerationPolicy):
+    """Regeneration policy that never retries, falling back to a refusal at once"""
+
+    async def regenerate(self, text: str, failure: GateResult, ctx: EntryRoomContext) -> Optional[str]:
+        return None
+
+
+class GateFailurePolicy:
+    """How gate failures are handled: regeneration, its budget, and the refusal fallback"""
+
+    def __init__(
+        self,
+        regeneration: Optional[RegenerationPolicy] = None,
+        regenerate_attempts: int = 1,
+        deadline: float = DEFAULT_DEADLINE_S,
+        refusal_library: Optional[RefusalLibrary] = None,
+        refusal_modes: Optional[Dict[str, str]] = None,
+        refusal_styles: Optional[List[str]] = None
+    ):
+        if regenerate_attempts < 0:
+            raise ValueError("regenerate_attempts cannot be negative")
+        if deadline <= 0:
+            raise ValueError("deadline must be positive")
+        self.regeneration = regeneration or NoRegeneration()
+        self.regenerate_attempts = regenerate_attempts
+        self.deadline = deadline
+        self.refusal_library = refusal_library or get_refusal_library()
+        self.refusal_modes = dict(DEFAULT_REFUSAL_MODES if refusal_modes is None else refusal_modes)
+        self.refusal_styles = list(refusal_styles or self.refusal_library.modes)
+
+    @classmethod
+    def from_orchestrator_contract(
+        cls,
+        regeneration: Optional[RegenerationPolicy] = None,
+        deadline: float = DEFAULT_DEADLINE_S,
+        path: str = ORCHESTRATOR_CONTRACT_PATH
+    ) -> 'GateFailurePolicy':
+        """Build the policy from the orchestrator contract's on_gate_failure block"""
+        on_gate_failure = load_on_gate_failure(path)
+        fallback = on_gate_failure.get('fallback', 'refusal_library')
+        if fallback != 'refusal_library':
+            raise ValueError(f"Unsupported on_gate_failure fallback: {fallback}")
+        return cls(
+            regeneration=regeneration,
+            regenerate_attempts=on_gate_failure.get('regenerate_attempts', 1),
+            deadline=deadline,
+            refusal_styles=on_gate_failure.get('refusal_style')
+        )
+
+    def refusal_mode(self, failure: GateResult) -> str:
+        """Pick the refusal mode for a failed gate chain result"""
+        notes = failure.notes or []
+        gate_name = notes[0][len('Gate: '):] if notes and notes[0].startswith('Gate: ') else None
+        errored = any(note.startswith('Error: ') for note in notes)
+        mode = DEFAULT_REFUSAL_MODE if errored else self.refusal_modes.get(gate_name, DEFAULT_REFUSAL_MODE)
+        return mode if mode in self.refusal_styles else DEFAULT_REFUSAL_MODE
+
+
+class GateFailureHandler:
+    """
+    Turns a gate chain failure into a regenerated pass or a refusal.
+
+    Regeneration runs alongside fetching the refusal, and the whole flow
+    is bounded by the policy deadline. Refusal texts are pre-rendered
+    through the gate chain by prepare(), so falling back costs at most the
+    regeneration round-trips the policy allows.
+    """
+
+    def __init__(self, gate_chain: GateChain, policy: GateFailurePolicy):
+        self.gate_chain = gate_chain
+        self.policy = policy
+        self._rendered: Dict[str, str] = {}
+
+    async def prepare(self):
+        """Pre-render every allowed refusal through the gate chain; call once at startup"""
+        await asyncio.gather(*(self._render_refusal(mode) for mode in self.policy.refusal_styles))
+
+    async def handle(self, text: str, failure: GateResult, ctx: EntryRoomContext) -> GateResult:
+        """Regenerate text within the deadline, or return the refusal for the failure as a decline"""
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + self.policy.deadline
+        mode = self.policy.refusal_mode(failure)
+        # Fetched speculatively; already done when refusals were pre-rendered
+        refusal = asyncio.ensure_future(self._render_refusal(mode))
+
+        try:
+            latest = failure
+            for _ in range(self.policy.regenerate_attempts):
+                remaining = expires_at - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    result = await asyncio.wait_for(self._regenerate(text, latest, ctx), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if result is None:
+                    break
+                if result.ok:
+                    return GateResult(
+                        ok=True,
+                        text=result.text,
+                        notes=(result.notes or []) + ['Regenerated after gate failure']
+                    )
+                latest = result
+
+            try:
+                refusal_text = await asyncio.wait_for(refusal, max(expires_at - loop.time(), 0))
+            except asyncio.TimeoutError:
+                # Past the deadline the library text is sent as it is
+                refusal_text = self.policy.refusal_library.refuse(mode)['refusal_text']
+            return GateResult(
+                ok=False,
+                text=refusal_text,
+                notes=(failure.notes or []) + [f'Fallback: refusal_library {mode}']
+            )
+        finally:
+            if not refusal.done():
+                refusal.cancel()
+
+    async def _regenerate(self, text: str, failure: GateResult, ctx: EntryRoomContext) -> Optional[GateResult]:
+        candidate = await self.policy.regeneration.regenerate(text, failure, ctx)
+        if candidate is None:
+            return None
+        return await self.gate_chain.run_chain(candidate, ctx)
+
+    async def _render_refusal(self, mode: str) -> str:
+        rendered = self._rendered.get(mode)
+        if rendered is not None:
+            return rendered
+
+        refusal_text = self.policy.refusal_library.refuse(mode)['refusal_text']
+        ctx = EntryRoomContext(
+            session_id='refusal_library',
+            pace_state='NOW',
+            consent_granted=False,
+            diagnostics_enabled=False
+        )
+        result = await self.gate_chain.run_chain(refusal_text, ctx)
+        # A refusal the gates reject is still the contract's safe fallback text
+        rendered = result.text if result.ok else refusal_text
+        self._rendered[mode] = rendered
+        return rendered
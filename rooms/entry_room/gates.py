@@ -3,8 +3,11 @@ Gates Module
 Orchestrates the gate chain: integrity_linter → plain_language_rewriter → stones_alignment_filter → coherence_gate
 """
 
-from typing import Dict, Any
-from .types import GateAdapter, GateResult, EntryRoomContext
+from typing import Dict, Any, Iterable, List, Optional
+from .types import GateAdapter, ChunkedGateAdapter, GateResult, EntryRoomContext
+
+
+GATE_NAMES = ('integrity_linter', 'plain_language_rewriter', 'stones_alignment_filter', 'coherence_gate')
 
 
 class GateChainConfig:
@@ -40,13 +43,12 @@ class GateChain:
         Returns structured decline if any gate fails.
         """
         current_text = text
-        gate_names = ['integrity_linter', 'plain_language_rewriter', 'stones_alignment_filter', 'coherence_gate']
+        # Every gate sees the same live view of the request context
+        ctx_view = ctx.__dict__
         
-        for i, gate in enumerate(self.gates):
-            gate_name = gate_names[i]
-            
+        for gate_name, gate in zip(GATE_NAMES, self.gates):
             try:
-                result = await gate.run(current_text, ctx.__dict__)
+                result = await gate.run(current_text, ctx_view)
                 
                 if not result.ok:
                     # Gate failed - return structured decline
@@ -73,36 +75,100 @@ class GateChain:
             text=current_text,
             notes=['All gates passed successfully']
         )
+    
+    async def run_chain_chunks(
+        self,
+        chunks: Iterable[str],
+        ctx: EntryRoomContext,
+        seen: Optional[List[str]] = None
+    ) -> GateResult:
+        """
+        Runs the gate chain over text chunks, halting on first failure.
+        Each chunk passes through every gate in order before the next chunk
+        is read. Falls back to run_chain on the joined text when any gate
+        cannot process chunks. seen, if given, receives the gated chunks and,
+        on failure, the failing chunk: the text a regeneration starts from.
+        """
+        processed = seen if seen is not None else []
+        
+        if not all(isinstance(gate, ChunkedGateAdapter) for gate in self.gates):
+            processed.append('\n'.join(chunks))
+            return await self.run_chain(processed[-1], ctx)
+        
+        ctx_view = ctx.__dict__
+        
+        for chunk in chunks:
+            for gate_name, gate in zip(GATE_NAMES, self.gates):
+                try:
+                    result = await gate.run_chunk(chunk, ctx_view)
+                    
+                    if not result.ok:
+                        processed.append(chunk)
+                        return GateResult(
+                            ok=False,
+                            text=f"Gate {gate_name} declined: {', '.join(result.notes) if result.notes else 'Validation failed'}",
+                            notes=[f"Gate: {gate_name}"] + (result.notes or [])
+                        )
+                    
+                    chunk = result.text
+                    
+                except Exception as error:
+                    processed.append(chunk)
+                    return GateResult(
+                        ok=False,
+                        text=f"Gate {gate_name} error: {str(error)}",
+                        notes=[f"Gate: {gate_name}", f"Error: {error}"]
+                    )
+            
+            processed.append(chunk)
+        
+        return GateResult(
+            ok=True,
+            text='\n'.join(processed),
+            notes=['All gates passed successfully']
+        )
 
 
 # Default gate implementations (stubs for testing)
-class StubIntegrityLinter(GateAdapter):
+class StubIntegrityLinter(ChunkedGateAdapter):
     """Stub implementation of integrity linter gate"""
     
     async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
         # Stub implementation - always passes
         return GateResult(ok=True, text=text, notes=['Stub: integrity check passed'])
+    
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        return await self.run(chunk, ctx)
 
 
-class StubPlainLanguageRewriter(GateAdapter):
+class StubPlainLanguageRewriter(ChunkedGateAdapter):
     """Stub implementation of plain language rewriter gate"""
     
     async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
         # Stub implementation - always passes
         return GateResult(ok=True, text=text, notes=['Stub: language rewrite passed'])
+    
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        return await self.run(chunk, ctx)
 
 
-class StubStonesAlignmentFilter(GateAdapter):
+class StubStonesAlignmentFilter(ChunkedGateAdapter):
     """Stub implementation of stones alignment filter gate"""
     
     async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
         # Stub implementation - always passes
         return GateResult(ok=True, text=text, notes=['Stub: stones alignment passed'])
+    
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        return await self.run(chunk, ctx)
 
 
-class StubCoherenceGate(GateAdapter):
+class StubCoherenceGate(ChunkedGateAdapter):
     """Stub implementation of coherence gate"""
     
     async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
         # Stub implementation - always passes
         return GateResult(ok=True, text=text, notes=['Stub: coherence check passed'])
+    
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        return await self.run(chunk, ctx)
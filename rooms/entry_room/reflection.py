@@ -3,10 +3,22 @@ Reflection Module
 Implements Faithful Reflection theme from Entry Room Protocol
 """
 
-from typing import List, Any
+import json
+from typing import List, Any, Iterator, Tuple
 from .types import ReflectionPolicy
 
 
+TRUNCATION_POLICIES = ("truncate", "decline")
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when a reflected payload exceeds the cap under the decline policy"""
+    
+    def __init__(self, max_chars: int):
+        super().__init__(f"Input exceeds {max_chars} characters")
+        self.max_chars = max_chars
+
+
 class VerbatimReflection(ReflectionPolicy):
     """
     Reflects input exactly without interpretation or distortion.
@@ -58,3 +70,116 @@ class VerbatimReflection(ReflectionPolicy):
             ideas.extend(self._split_multiple_ideas(json_str))
         
         return ideas
+
+
+class StreamingReflection(VerbatimReflection):
+    """
+    Reflects input lazily, one line at a time, for very large payloads.
+    Lines are grouped into chunks of about chunk_chars characters so the
+    gate chain can consume them without a full list of lines in memory.
+    At most max_chars characters of input are reflected: the "truncate"
+    policy drops the rest and appends a truncation notice, "decline"
+    raises PayloadTooLargeError.
+    """
+    
+    def __init__(
+        self,
+        max_chars: int = 1_000_000,
+        chunk_chars: int = 64 * 1024,
+        truncation: str = "truncate"
+    ):
+        if truncation not in TRUNCATION_POLICIES:
+            raise ValueError(f"Unknown truncation policy: {truncation}")
+        if max_chars < 1 or chunk_chars < 1:
+            raise ValueError("max_chars and chunk_chars must be at least 1")
+        self.max_chars = max_chars
+        self.chunk_chars = chunk_chars
+        self.truncation = truncation
+    
+    def reflect_verbatim(self, payload: Any) -> List[str]:
+        """Reflects input exactly, applying the size cap"""
+        return list(self.iter_lines(payload))
+    
+    def iter_lines(self, payload: Any) -> Iterator[str]:
+        """Yield reflected lines lazily, applying the size cap"""
+        text, overflow = self._bounded_text(payload)
+        if overflow and self.truncation == "decline":
+            raise PayloadTooLargeError(self.max_chars)
+        
+        yield from self._iter_split_lines(text, min(len(text), self.max_chars))
+        if overflow:
+            yield self.truncation_notice()
+    
+    def iter_chunks(self, payload: Any) -> Iterator[str]:
+        """Yield reflected text in newline-joined chunks of about chunk_chars"""
+        buffer: List[str] = []
+        size = 0
+        for line in self.iter_lines(payload):
+            if buffer and size + len(line) > self.chunk_chars:
+                yield '\n'.join(buffer)
+                buffer = []
+                size = 0
+            buffer.append(line)
+            size += len(line) + 1
+        # An empty reflection still produces one (empty) chunk
+        yield '\n'.join(buffer)
+    
+    def truncation_notice(self) -> str:
+        return f"[Input truncated at {self.max_chars} characters]"
+    
+    def _bounded_text(self, payload: Any) -> Tuple[str, bool]:
+        """
+        Get the text to reflect without reading far past the cap.
+        Returns: (text, exceeds_max_chars)
+        """
+        if payload is None:
+            return 'No input provided', False
+        
+        if isinstance(payload, dict):
+            for key in ('text', 'message', 'content'):
+                if isinstance(payload.get(key), str):
+                    payload = payload[key]
+                    break
+        
+        if isinstance(payload, str):
+            return payload, len(payload) > self.max_chars
+        
+        if isinstance(payload, (dict, list, tuple)):
+            # Encode incrementally instead of str() on the whole structure
+            pieces = json.JSONEncoder(ensure_ascii=False, default=str).iterencode(payload)
+        else:
+            pieces = iter((str(payload),))
+        
+        collected: List[str] = []
+        size = 0
+        for piece in pieces:
+            collected.append(piece)
+            size += len(piece)
+            if size > self.max_chars:
+                break
+        return ''.join(collected), size > self.max_chars
+    
+    def _iter_split_lines(self, text: str, end: int) -> Iterator[str]:
+        """
+        Yield stripped, non-empty lines of text[:end], splitting one window of
+        about chunk_chars at a time instead of the whole text.
+        Matches _split_multiple_ideas: blank input yields a single empty line.
+        """
+        emitted = False
+        start = 0
+        while start < end:
+            window_end = min(start + self.chunk_chars, end)
+            if window_end < end:
+                # Extend the window to the next line break so no line is split
+                newline = text.find('\n', window_end, end)
+                window_end = end if newline == -1 else newline
+            
+            for line in text[start:window_end].split('\n'):
+                line = line.strip()
+                if line:
+                    emitted = True
+                    yield line
+            start = window_end + 1
+        
+        if not emitted:
+            yield ''
@@ -6,20 +6,24 @@ Tests all behavioral invariants and edge cases using pytest
 import pytest
 import asyncio
 from typing import List, Dict, Any
-from entry_room.types import (
+from rooms.entry_room.types import (
     EntryRoomInput,
     EntryRoomOutput,
     PaceState,
     GateResult,
-    EntryRoomContext
+    EntryRoomContext,
+    RegenerationPolicy,
+    ChunkedGateAdapter
 )
-from entry_room.entry_room import EntryRoom, EntryRoomConfig, run_entry_room
-from entry_room.reflection import VerbatimReflection
-from entry_room.gates import GateChainConfig
-from entry_room.pace import PacePolicy
-from entry_room.consent import ConsentPolicy
-from entry_room.diagnostics import DiagnosticsPolicy
-from entry_room.completion import CompletionPolicy
+from rooms.entry_room.entry_room import EntryRoom, EntryRoomConfig, get_entry_room, run_entry_room
+from rooms.entry_room.reflection import VerbatimReflection, StreamingReflection, PayloadTooLargeError
+from rooms.entry_room.gates import GateChainConfig, StubIntegrityLinter
+from rooms.entry_room.pace import PacePolicy
+from rooms.entry_room.consent import ConsentPolicy
+from rooms.entry_room.diagnostics import DiagnosticsPolicy
+from rooms.entry_room.completion import CompletionPolicy
+from rooms.entry_room.fallback import GateFailurePolicy, NoRegeneration
+from rooms.refusals import get_refusal_library
 
 
 # Mock implementations for testing
@@ -549,3 +553,352 @@ class TestRunEntryRoomFunction:
         result = await run_entry_room(input_data, config)
         
         assert '[CUSTOM MARKER]' in result.display_text
+
+
+class TestSharedEntryRoom:
+    """Test suite for the process-wide room and per-request context"""
+    
+    def test_default_room_is_reused(self):
+        """Test that get_entry_room returns one room without a config"""
+        assert get_entry_room() is get_entry_room()
+    
+    def test_config_builds_new_room(self):
+        """Test that a custom config never returns the shared room"""
+        room = get_entry_room(EntryRoomConfig(diagnostics_default=False))
+        assert room is not get_entry_room()
+        assert room.diagnostics_default is False
+    
+    @pytest.mark.asyncio
+    async def test_one_context_per_request(self):
+        """Test that every stage sees the same context, updated in place"""
+        seen = []
+        
+        class RecordingGate(MockGateAdapter):
+            async def run(self, text, ctx):
+                seen.append(('gate', id(ctx), dict(ctx)))
+                return await super().run(text, ctx)
+        
+        class RecordingPace(MockPacePolicy):
+            async def apply_pace_gate(self, ctx):
+                seen.append(('pace', id(ctx.__dict__), dict(ctx.__dict__)))
+                return 'HOLD'
+        
+        class RecordingConsent(MockConsentPolicy):
+            async def enforce_consent(self, ctx):
+                seen.append(('consent', id(ctx.__dict__), dict(ctx.__dict__)))
+                return 'YES'
+        
+        diagnostics = MockDiagnosticsPolicy()
+        room = EntryRoom(EntryRoomConfig(
+            gates=GateChainConfig(*(RecordingGate(name) for name in ('a', 'b', 'c', 'd'))),
+            pace=RecordingPace(),
+            consent=RecordingConsent(),
+            diagnostics=diagnostics
+        ))
+        
+        await room.run_entry_room(EntryRoomInput(session_state_ref='ctx-test', payload='Hello'))
+        
+        assert len({ctx_id for _, ctx_id, _ in seen}) == 1
+        assert [stage for stage, _, _ in seen] == ['gate'] * 4 + ['pace', 'consent']
+        assert seen[0][2]['pace_state'] == 'NOW'
+        assert seen[0][2]['consent_granted'] is False
+        assert seen[-1][2]['pace_state'] == 'HOLD'
+        interim = diagnostics.captured_diagnostics[0]['interim']
+        assert id(interim.__dict__) == seen[0][1]
+        assert interim.consent_granted is True
+        assert interim.diagnostics_enabled is True
+    
+    @pytest.mark.asyncio
+    async def test_shared_room_isolates_concurrent_requests(self):
+        """Test that concurrent requests on the shared room keep their own context"""
+        room = EntryRoom(EntryRoomConfig(consent=MockConsentPolicy('YES'), diagnostics=MockDiagnosticsPolicy()))
+        inputs = [EntryRoomInput(session_state_ref=f's{i}', payload=f'idea {i}') for i in range(20)]
+        
+        results = await asyncio.gather(*(room.run_entry_room(item) for item in inputs))
+        
+        session_ids = [record['interim'].session_id for record in room.diagnostics_policy.captured_diagnostics]
+        assert sorted(session_ids) == sorted(item.session_state_ref for item in inputs)
+        for i, result in enumerate(results):
+            assert f'idea {i}' in result.display_text
+
+
+class TestAsyncEntryRoom:
+    """Test suite for the room protocol entry points"""
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_run_entry_room(self):
+        """Test that run returns what run_entry_room returns"""
+        room = EntryRoom()
+        input_data = EntryRoomInput(session_state_ref='async-test', payload='Hello')
+        
+        assert await room.run(input_data) == await room.run_entry_room(input_data)
+    
+    def test_sync_wrapper(self):
+        """Test that the sync wrapper runs the room without an event loop"""
+        room = EntryRoom(EntryRoomConfig(consent=MockConsentPolicy('YES'), completion=MockCompletionPolicy()))
+        
+        result = room.run_entry_room_sync(EntryRoomInput(session_state_ref='sync-test', payload='Hello'))
+        
+        assert result.display_text == 'Hello\n[✓ TEST COMPLETE]'
+        assert result.next_action == 'continue'
+
+
+class TestStreamingReflection:
+    """Test suite for streaming reflection of large payloads"""
+    
+    def setup_method(self):
+        self.verbatim = VerbatimReflection()
+    
+    @pytest.mark.parametrize('payload', [
+        'Single idea',
+        '  padded idea  ',
+        'First\n\n  Second  \nThird\n',
+        '\n\n',
+        '',
+        None,
+        {'text': 'a\nb'},
+        {'message': 'm'},
+        42
+    ])
+    def test_matches_verbatim_reflection(self, payload):
+        """Test that streaming lines match verbatim reflection under the cap"""
+        assert StreamingReflection().reflect_verbatim(payload) == self.verbatim.reflect_verbatim(payload)
+    
+    def test_lines_are_lazy(self):
+        """Test that lines are produced one at a time"""
+        lines = StreamingReflection().iter_lines('one\ntwo\nthree')
+        assert next(lines) == 'one'
+        assert list(lines) == ['two', 'three']
+    
+    def test_chunks_join_to_reflected_text(self):
+        """Test that chunks respect chunk_chars and rejoin to the full text"""
+        payload = '\n'.join(f'line {i}' for i in range(1000))
+        reflection = StreamingReflection(chunk_chars=100)
+        chunks = list(reflection.iter_chunks(payload))
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert '\n'.join(chunks) == '\n'.join(self.verbatim.reflect_verbatim(payload))
+    
+    def test_truncate_policy(self):
+        """Test that oversized input is cut at max_chars with a notice"""
+        reflection = StreamingReflection(max_chars=10)
+        lines = reflection.reflect_verbatim('abcdef\nghijklmnop')
+        assert lines == ['abcdef', 'ghi', '[Input truncated at 10 characters]']
+    
+    def test_decline_policy(self):
+        """Test that oversized input raises under the decline policy"""
+        reflection = StreamingReflection(max_chars=10, truncation='decline')
+        with pytest.raises(PayloadTooLargeError):
+            reflection.reflect_verbatim('x' * 11)
+        assert reflection.reflect_verbatim('x' * 10) == ['x' * 10]
+    
+    def test_object_payload_encoded_within_cap(self):
+        """Test that arbitrary objects are encoded incrementally and capped"""
+        reflection = StreamingReflection(max_chars=50)
+        lines = reflection.reflect_verbatim({'items': list(range(100000))})
+        assert lines[0].startswith('{"items": [0, 1, 2')
+        assert len(lines[0]) == 50
+        assert lines[-1] == '[Input truncated at 50 characters]'
+    
+    def test_invalid_policy(self):
+        """Test that unknown truncation policies are rejected"""
+        with pytest.raises(ValueError):
+            StreamingReflection(truncation='ignore')
+    
+    @pytest.mark.asyncio
+    async def test_room_streams_chunks_through_gates(self):
+        """Test that the room feeds chunks through chunk-capable gates"""
+        seen_chunks = []
+        
+        class RecordingGate(StubIntegrityLinter):
+            async def run_chunk(self, chunk, ctx):
+                seen_chunks.append(chunk)
+                return await super().run_chunk(chunk, ctx)
+        
+        payload = '\n'.join(f'idea {i}' for i in range(200))
+        room = EntryRoom(EntryRoomConfig(
+            reflection=StreamingReflection(chunk_chars=64),
+            gates=GateChainConfig(RecordingGate(), StubIntegrityLinter(), StubIntegrityLinter(), StubIntegrityLinter()),
+            consent=MockConsentPolicy('YES'),
+            completion=MockCompletionPolicy()
+        ))
+        
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='stream', payload=payload))
+        
+        assert len(seen_chunks) > 1
+        assert result.display_text == payload + '\n[✓ TEST COMPLETE]'
+        assert result.next_action == 'continue'
+    
+    @pytest.mark.asyncio
+    async def test_room_falls_back_for_whole_text_gates(self):
+        """Test that gates without chunk support receive the joined text"""
+        room = EntryRoom(EntryRoomConfig(
+            reflection=StreamingReflection(chunk_chars=4),
+            gates=GateChainConfig(*(MockGateAdapter(name) for name in ('a', 'b', 'c', 'd'))),
+            consent=MockConsentPolicy('YES'),
+            completion=MockCompletionPolicy()
+        ))
+        
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='fallback', payload='one\ntwo\nthree'))
+        
+        assert result.display_text == 'one\ntwo\nthree\n[✓ TEST COMPLETE]'
+    
+    @pytest.mark.asyncio
+    async def test_room_declines_oversized_input(self):
+        """Test that the decline policy returns a hold instead of an error"""
+        room = EntryRoom(EntryRoomConfig(
+            reflection=StreamingReflection(max_chars=5, truncation='decline'),
+            consent=MockConsentPolicy('YES')
+        ))
+        
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='big', payload='x' * 100))
+        
+        assert result.next_action == 'hold'
+        assert 'exceeds 5 characters' in result.display_text
+
+
+class BlockingGateAdapter(MockGateAdapter):
+    """Mock gate adapter that fails any text containing a blocked word"""
+    
+    def __init__(self, name: str, blocked: str):
+        super().__init__(name)
+        self.blocked = blocked
+    
+    async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
+        if self.blocked in text:
+            return GateResult(ok=False, text=f"Gate {self.name} failed", notes=[f"Blocked {self.blocked}"])
+        return GateResult(ok=True, text=text, notes=[])
+
+
+class ChunkedBlockingGate(ChunkedGateAdapter):
+    """Chunk-capable gate that fails any text containing a blocked word"""
+    
+    def __init__(self, blocked: str = None):
+        self.blocked = blocked
+    
+    async def run(self, text: str, ctx: Dict[str, Any]) -> GateResult:
+        return await self.run_chunk(text, ctx)
+    
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        if self.blocked and self.blocked in chunk:
+            return GateResult(ok=False, text="Chunk blocked", notes=[f"Blocked {self.blocked}"])
+        return GateResult(ok=True, text=chunk, notes=[])
+
+
+class MockRegeneration(RegenerationPolicy):
+    """Mock regeneration policy returning a fixed rewrite after an optional delay"""
+    
+    def __init__(self, rewrite: str = None, delay: float = 0):
+        self.rewrite = rewrite
+        self.delay = delay
+        self.calls = 0
+        self.texts = []
+    
+    async def regenerate(self, text: str, failure: GateResult, ctx: EntryRoomContext) -> str:
+        self.calls += 1
+        self.texts.append(text)
+        await asyncio.sleep(self.delay)
+        return self.rewrite
+
+
+class TestGateFailureFallback:
+    """Test regeneration and refusal-library fallback on gate failure"""
+    
+    def _room(self, policy: GateFailurePolicy, blocked: str = 'secret') -> EntryRoom:
+        return EntryRoom(EntryRoomConfig(
+            gates=GateChainConfig(
+                integrity_linter=MockGateAdapter('integrity_linter'),
+                plain_language_rewriter=MockGateAdapter('plain_language_rewriter'),
+                stones_alignment_filter=BlockingGateAdapter('stones_alignment_filter', blocked),
+                coherence_gate=MockGateAdapter('coherence_gate')
+            ),
+            consent=MockConsentPolicy('YES'),
+            completion=MockCompletionPolicy(),
+            gate_failure=policy
+        ))
+    
+    @pytest.mark.asyncio
+    async def test_regenerated_text_continues(self):
+        """Test that a regeneration passing the gates replaces the failed text"""
+        regeneration = MockRegeneration('a safe idea')
+        room = self._room(GateFailurePolicy(regeneration))
+        
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='regen', payload='a secret idea'))
+        
+        assert regeneration.calls == 1
+        assert result.display_text == 'a safe idea\n[✓ TEST COMPLETE]'
+        assert result.next_action == 'continue'
+    
+    @pytest.mark.asyncio
+    async def test_streamed_regeneration_reuses_gated_chunks(self):
+        """Test that regeneration gets the chunks read so far instead of reflecting the payload again"""
+        regeneration = MockRegeneration('a safe idea')
+        reflection = StreamingReflection(chunk_chars=4)
+        room = EntryRoom(EntryRoomConfig(
+            reflection=reflection,
+            gates=GateChainConfig(
+                integrity_linter=ChunkedBlockingGate(),
+                plain_language_rewriter=ChunkedBlockingGate(),
+                stones_alignment_filter=ChunkedBlockingGate('secret'),
+                coherence_gate=ChunkedBlockingGate()
+            ),
+            consent=MockConsentPolicy('YES'),
+            completion=MockCompletionPolicy(),
+            gate_failure=GateFailurePolicy(regeneration)
+        ))
+        reflection.reflect_verbatim = None
+        
+        result = await room.run_entry_room(
+            EntryRoomInput(session_state_ref='regen-stream', payload='one\ntwo secret\nthree\nfour')
+        )
+        
+        assert regeneration.texts == ['one\ntwo secret']
+        assert result.display_text == 'a safe idea\n[✓ TEST COMPLETE]'
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_refusal(self):
+        """Test that a failed regeneration holds with the gate's refusal text"""
+        library = get_refusal_library()
+        room = self._room(GateFailurePolicy(MockRegeneration('still secret')))
+        
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='refuse', payload='a secret idea'))
+        
+        assert result.next_action == 'hold'
+        assert result.display_text == library.refuse('not_us')['refusal_text']
+    
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_regeneration(self):
+        """Test that a slow regeneration is abandoned for the refusal at the deadline"""
+        room = self._room(GateFailurePolicy(MockRegeneration('a safe idea', delay=1), deadline=0.05))
+        
+        start = asyncio.get_running_loop().time()
+        result = await room.run_entry_room(EntryRoomInput(session_state_ref='slow', payload='a secret idea'))
+        
+        assert asyncio.get_running_loop().time() - start < 0.5
+        assert result.next_action == 'hold'
+        assert result.display_text == get_refusal_library().refuse('not_us')['refusal_text']
+    
+    @pytest.mark.asyncio
+    async def test_prepare_prerenders_refusals(self):
+        """Test that prepare() renders every refusal style through the gate chain"""
+        room = self._room(GateFailurePolicy())
+        
+        await room.prepare()
+        
+        assert set(room.gate_failure._rendered) == set(room.gate_failure.policy.refusal_styles)
+    
+    def test_refusal_mode_mapping(self):
+        """Test that failing gates and gate errors map to refusal modes"""
+        policy = GateFailurePolicy()
+        
+        assert policy.refusal_mode(GateResult(ok=False, text='', notes=['Gate: stones_alignment_filter'])) == 'not_us'
+        assert policy.refusal_mode(GateResult(ok=False, text='', notes=['Gate: coherence_gate'])) == 'not_like_this'
+        assert policy.refusal_mode(GateResult(ok=False, text='', notes=['Gate: coherence_gate', 'Error: boom'])) == 'not_now'
+    
+    def test_policy_from_orchestrator_contract(self):
+        """Test that the policy reads on_gate_failure from the orchestrator contract"""
+        policy = GateFailurePolicy.from_orchestrator_contract()
+        
+        assert policy.regenerate_attempts == 1
+        assert policy.refusal_styles == ['not_now', 'not_like_this', 'not_us']
+        assert isinstance(policy.regeneration, NoRegeneration)
@@ -64,6 +64,15 @@ class GateAdapter(ABC):
         pass
 
 
+class ChunkedGateAdapter(GateAdapter):
+    """Gate that can also process reflected text one chunk at a time"""
+    
+    @abstractmethod
+    async def run_chunk(self, chunk: str, ctx: Dict[str, Any]) -> GateResult:
+        """Run the gate on a single chunk of text"""
+        pass
+
+
 class PacePolicy(ABC):
     """Abstract base class for pace policies"""
     
@@ -112,3 +121,12 @@ class ReflectionPolicy(ABC):
     def reflect_verbatim(self, payload: Any) -> List[str]:
         """Reflect input exactly without interpretation"""
         pass
+
+
+class RegenerationPolicy(ABC):
+    """Abstract base class for regenerating text that failed the gate chain"""
+    
+    @abstractmethod
+    async def regenerate(self, text: str, failure: GateResult, ctx: EntryRoomContext) -> Optional[str]:
+        """Produce a new candidate for text given the gate failure, or None to give up"""
+        pass
@@ -4,6 +4,7 @@ Implements the Exit Room Protocol and Contract for Lichen Protocol Room Architec
 """
 
 from .exit_room import ExitRoom, run_exit_room
+from .sweeper import IdleSessionSweeper
 from .contract_types import (
     ExitRoomInput,
     ExitRoomOutput,
@@ -20,6 +21,7 @@ from .contract_types import (
 __all__ = [
     'ExitRoom',
     'run_exit_room',
+    'IdleSessionSweeper',
     'ExitRoomInput',
     'ExitRoomOutput',
     'ExitReason',
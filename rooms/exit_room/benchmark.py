@@ -0,0 +1,82 @@
+"""
+Exit Room Benchmark
+Measures exits per second for sessions carrying large session_data
+
+The baseline is the default exit path, which commits only metadata about
+the session's buffers. The move path hands the buffers to the commit data,
+and the encode column adds serializing them with encode_commit_record, the
+cost a store pays when it persists buffer contents.
+
+Run with: python -m rooms.exit_room.benchmark
+"""
+
+import time
+from .exit_room import ExitRoom
+from .contract_types import ExitRoomInput, ExitDiagnostics, ExitReason
+from .memory_commit import MemoryCommit
+
+
+EXIT_PAYLOAD = {"completion_confirmed": True, "session_goals_met": True}
+
+
+def _make_session_data(item_count: int) -> dict:
+    """Build session data with item_count entries of nested values"""
+    return {
+        f"item_{i}": {"text": "x" * 64, "values": list(range(8)), "index": i}
+        for i in range(item_count)
+    }
+
+
+def _load_session(room: ExitRoom, session_ref: str, session_data: dict):
+    session_state = room._get_or_create_session(session_ref)
+    session_state.session_data = session_data
+    session_state.temporary_buffers = {"scratch": bytearray(4096)}
+
+
+def bench_exits(item_count: int, exits: int, move_session_buffers: bool, encode: bool = False) -> float:
+    """
+    Return exits per second.
+    encode also serializes the moved buffers once per exit.
+    """
+    room = ExitRoom(move_session_buffers=move_session_buffers)
+    template = _make_session_data(item_count)
+    datasets = [dict(template) for _ in range(exits)]
+    diagnostics = ExitDiagnostics(
+        session_id="bench",
+        exit_reason=ExitReason.NORMAL_COMPLETION,
+        completion_satisfied=True,
+        diagnostics_captured=True,
+        memory_committed=False,
+        state_reset=False
+    )
+
+    elapsed = 0.0
+    for i, session_data in enumerate(datasets):
+        session_ref = f"bench_{i}"
+        _load_session(room, session_ref, session_data)
+        session_state = room.sessions[session_ref]
+
+        start = time.perf_counter()
+        if encode:
+            commit_data = MemoryCommit.prepare_memory_commit(session_state, diagnostics, move_buffers=True)
+            MemoryCommit.encode_commit_record(commit_data)
+            MemoryCommit.restore_moved_buffers(commit_data, session_state)
+        room.process_exit(ExitRoomInput(session_state_ref=session_ref, payload=EXIT_PAYLOAD))
+        elapsed += time.perf_counter() - start
+
+    return exits / elapsed if elapsed > 0 else float("inf")
+
+
+def run_benchmark(sizes=(100, 1000, 10000), exits: int = 50):
+    """Print exits per second for each session_data size"""
+    print("=== Exit Room Benchmark (exits/sec) ===")
+    print(f"{'items':>8} {'metadata only':>14} {'move':>14} {'move+encode':>14}")
+    for item_count in sizes:
+        metadata_only = bench_exits(item_count, exits, move_session_buffers=False)
+        moved = bench_exits(item_count, exits, move_session_buffers=True)
+        encoded = bench_exits(item_count, exits, move_session_buffers=True, encode=True)
+        print(f"{item_count:>8} {metadata_only:>14.1f} {moved:>14.1f} {encoded:>14.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
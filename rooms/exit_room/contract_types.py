@@ -1,9 +1,14 @@
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Literal
 from enum import Enum
 from datetime import datetime
 
 
+# Error messages kept in ExitRoomState.errors
+ERROR_LOG_LIMIT = 100
+
+
 class ExitReason(Enum):
     """Reasons for session exit"""
     NORMAL_COMPLETION = "normal_completion"
@@ -44,6 +49,9 @@ class MemoryCommitData:
     closure_flag: bool = True
     final_state_snapshot: Optional[Dict[str, Any]] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    # Buffers moved out of the session (ownership transfer, not copies)
+    moved_temporary_buffers: Optional[Dict[str, Any]] = None
+    moved_session_data: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -69,7 +77,16 @@ class ExitRoomState:
     memory_committed: bool = False
     state_reset: bool = False
     exit_diagnostics: Optional[ExitDiagnostics] = None
-    errors: List[str] = field(default_factory=list)
+    # Most recent error messages only; error_count keeps the running total
+    errors: deque = field(default_factory=lambda: deque(maxlen=ERROR_LOG_LIMIT))
+    error_count: int = 0
+    # Sessions evicted after their final state could not be committed
+    sessions_lost: int = 0
+
+    def record_error(self, message: str):
+        """Append to the bounded error log and count it"""
+        self.errors.append(message)
+        self.error_count += 1
 
 
 # Decline response structure
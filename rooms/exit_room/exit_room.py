@@ -1,4 +1,6 @@
-from typing import Dict, Any, Optional, List
+import heapq
+import itertools
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from .contract_types import (
     ExitRoomInput, ExitRoomOutput, ExitRoomState, SessionState,
@@ -13,10 +15,32 @@ from .reset import StateReset
 class ExitRoom:
     """Main orchestrator for the Exit Room"""
     
-    def __init__(self):
+    def __init__(self, move_session_buffers: bool = False, max_abort_attempts: int = 3):
         """Initialize the Exit Room"""
         self.room_state = ExitRoomState()
+        # Hand session buffers to the commit data so their contents can be
+        # persisted; off by default, when only their metadata is committed
+        self.move_session_buffers = move_session_buffers
         self.sessions: Dict[str, SessionState] = {}
+        
+        # Min-heap of (last_accessed, tie_breaker, session_ref). Entries go
+        # stale when a session is touched again and are skipped when popped.
+        self._idle_heap: List[Tuple[float, int, str]] = []
+        self._heap_counter = itertools.count()
+        # Sessions reset by a successful exit, awaiting eviction
+        self._reset_session_refs: List[str] = []
+        # Idle aborts that failed before committing, retried on the next sweep
+        self.max_abort_attempts = max_abort_attempts
+        self._abort_attempts: Dict[str, int] = {}
+        self._abort_retry_refs: List[str] = []
+    
+    async def run(self, input_data: ExitRoomInput) -> ExitRoomOutput:
+        """
+        Async room protocol entry point.
+        Exit processing is in-memory, so it runs inline on the event loop,
+        in step with the idle sweeper.
+        """
+        return self.process_exit(input_data)
     
     def process_exit(
         self,
@@ -53,6 +77,7 @@ class ExitRoom:
             reset_result = self._reset_session_state(session_state, diagnostics_result["diagnostics"])
             if not reset_result["success"]:
                 return self._create_error_output(reset_result["message"])
+            self._reset_session_refs.append(input_data.session_state_ref)
             
             # Create success output
             return self._create_success_output(
@@ -82,9 +107,138 @@ class ExitRoom:
         else:
             # Update last accessed
             self.sessions[session_ref].last_accessed = datetime.now()
+            # Back in use, so no longer a pending idle abort
+            self._abort_attempts.pop(session_ref, None)
         
+        self._track_access(self.sessions[session_ref])
         return self.sessions[session_ref]
     
+    def _track_access(self, session_state: SessionState):
+        """Record the session's latest access in the idle heap"""
+        heapq.heappush(
+            self._idle_heap,
+            (session_state.last_accessed.timestamp(), next(self._heap_counter), session_state.session_id)
+        )
+        
+        # Drop stale entries once they dominate the heap
+        if len(self._idle_heap) > 2 * len(self.sessions) + 64:
+            self._idle_heap = [
+                (timestamp, counter, session_ref)
+                for timestamp, counter, session_ref in self._idle_heap
+                if self._is_current_entry(timestamp, session_ref)
+            ]
+            heapq.heapify(self._idle_heap)
+    
+    def _is_current_entry(self, timestamp: float, session_ref: str) -> bool:
+        """Check that a heap entry still reflects the session's last access"""
+        session_state = self.sessions.get(session_ref)
+        return session_state is not None and session_state.last_accessed.timestamp() == timestamp
+    
+    def pop_idle_sessions(self, idle_before: datetime, limit: int) -> List[str]:
+        """
+        Pop up to limit sessions whose last access is older than idle_before.
+        Only the expired prefix of the heap is visited.
+        """
+        cutoff = idle_before.timestamp()
+        idle_refs = []
+        
+        while self._idle_heap and len(idle_refs) < limit:
+            timestamp, _, session_ref = self._idle_heap[0]
+            if timestamp >= cutoff:
+                break
+            heapq.heappop(self._idle_heap)
+            if self._is_current_entry(timestamp, session_ref):
+                idle_refs.append(session_ref)
+        
+        return idle_refs
+    
+    def pop_reset_sessions(self, limit: int) -> List[str]:
+        """Pop up to limit sessions that were reset by a completed exit"""
+        reset_refs = self._reset_session_refs[:limit]
+        del self._reset_session_refs[:limit]
+        return reset_refs
+    
+    def requeue_failed_aborts(self) -> int:
+        """
+        Make sessions whose idle abort failed eligible for the next pop.
+        Returns the number of sessions requeued.
+        """
+        requeued = 0
+        for session_ref in self._abort_retry_refs:
+            session_state = self.sessions.get(session_ref)
+            # Skip sessions evicted or touched again since the failure
+            if session_state is not None and session_ref in self._abort_attempts:
+                self._track_access(session_state)
+                requeued += 1
+        self._abort_retry_refs = []
+        return requeued
+    
+    def abort_session(self, session_ref: str) -> bool:
+        """
+        Close a session as aborted without user input, then evict it.
+        Runs the same completion → diagnostics → memory commit → reset pipeline.
+        Returns True if every step succeeded. A session whose final state was
+        not committed is kept for retry, up to max_abort_attempts times.
+        """
+        session_state = self.sessions.get(session_ref)
+        if session_state is None:
+            return False
+        
+        payload = {"exit_reason": ExitReason.ABORTED.value, "abort_cause": "idle_timeout"}
+        
+        completion_result = self._enforce_completion(session_state, payload)
+        if not completion_result["success"]:
+            return self._record_abort_failure(session_ref, completion_result["message"], committed=False)
+        
+        diagnostics_result = self._capture_diagnostics(session_state, payload)
+        if not diagnostics_result["success"]:
+            return self._record_abort_failure(session_ref, diagnostics_result["message"], committed=False)
+        
+        memory_result = self._commit_to_memory(session_state, diagnostics_result["diagnostics"], payload)
+        if not memory_result["success"]:
+            return self._record_abort_failure(session_ref, memory_result["message"], committed=False)
+        
+        reset_result = self._reset_session_state(session_state, diagnostics_result["diagnostics"])
+        if not reset_result["success"]:
+            return self._record_abort_failure(session_ref, reset_result["message"], committed=True)
+        
+        self.evict_session(session_ref)
+        return True
+    
+    def _record_abort_failure(self, session_ref: str, message: str, committed: bool) -> bool:
+        """
+        Record why an idle session could not be aborted cleanly.
+        Once its final state is committed the session is evicted regardless.
+        Otherwise it is kept and retried until max_abort_attempts is reached,
+        then evicted and counted in sessions_lost.
+        """
+        if committed:
+            self.room_state.record_error(f"Idle abort failed for {session_ref}: {message}")
+            self.evict_session(session_ref)
+            return False
+        
+        attempts = self._abort_attempts.get(session_ref, 0) + 1
+        if attempts < self.max_abort_attempts:
+            self._abort_attempts[session_ref] = attempts
+            self._abort_retry_refs.append(session_ref)
+            self.room_state.record_error(
+                f"Idle abort failed for {session_ref} (attempt {attempts}, will retry): {message}"
+            )
+            return False
+        
+        self.room_state.sessions_lost += 1
+        self.room_state.record_error(
+            f"Idle abort failed for {session_ref} after {attempts} attempts, "
+            f"session evicted without committing: {message}"
+        )
+        self.evict_session(session_ref)
+        return False
+    
+    def evict_session(self, session_ref: str) -> bool:
+        """Remove a session from memory; its heap entries become stale"""
+        self._abort_attempts.pop(session_ref, None)
+        return self.sessions.pop(session_ref, None) is not None
+    
     def _enforce_completion(
         self,
         session_state: SessionState,
@@ -157,12 +311,13 @@ class ExitRoom:
         """Commit exit data to memory"""
         # Prepare memory commit data
         commit_data = MemoryCommit.prepare_memory_commit(
-            session_state, diagnostics, payload
+            session_state, diagnostics, payload, move_buffers=self.move_session_buffers
         )
         
         # Validate commit data
         is_valid, decline = MemoryCommit.validate_memory_commit(commit_data)
         if not is_valid:
+            MemoryCommit.restore_moved_buffers(commit_data, session_state)
             return {
                 "success": False,
                 "message": decline.message if decline else "Memory commit validation failed"
@@ -171,6 +326,7 @@ class ExitRoom:
         # Execute memory commit
         success, error_message = MemoryCommit.execute_memory_commit(commit_data)
         if not success:
+            MemoryCommit.restore_moved_buffers(commit_data, session_state)
             return {
                 "success": False,
                 "message": f"Memory commit failed: {error_message}"
@@ -287,7 +443,9 @@ class ExitRoom:
             "state_reset": self.room_state.state_reset,
             "active_sessions": len([s for s in self.sessions.values() if s.is_active]),
             "total_sessions": len(self.sessions),
-            "errors": self.room_state.errors
+            "errors": list(self.room_state.errors),
+            "error_count": self.room_state.error_count,
+            "sessions_lost": self.room_state.sessions_lost
         }
     
     def get_session_status(self, session_ref: str) -> Optional[Dict[str, Any]]:
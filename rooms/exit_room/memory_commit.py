@@ -1,9 +1,46 @@
+import base64
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 from .contract_types import (
     ExitReason, ExitDiagnostics, MemoryCommitData, SessionState,
     DeclineReason, DeclineResponse, ExitOperationResult
 )
+from .. import json_codec
+
+
+# Commit record format tag (first byte of an encoded record)
+RECORD_FORMAT_JSON = b"J"
+# Marks a JSON object standing in for a value JSON has no type for
+RECORD_TYPE_KEY = "__commit_type__"
+
+
+def _encode_typed_value(value: Any) -> Dict[str, Any]:
+    """json default hook: tag the non-JSON values a session buffer may hold"""
+    if isinstance(value, bytearray):
+        return {RECORD_TYPE_KEY: "bytearray", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, bytes):
+        return {RECORD_TYPE_KEY: "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, datetime):
+        return {RECORD_TYPE_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {RECORD_TYPE_KEY: "set", "value": list(value)}
+    raise TypeError(f"Cannot encode {type(value).__name__} in a commit record")
+
+
+def _decode_typed_value(obj: Dict[str, Any]) -> Any:
+    """json object hook: restore values tagged by _encode_typed_value"""
+    value_type = obj.get(RECORD_TYPE_KEY)
+    if value_type is None:
+        return obj
+    if value_type == "bytearray":
+        return bytearray(base64.b64decode(obj["value"]))
+    if value_type == "bytes":
+        return base64.b64decode(obj["value"])
+    if value_type == "datetime":
+        return datetime.fromisoformat(obj["value"])
+    if value_type == "set":
+        return set(obj["value"])
+    raise ValueError(f"Unknown commit record value type: {value_type!r}")
 
 
 class MemoryCommit:
@@ -13,17 +50,24 @@ class MemoryCommit:
     def prepare_memory_commit(
         session_state: SessionState,
         exit_diagnostics: ExitDiagnostics,
-        payload: Optional[Dict[str, Any]] = None
+        payload: Optional[Dict[str, Any]] = None,
+        move_buffers: bool = False
     ) -> MemoryCommitData:
         """
         Prepare data for memory commit.
         Returns structured data ready for atomic write.
+        With move_buffers, the session's buffers and data are handed over to
+        the commit data and the session gets fresh empty dicts (no copying).
         """
         # Create final state snapshot
         final_state_snapshot = MemoryCommit._create_final_state_snapshot(
             session_state, exit_diagnostics, payload
         )
         
+        moved_buffers, moved_data = None, None
+        if move_buffers:
+            moved_buffers, moved_data = MemoryCommit._move_session_buffers(session_state)
+        
         # Create memory commit data
         commit_data = MemoryCommitData(
             session_id=session_state.session_id,
@@ -31,11 +75,52 @@ class MemoryCommit:
             diagnostics=exit_diagnostics,
             closure_flag=True,  # Always set closure flag
             final_state_snapshot=final_state_snapshot,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            moved_temporary_buffers=moved_buffers,
+            moved_session_data=moved_data
         )
         
         return commit_data
     
+    @staticmethod
+    def restore_moved_buffers(commit_data: MemoryCommitData, session_state: SessionState) -> None:
+        """Hand moved buffers back to the session after a failed commit"""
+        if commit_data.moved_temporary_buffers is not None:
+            session_state.temporary_buffers = commit_data.moved_temporary_buffers
+            commit_data.moved_temporary_buffers = None
+        if commit_data.moved_session_data is not None:
+            session_state.session_data = commit_data.moved_session_data
+            commit_data.moved_session_data = None
+    
+    @staticmethod
+    def encode_commit_record(commit_data: MemoryCommitData) -> bytes:
+        """
+        Serialize the snapshot and moved buffers into a compact JSON record.
+        Called on demand by whoever stores the record, not on every exit.
+        bytes, bytearray, datetime and set values are tagged so they decode
+        to the same type; tuples decode as lists. Other values raise TypeError.
+        """
+        record = {
+            "session_id": commit_data.session_id,
+            "exit_reason": commit_data.exit_reason.value,
+            "closure_flag": commit_data.closure_flag,
+            "timestamp": commit_data.timestamp.isoformat(),
+            "final_state_snapshot": commit_data.final_state_snapshot,
+            "temporary_buffers": commit_data.moved_temporary_buffers,
+            "session_data": commit_data.moved_session_data
+        }
+        return RECORD_FORMAT_JSON + json_codec.dumps_bytes(
+            record, ensure_ascii=False, default=_encode_typed_value
+        )
+    
+    @staticmethod
+    def decode_commit_record(encoded_record: bytes) -> Dict[str, Any]:
+        """Decode a record produced by encode_commit_record"""
+        record_format, body = encoded_record[:1], encoded_record[1:]
+        if record_format != RECORD_FORMAT_JSON:
+            raise ValueError(f"Unknown commit record format: {record_format!r}")
+        return json_codec.loads(body, object_hook=_decode_typed_value)
+    
     @staticmethod
     def execute_memory_commit(
         commit_data: MemoryCommitData
@@ -188,6 +273,17 @@ class MemoryCommit:
         
         return snapshot
     
+    @staticmethod
+    def _move_session_buffers(
+        session_state: SessionState
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Take ownership of the session's buffers, leaving empty ones behind"""
+        moved_buffers = session_state.temporary_buffers
+        moved_data = session_state.session_data
+        session_state.temporary_buffers = {}
+        session_state.session_data = {}
+        return moved_buffers, moved_data
+    
     @staticmethod
     def _write_to_memory(commit_data: MemoryCommitData) -> bool:
         """
@@ -198,7 +294,8 @@ class MemoryCommit:
         # This is a deterministic simulation - no heuristics
         try:
             # Simulate successful write
-            # In reality, this would call the Memory Room's interface
+            # In reality, this would hand the commit data to the Memory Room,
+            # which encodes it with encode_commit_record if it persists buffers
             return True
         except Exception:
             return False
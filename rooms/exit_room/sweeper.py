@@ -0,0 +1,109 @@
+import asyncio
+from typing import Dict, Any, Optional, Callable
+from datetime import datetime, timedelta
+from .exit_room import ExitRoom
+
+
+class IdleSessionSweeper:
+    """
+    Background sweeper that closes idle sessions and evicts reset ones.
+
+    Idle sessions (no access for idle_ttl seconds) are run through the exit
+    pipeline with ExitReason.ABORTED and evicted. Sessions whose abort failed
+    before their state was committed are retried on the following sweeps. Sessions already reset by a
+    completed exit are evicted without re-running the pipeline. Work is done
+    in batches of batch_size, yielding to the event loop between batches.
+    """
+
+    def __init__(
+        self,
+        room: ExitRoom,
+        idle_ttl: float = 1800.0,
+        interval: float = 60.0,
+        batch_size: int = 100,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        self.room = room
+        self.idle_ttl = idle_ttl
+        self.interval = interval
+        self.batch_size = batch_size
+        self.clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self.totals = {"aborted": 0, "abort_failures": 0, "evicted_reset": 0, "sweeps": 0, "sweep_failures": 0}
+
+    async def sweep(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Run one sweep over every expired and reset session"""
+        idle_before = (now or self.clock()) - timedelta(seconds=self.idle_ttl)
+        result = {"aborted": 0, "abort_failures": 0, "evicted_reset": 0}
+        # Failures from earlier sweeps only; this sweep's failures wait for the next
+        self.room.requeue_failed_aborts()
+
+        while True:
+            reset_refs = self.room.pop_reset_sessions(self.batch_size)
+            for session_ref in reset_refs:
+                session_state = self.room.sessions.get(session_ref)
+                # A reset session that was re-entered since is no longer ours to evict
+                if session_state is not None and not session_state.is_active:
+                    self.room.evict_session(session_ref)
+                    result["evicted_reset"] += 1
+
+            idle_refs = self.room.pop_idle_sessions(idle_before, self.batch_size)
+            for session_ref in idle_refs:
+                if self.room.abort_session(session_ref):
+                    result["aborted"] += 1
+                else:
+                    result["abort_failures"] += 1
+
+            if not reset_refs and not idle_refs:
+                break
+
+            # Let request handlers run between batches
+            await asyncio.sleep(0)
+
+        for key, value in result.items():
+            self.totals[key] += value
+        self.totals["sweeps"] += 1
+        return result
+
+    def start(self) -> asyncio.Task:
+        """Start sweeping in a background task on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        """Cancel the background task and wait for it to finish"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cumulative sweeper statistics"""
+        return {
+            "idle_ttl": self.idle_ttl,
+            "interval": self.interval,
+            "batch_size": self.batch_size,
+            "running": self.is_running,
+            "tracked_sessions": len(self.room.sessions),
+            "sessions_lost": self.room.room_state.sessions_lost,
+            **self.totals
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                # Keep sweeping; a single bad sweep must not stop eviction
+                self.totals["sweep_failures"] += 1
+                self.room.room_state.record_error(f"Idle sweep failed: {str(e)}")
+            await asyncio.sleep(self.interval)
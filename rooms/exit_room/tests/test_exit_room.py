@@ -3,9 +3,12 @@ Exit Room Test Suite
 Comprehensive testing for all Exit Room functionality
 """
 
+import asyncio
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from rooms.exit_room.exit_room import ExitRoom, run_exit_room
+from rooms.exit_room.sweeper import IdleSessionSweeper
+from rooms.room_protocol import AsyncRoom
 from rooms.exit_room.contract_types import (
     ExitRoomInput, ExitRoomOutput, ExitReason, ExitDiagnostics,
     MemoryCommitData, SessionState, ExitRoomState, DeclineReason,
@@ -384,6 +387,123 @@ class TestMemoryCommit:
         assert commit_data.diagnostics.memory_committed is True
 
 
+class TestMoveSnapshot:
+    """Test copy-free transfer of session buffers into the commit record"""
+    
+    def _diagnostics(self):
+        return ExitDiagnostics(
+            session_id="test_session",
+            exit_reason=ExitReason.NORMAL_COMPLETION,
+            completion_satisfied=True,
+            diagnostics_captured=True,
+            memory_committed=False,
+            state_reset=False
+        )
+    
+    def test_move_transfers_ownership(self):
+        """Test that buffers are moved, not copied"""
+        session = SessionState(session_id="test_session")
+        session_data = {"notes": ["a", "b"]}
+        buffers = {"scratch": bytearray(16)}
+        session.session_data = session_data
+        session.temporary_buffers = buffers
+        
+        commit_data = MemoryCommit.prepare_memory_commit(
+            session, self._diagnostics(), None, move_buffers=True
+        )
+        
+        assert commit_data.moved_session_data is session_data
+        assert commit_data.moved_temporary_buffers is buffers
+        assert session.session_data == {}
+        assert session.temporary_buffers == {}
+        assert commit_data.final_state_snapshot["session_data_count"] == 1
+    
+    def test_encoded_record_roundtrip(self):
+        """Test that the commit record carries the moved session data"""
+        session = SessionState(session_id="test_session", session_data={"k": {"v": 1}})
+        commit_data = MemoryCommit.prepare_memory_commit(
+            session, self._diagnostics(), None, move_buffers=True
+        )
+        
+        record = MemoryCommit.decode_commit_record(MemoryCommit.encode_commit_record(commit_data))
+        
+        assert record["session_data"] == {"k": {"v": 1}}
+        assert record["exit_reason"] == "normal_completion"
+    
+    def test_typed_values_keep_their_type(self):
+        """Test that non-JSON buffer values decode to the type they were"""
+        stamp = datetime(2025, 1, 2, 3, 4, 5)
+        session = SessionState(
+            session_id="test_session",
+            session_data={"when": stamp, "tags": {"a"}, "raw": b"\x00\xff"},
+            temporary_buffers={"scratch": bytearray(b"abc")}
+        )
+        commit_data = MemoryCommit.prepare_memory_commit(
+            session, self._diagnostics(), None, move_buffers=True
+        )
+        
+        record = MemoryCommit.decode_commit_record(MemoryCommit.encode_commit_record(commit_data))
+        
+        assert record["session_data"] == {"when": stamp, "tags": {"a"}, "raw": b"\x00\xff"}
+        assert record["temporary_buffers"]["scratch"] == bytearray(b"abc")
+        assert isinstance(record["temporary_buffers"]["scratch"], bytearray)
+    
+    def test_unsupported_values_rejected(self):
+        """Test that values with no safe encoding raise instead of being stringified"""
+        session = SessionState(session_id="test_session", session_data={"fn": lambda: None})
+        commit_data = MemoryCommit.prepare_memory_commit(
+            session, self._diagnostics(), None, move_buffers=True
+        )
+        
+        with pytest.raises(TypeError):
+            MemoryCommit.encode_commit_record(commit_data)
+    
+    def test_unknown_record_format_rejected(self):
+        """Test that records in another format are never deserialized"""
+        with pytest.raises(ValueError):
+            MemoryCommit.decode_commit_record(b"P\x80\x05N.")
+    
+    def test_failed_commit_restores_buffers(self):
+        """Test that moved buffers are handed back when the commit fails"""
+        session = SessionState(session_id="test_session", session_data={"k": 1})
+        commit_data = MemoryCommit.prepare_memory_commit(
+            session, self._diagnostics(), None, move_buffers=True
+        )
+        
+        MemoryCommit.restore_moved_buffers(commit_data, session)
+        
+        assert session.session_data == {"k": 1}
+        assert commit_data.moved_session_data is None
+    
+    def test_exit_room_commits_metadata_by_default(self):
+        """Test that the default exit leaves buffers in place for the reset"""
+        room = ExitRoom()
+        session = room._get_or_create_session("test_session")
+        session_data = {"k": 1}
+        session.session_data = session_data
+        
+        commit_result = room._commit_to_memory(session, self._diagnostics())
+        
+        assert commit_result["success"] is True
+        assert commit_result["commit_data"].moved_session_data is None
+        assert session.session_data is session_data
+    
+    def test_exit_room_moves_session_data(self):
+        """Test that a full exit commits the session data without copying"""
+        room = ExitRoom(move_session_buffers=True)
+        session = room._get_or_create_session("test_session")
+        session.session_data = {"k": 1}
+        
+        result = room.process_exit(ExitRoomInput(
+            session_state_ref="test_session",
+            payload={"completion_confirmed": True, "session_goals_met": True}
+        ))
+        
+        assert "Session Successfully Terminated" in result.display_text
+        assert room.sessions["test_session"].session_data == {}
+        assert "Session Data Items: 1" in result.display_text
+
+
 class TestStateReset:
     """Test state reset functionality"""
     
@@ -660,6 +780,152 @@ class TestExitRoomIntegration:
         assert "Session Successfully Terminated" in result.display_text
 
 
+class TestAsyncExitRoom:
+    """Test the async room protocol entry point"""
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_sync_entry_point(self):
+        """Test that run conforms to AsyncRoom and returns what process_exit returns"""
+        room = ExitRoom()
+        payload = {"completion_confirmed": True, "session_goals_met": True}
+        
+        assert isinstance(room, AsyncRoom)
+        result = await room.run(ExitRoomInput(session_state_ref="async_session", payload=payload))
+        expected = ExitRoom().process_exit(ExitRoomInput(session_state_ref="async_session", payload=payload))
+        
+        assert result.next_action == expected.next_action == "continue"
+        assert "Session Successfully Terminated" in result.display_text
+
+
+class TestIdleSessionSweeper:
+    """Test background eviction of idle and reset sessions"""
+    
+    def _open_session(self, room, session_ref, accessed_at):
+        session_state = room._get_or_create_session(session_ref)
+        session_state.last_accessed = accessed_at
+        room._track_access(session_state)
+        return session_state
+    
+    @pytest.mark.asyncio
+    async def test_idle_sessions_aborted_and_evicted(self):
+        """Test that sessions idle past the TTL are aborted and evicted"""
+        room = ExitRoom()
+        now = datetime.now()
+        self._open_session(room, "idle", now - timedelta(hours=2))
+        self._open_session(room, "fresh", now - timedelta(seconds=10))
+        
+        sweeper = IdleSessionSweeper(room, idle_ttl=600)
+        result = await sweeper.sweep(now=now)
+        
+        assert result["aborted"] == 1
+        assert "idle" not in room.sessions
+        assert "fresh" in room.sessions
+        assert room.room_state.exit_diagnostics.exit_reason == ExitReason.ABORTED
+    
+    @pytest.mark.asyncio
+    async def test_touched_session_not_evicted(self):
+        """Test that a later access supersedes the stale heap entry"""
+        room = ExitRoom()
+        now = datetime.now()
+        self._open_session(room, "session", now - timedelta(hours=2))
+        self._open_session(room, "session", now)
+        
+        result = await IdleSessionSweeper(room, idle_ttl=600).sweep(now=now)
+        
+        assert result["aborted"] == 0
+        assert "session" in room.sessions
+    
+    @pytest.mark.asyncio
+    async def test_reset_sessions_evicted(self):
+        """Test that sessions reset by a completed exit are evicted"""
+        room = ExitRoom()
+        room.process_exit(ExitRoomInput(
+            session_state_ref="done",
+            payload={"completion_confirmed": True, "session_goals_met": True}
+        ))
+        assert "done" in room.sessions
+        
+        result = await IdleSessionSweeper(room).sweep()
+        
+        assert result["evicted_reset"] == 1
+        assert room.get_room_status()["total_sessions"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_sweep_processes_in_batches(self):
+        """Test that all expired sessions are processed across batches"""
+        room = ExitRoom()
+        now = datetime.now()
+        for i in range(25):
+            self._open_session(room, f"session-{i}", now - timedelta(hours=1, seconds=i))
+        
+        result = await IdleSessionSweeper(room, idle_ttl=60, batch_size=10).sweep(now=now)
+        
+        assert result["aborted"] == 25
+        assert room.sessions == {}
+    
+    @pytest.mark.asyncio
+    async def test_failed_commit_keeps_session_for_retry(self, monkeypatch):
+        """Test that a session whose commit failed is retried on the next sweep"""
+        room = ExitRoom()
+        now = datetime.now()
+        self._open_session(room, "idle", now - timedelta(hours=2))
+        sweeper = IdleSessionSweeper(room, idle_ttl=600)
+        
+        monkeypatch.setattr(MemoryCommit, "_write_to_memory", staticmethod(lambda commit_data: False))
+        result = await sweeper.sweep(now=now)
+        assert result["abort_failures"] == 1
+        assert "idle" in room.sessions
+        
+        monkeypatch.undo()
+        result = await sweeper.sweep(now=now)
+        assert result["aborted"] == 1
+        assert "idle" not in room.sessions
+        assert room.room_state.sessions_lost == 0
+    
+    @pytest.mark.asyncio
+    async def test_repeated_commit_failure_reports_loss(self, monkeypatch):
+        """Test that a session is evicted and counted as lost after max attempts"""
+        room = ExitRoom(max_abort_attempts=2)
+        now = datetime.now()
+        self._open_session(room, "idle", now - timedelta(hours=2))
+        sweeper = IdleSessionSweeper(room, idle_ttl=600)
+        monkeypatch.setattr(MemoryCommit, "_write_to_memory", staticmethod(lambda commit_data: False))
+        
+        await sweeper.sweep(now=now)
+        await sweeper.sweep(now=now)
+        
+        assert "idle" not in room.sessions
+        assert room.room_state.sessions_lost == 1
+        assert sweeper.get_statistics()["sessions_lost"] == 1
+        assert "without committing" in room.room_state.errors[-1]
+    
+    def test_error_log_is_bounded(self):
+        """Test that the room keeps only recent errors but counts them all"""
+        room_state = ExitRoomState()
+        for i in range(500):
+            room_state.record_error(f"error {i}")
+        
+        assert len(room_state.errors) == room_state.errors.maxlen
+        assert room_state.errors[-1] == "error 499"
+        assert room_state.error_count == 500
+    
+    @pytest.mark.asyncio
+    async def test_background_task_start_stop(self):
+        """Test that the sweeper runs as a background asyncio task"""
+        room = ExitRoom()
+        self._open_session(room, "idle", datetime.now() - timedelta(hours=2))
+        
+        sweeper = IdleSessionSweeper(room, idle_ttl=60, interval=0.01)
+        sweeper.start()
+        await asyncio.sleep(0.05)
+        assert sweeper.is_running
+        await sweeper.stop()
+        
+        assert not sweeper.is_running
+        assert "idle" not in room.sessions
+        assert sweeper.get_statistics()["sweeps"] >= 1
+
+
 class TestExitRoomEdgeCases:
     """Test Exit Room edge cases and error conditions"""
     
@@ -1,48 +1,106 @@
 """
 Rooms Module Index
 Exports all room implementations and utilities
+
+Exports resolve lazily (PEP 562): importing this module loads no room
+code, and each name imports its module on first access. Names of the form
+run_<room_id> are looked up in the room registry built from the contracts.
 """
 
-# Entry Room
-from .entry_room import EntryRoom, run_entry_room, EntryRoomConfig
+import importlib
+from typing import Any, List
 
-# Entry Room Components
-from .entry_room.reflection import VerbatimReflection
-from .entry_room.gates import GateChain, GateChainConfig
-from .entry_room.pace import DefaultPacePolicy, SimplePacePolicy, AdaptivePacePolicy
-from .entry_room.consent import DefaultConsentPolicy, ExplicitConsentPolicy, GraduatedConsentPolicy
-from .entry_room.diagnostics import DefaultDiagnosticsPolicy, MinimalDiagnosticsPolicy, VerboseDiagnosticsPolicy
-from .entry_room.completion import DefaultCompletionPolicy, MinimalCompletionPolicy, VerboseCompletionPolicy, CustomCompletionPolicy
+from .registry import get_room_registry
 
-# Types
-from .entry_room.types import (
-    EntryRoomInput,
-    EntryRoomOutput,
-    EntryRoomContext,
-    PaceState,
-    GateResult,
-    DiagnosticRecord,
-    GateAdapter,
-    PacePolicy,
-    ConsentPolicy,
-    DiagnosticsPolicy,
-    CompletionPolicy,
-    ReflectionPolicy
-)
+# Exported name -> submodule of this package that defines it
+_EXPORTS = {
+    # Entry Room
+    'EntryRoom': '.entry_room.entry_room',
+    'get_entry_room': '.entry_room.entry_room',
+    'run_entry_room': '.entry_room.entry_room',
+    'EntryRoomConfig': '.entry_room.entry_room',
+    
+    # Entry Room Components
+    'VerbatimReflection': '.entry_room.reflection',
+    'StreamingReflection': '.entry_room.reflection',
+    'PayloadTooLargeError': '.entry_room.reflection',
+    'GateChain': '.entry_room.gates',
+    'GateChainConfig': '.entry_room.gates',
+    'DefaultPacePolicy': '.entry_room.pace',
+    'SimplePacePolicy': '.entry_room.pace',
+    'AdaptivePacePolicy': '.entry_room.pace',
+    'DefaultConsentPolicy': '.entry_room.consent',
+    'ExplicitConsentPolicy': '.entry_room.consent',
+    'GraduatedConsentPolicy': '.entry_room.consent',
+    'DefaultDiagnosticsPolicy': '.entry_room.diagnostics',
+    'MinimalDiagnosticsPolicy': '.entry_room.diagnostics',
+    'VerboseDiagnosticsPolicy': '.entry_room.diagnostics',
+    'DefaultCompletionPolicy': '.entry_room.completion',
+    'MinimalCompletionPolicy': '.entry_room.completion',
+    'VerboseCompletionPolicy': '.entry_room.completion',
+    'CustomCompletionPolicy': '.entry_room.completion',
+    
+    # Types
+    'EntryRoomInput': '.entry_room.types',
+    'EntryRoomOutput': '.entry_room.types',
+    'EntryRoomContext': '.entry_room.types',
+    'PaceState': '.entry_room.types',
+    'GateResult': '.entry_room.types',
+    'DiagnosticRecord': '.entry_room.types',
+    'GateAdapter': '.entry_room.types',
+    'ChunkedGateAdapter': '.entry_room.types',
+    'PacePolicy': '.entry_room.types',
+    'ConsentPolicy': '.entry_room.types',
+    'DiagnosticsPolicy': '.entry_room.types',
+    'CompletionPolicy': '.entry_room.types',
+    'ReflectionPolicy': '.entry_room.types',
+    
+    # Utilities
+    'pace_state_to_next_action': '.entry_room.pace',
+    'generate_consent_request': '.entry_room.consent',
+    'is_consent_required': '.entry_room.consent',
+    'has_completion_marker': '.entry_room.completion',
+    'remove_completion_markers': '.entry_room.completion',
+    
+    # Room registry
+    'RoomRegistry': '.registry',
+    'RoomEntry': '.registry',
+    'get_room_registry': '.registry',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __package__), name)
+    elif name.startswith('run_') and get_room_registry().get_entry(name[len('run_'):]) is not None:
+        try:
+            value = get_room_registry().resolve(name[len('run_'):])
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}: {e}") from e
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Utilities
-from .entry_room.pace import pace_state_to_next_action
-from .entry_room.consent import generate_consent_request, is_consent_required
-from .entry_room.completion import has_completion_marker, remove_completion_markers
 
 __all__ = [
     # Entry Room
     'EntryRoom',
+    'get_entry_room',
     'run_entry_room',
     'EntryRoomConfig',
     
     # Entry Room Components
     'VerbatimReflection',
+    'StreamingReflection',
+    'PayloadTooLargeError',
     'GateChain',
     'GateChainConfig',
     'DefaultPacePolicy',
@@ -67,6 +125,7 @@ __all__ = [
     'GateResult',
     'DiagnosticRecord',
     'GateAdapter',
+    'ChunkedGateAdapter',
     'PacePolicy',
     'ConsentPolicy',
     'DiagnosticsPolicy',
@@ -78,5 +137,10 @@ __all__ = [
     'generate_consent_request',
     'is_consent_required',
     'has_completion_marker',
-    'remove_completion_markers'
+    'remove_completion_markers',
+    
+    # Room registry
+    'RoomRegistry',
+    'RoomEntry',
+    'get_room_registry'
 ]
@@ -11,7 +11,8 @@ from .contract_types import (
     Commitment,
     PaceState,
     MemoryWriteResult,
-    DeclineReason
+    DeclineReason,
+    BulkCommitmentResult
 )
 
 __all__ = [
@@ -23,5 +24,6 @@ __all__ = [
     'Commitment',
     'PaceState',
     'MemoryWriteResult',
-    'DeclineReason'
+    'DeclineReason',
+    'BulkCommitmentResult'
 ]
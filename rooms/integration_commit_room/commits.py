@@ -1,5 +1,21 @@
+from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
-from .contract_types import Commitment, PaceState, DeclineReason, DeclineResponse
+from .contract_types import Commitment, PaceState, DeclineReason, DeclineResponse, BulkCommitmentResult
+
+
+# Enum members resolved once instead of per commitment
+PACE_STATES_BY_VALUE: Dict[str, PaceState] = {state.value: state for state in PaceState}
+REQUIRED_COMMITMENT_FIELDS = ("text", "context", "pace_state", "session_ref")
+INVALID_PACE_STATE_MESSAGE = f"Invalid pace_state. Must be one of: {', '.join(PACE_STATES_BY_VALUE)}"
+
+
+def resolve_pace_state(value: Any) -> Optional[PaceState]:
+    """Resolve a pace_state value to its enum member, or None if invalid"""
+    if isinstance(value, PaceState):
+        return value
+    if isinstance(value, str):
+        return PACE_STATES_BY_VALUE.get(value)
+    return None
 
 
 class CommitRecording:
@@ -79,53 +95,92 @@ class CommitRecording:
         Validate a single commitment item.
         Returns: (is_valid, commitment_object, error_message)
         """
-        if not isinstance(commit_data, dict):
-            return False, None, "Commitment must be a dictionary"
+        commitment, errors = CommitRecording._build_commitment(commit_data, index)
+        if errors:
+            return False, None, errors[0]
+        return True, commitment, None
+    
+    @staticmethod
+    def validate_commitments_bulk(
+        payloads: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> List[BulkCommitmentResult]:
+        """
+        Validate many sessions' commitment payloads in one call.
+        Unlike validate_commitment_structure, every error of every item is
+        collected, and all commitments in the batch share one timestamp.
+        """
+        timestamp = timestamp or datetime.now()
+        results = []
         
-        # Check required fields
-        required_fields = ["text", "context", "pace_state", "session_ref"]
-        missing_fields = []
+        for session_id, payload in payloads.items():
+            result = BulkCommitmentResult(session_id=session_id)
+            results.append(result)
+            
+            commitments_data = payload.get("commitments") if isinstance(payload, dict) else None
+            if not isinstance(commitments_data, list) or not commitments_data:
+                result.errors.append("Payload must include a non-empty 'commitments' list")
+                continue
+            
+            for i, commit_data in enumerate(commitments_data):
+                commitment, errors = CommitRecording._build_commitment(commit_data, i, timestamp)
+                if errors:
+                    result.errors.extend(f"Commitment {i+1}: {error}" for error in errors)
+                elif not result.errors:
+                    result.commitments.append(commitment)
+            
+            if result.errors:
+                result.commitments = []
         
-        for field in required_fields:
-            if field not in commit_data:
-                missing_fields.append(field)
+        return results
+    
+    @staticmethod
+    def _build_commitment(
+        commit_data: Any,
+        index: int,
+        timestamp: Optional[datetime] = None
+    ) -> Tuple[Optional[Commitment], List[str]]:
+        """
+        Validate a single commitment item, collecting every error in field order.
+        Shared by the single and bulk paths; timestamp defaults to now.
+        Returns: (commitment_object_or_None, error_messages)
+        """
+        if not isinstance(commit_data, dict):
+            return None, ["Commitment must be a dictionary"]
         
+        missing_fields = [field for field in REQUIRED_COMMITMENT_FIELDS if field not in commit_data]
         if missing_fields:
-            return False, None, f"Missing required fields: {', '.join(missing_fields)}"
+            return None, [f"Missing required fields: {', '.join(missing_fields)}"]
+        
+        errors = []
         
-        # Validate text field
         text = commit_data["text"]
         if not text or not isinstance(text, str) or len(text.strip()) < 3:
-            return False, None, "Commitment text must be at least 3 characters"
+            errors.append("Commitment text must be at least 3 characters")
         
-        # Validate context field
         context = commit_data["context"]
         if not context or not isinstance(context, str) or len(context.strip()) < 2:
-            return False, None, "Commitment context must be at least 2 characters"
+            errors.append("Commitment context must be at least 2 characters")
         
-        # Validate pace_state field
-        pace_state_str = commit_data["pace_state"]
-        try:
-            pace_state = PaceState(pace_state_str)
-        except ValueError:
-            valid_states = [state.value for state in PaceState]
-            return False, None, f"Invalid pace_state. Must be one of: {', '.join(valid_states)}"
+        pace_state = resolve_pace_state(commit_data["pace_state"])
+        if pace_state is None:
+            errors.append(INVALID_PACE_STATE_MESSAGE)
         
-        # Validate session_ref field
         session_ref = commit_data["session_ref"]
         if not session_ref or not isinstance(session_ref, str):
-            return False, None, "Session reference must be a non-empty string"
+            errors.append("Session reference must be a non-empty string")
+        
+        if errors:
+            return None, errors
         
-        # Create commitment object
-        commitment = Commitment(
+        return Commitment(
             text=text.strip(),
             context=context.strip(),
             pace_state=pace_state,
             session_ref=session_ref,
+            timestamp=timestamp or datetime.now(),
             commitment_id=f"commit-{index}"
-        )
-        
-        return True, commitment, None
+        ), errors
     
     @staticmethod
     def format_commitments_summary(commitments: List[Commitment]) -> str:
@@ -171,7 +226,7 @@ class CommitRecording:
     @staticmethod
     def get_commitment_requirements() -> List[str]:
         """Get list of required commitment fields"""
-        return ["text", "context", "pace_state", "session_ref"]
+        return list(REQUIRED_COMMITMENT_FIELDS)
     
     @staticmethod
     def get_commitment_statistics(commitments: List[Commitment]) -> Dict[str, Any]:
@@ -87,3 +87,17 @@ class DeclineResponse:
     message: str
     details: Optional[str] = None
     required_fields: Optional[List[str]] = None
+
+
+@dataclass
+class BulkCommitmentResult:
+    """Per-session outcome of bulk commitment validation and ingestion"""
+    session_id: str
+    commitments: List[Commitment] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    integration_data: Optional[IntegrationData] = None
+    memory_written: bool = False
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
@@ -1,21 +1,38 @@
 from typing import Dict, Any, Optional, List
 from .contract_types import (
     IntegrationCommitRoomInput, IntegrationCommitRoomOutput, RoomState,
-    IntegrationData, Commitment, DeclineResponse
+    IntegrationData, Commitment, DeclineResponse, BulkCommitmentResult
 )
 from .integration import IntegrationEnforcement
 from .commits import CommitRecording
 from .pace import PaceEnforcement
 from .memory_write import MemoryWrite
 from .completion import Completion
+from ..room_protocol import SessionLocks, run_session_blocking
 
 
 class IntegrationCommitRoom:
     """Main orchestrator for Integration & Commit Room operations"""
     
-    def __init__(self):
+    def __init__(self, memory_write: Optional[MemoryWrite] = None):
         self.room_states: Dict[str, RoomState] = {}
-        self.memory_write = MemoryWrite()
+        self.memory_write = memory_write or MemoryWrite()
+        self._session_locks = SessionLocks()
+    
+    async def run(self, input_data: IntegrationCommitRoomInput) -> IntegrationCommitRoomOutput:
+        """
+        Async room protocol entry point.
+        With a write-ahead log the room blocks on fsync, so it runs on a
+        worker thread; concurrent sessions then share group commits.
+        """
+        if self.memory_write.wal is None:
+            return self.run_integration_commit_room(input_data)
+        return await run_session_blocking(
+            self._session_locks,
+            input_data.session_state_ref,
+            self.run_integration_commit_room,
+            input_data
+        )
     
     def run_integration_commit_room(self, input_data: IntegrationCommitRoomInput) -> IntegrationCommitRoomOutput:
         """
@@ -349,6 +366,46 @@ class IntegrationCommitRoom:
             next_action="continue"
         )
     
+    def ingest_commitments_bulk(self, payloads: Dict[str, Any]) -> List[BulkCommitmentResult]:
+        """
+        Validate and persist many sessions' integration and commitments in one call.
+        Each payload carries integration_notes, session_context and a commitments
+        list. Every error is reported per session; valid sessions are written
+        through MemoryWrite as a single batch.
+        """
+        results = CommitRecording.validate_commitments_bulk(payloads)
+        
+        for result in results:
+            payload = payloads[result.session_id]
+            try:
+                is_present, integration_data, decline = IntegrationEnforcement.validate_integration_presence(payload)
+                if not is_present:
+                    result.errors.insert(0, decline.message)
+                else:
+                    is_quality_valid, quality_decline = IntegrationEnforcement.validate_integration_quality(integration_data)
+                    if not is_quality_valid:
+                        result.errors.insert(0, quality_decline.message)
+                    else:
+                        result.integration_data = integration_data
+            except Exception as e:
+                # A malformed record declines on its own instead of aborting the batch
+                result.errors.insert(0, f"Integration validation failed: {str(e)}")
+            if result.errors:
+                result.commitments = []
+        
+        valid_results = [result for result in results if result.is_valid]
+        write_results = self.memory_write.write_batch([
+            (result.session_id, result.integration_data, result.commitments)
+            for result in valid_results
+        ])
+        
+        for result, write_result in zip(valid_results, write_results):
+            result.memory_written = write_result.success
+            if not write_result.success:
+                result.errors.append(write_result.error_details or write_result.reason)
+        
+        return results
+    
     def _get_or_create_room_state(self, session_id: str) -> RoomState:
         """Get existing room state or create new one"""
         if session_id not in self.room_states:
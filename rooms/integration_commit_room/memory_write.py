@@ -1,14 +1,64 @@
+import os
+import threading
+from collections import deque
 from typing import List, Optional, Dict, Any, Tuple
 from .contract_types import IntegrationData, Commitment, MemoryWriteResult, DeclineReason, DeclineResponse
+from .wal import WriteAheadLog
+from .. import json_codec
 
 
 class MemoryWrite:
     """Handles atomic writes to the Memory Room"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        wal_path: Optional[str] = None,
+        fsync: bool = True,
+        group_commit_window: float = 0.0,
+        history_limit: int = 10000,
+        history_spill_path: Optional[str] = None,
+        checkpoint_every: int = 1000
+    ):
         # In-memory storage for MVP (simulates Memory Room interface)
         self.memory_storage = {}
-        self.write_history = []
+        self._publish_lock = threading.Lock()
+        
+        # Global write history is a bounded ring buffer; records evicted from
+        # it are appended to history_spill_path (JSONL) when one is configured.
+        # The per-session index only holds records still in the ring, so it is
+        # bounded by history_limit and a session leaves it with its last record.
+        # Spilled records are indexed by their byte offset in the spill file
+        self.write_history: deque = deque(maxlen=history_limit)
+        self.history_spill_path = history_spill_path
+        self._history_by_session: Dict[str, deque] = {}
+        self._spill_offsets: Dict[str, List[int]] = {}
+        self._spill_size = 0
+        if history_spill_path:
+            self._index_spilled_history()
+        
+        # Running counters so statistics never scan storage or history
+        self._total_writes = 0
+        self._successful_writes = 0
+        self._total_commitments = 0
+        
+        # Optional durable backend: every successful write is made durable in
+        # the WAL before it becomes visible, and replayed on startup. Every
+        # checkpoint_every records the WAL is rotated and the applied state
+        # checkpointed on a background thread; writes only wait for the rotation
+        self.wal: Optional[WriteAheadLog] = None
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_error: Optional[str] = None
+        self._checkpoint_cond = threading.Condition()
+        self._writes_in_flight = 0
+        self._writes_blocked = False
+        self._checkpoint_thread: Optional[threading.Thread] = None
+        if wal_path:
+            self.wal = WriteAheadLog(wal_path, fsync=fsync, group_commit_window=group_commit_window)
+            state = self.wal.recover_checkpoint()
+            if state is not None:
+                self._restore(state)
+            for record in self.wal.recover():
+                self._publish(record["entry"], record["write_record"])
     
     def write_integration_and_commitments(
         self,
@@ -20,6 +70,18 @@ class MemoryWrite:
         Write integration and commitment data atomically to memory.
         If any part fails, nothing is persisted.
         """
+        self._begin_write()
+        try:
+            return self._write_one(session_id, integration_data, commitments)
+        finally:
+            self._end_write()
+    
+    def _write_one(
+        self,
+        session_id: str,
+        integration_data: IntegrationData,
+        commitments: List[Commitment]
+    ) -> MemoryWriteResult:
         try:
             # Validate inputs
             if not session_id:
@@ -43,41 +105,8 @@ class MemoryWrite:
                     error_details="commitments list cannot be empty"
                 )
             
-            # Prepare memory data
-            memory_data = {
-                "session_id": session_id,
-                "timestamp": integration_data.timestamp.isoformat(),
-                "integration": {
-                    "integration_notes": integration_data.integration_notes,
-                    "session_context": integration_data.session_context,
-                    "key_insights": integration_data.key_insights,
-                    "shifts_noted": integration_data.shifts_noted
-                },
-                "commitments": []
-            }
-            
-            # Prepare commitment data
-            for commitment in commitments:
-                commitment_data = {
-                    "text": commitment.text,
-                    "context": commitment.context,
-                    "pace_state": commitment.pace_state.value,
-                    "session_ref": commitment.session_ref,
-                    "timestamp": commitment.timestamp.isoformat(),
-                    "commitment_id": commitment.commitment_id
-                }
-                memory_data["commitments"].append(commitment_data)
-            
-            # Simulate atomic write (in-memory for MVP)
-            # In a real implementation, this would be a database transaction
-            
-            # Store in memory
-            if session_id not in self.memory_storage:
-                self.memory_storage[session_id] = []
-            
-            self.memory_storage[session_id].append(memory_data)
+            memory_data = self._build_memory_data(session_id, integration_data, commitments)
             
-            # Record write history
             write_record = {
                 "session_id": session_id,
                 "timestamp": integration_data.timestamp.isoformat(),
@@ -85,7 +114,13 @@ class MemoryWrite:
                 "commitments_written": len(commitments),
                 "success": True
             }
-            self.write_history.append(write_record)
+            
+            # Make the complete record durable first (group-committed with
+            # concurrent writers), then publish it in one step so a partial
+            # integration+commitments entry is never visible
+            if self.wal:
+                self.wal.append({"entry": memory_data, "write_record": write_record})
+            self._publish(memory_data, write_record)
             
             return MemoryWriteResult(
                 success=True,
@@ -107,7 +142,8 @@ class MemoryWrite:
                 "success": False,
                 "error": error_msg
             }
-            self.write_history.append(write_record)
+            with self._publish_lock:
+                self._record_history(write_record)
             
             return MemoryWriteResult(
                 success=False,
@@ -115,6 +151,294 @@ class MemoryWrite:
                 error_details=error_msg
             )
     
+    def write_batch(
+        self,
+        entries: List[Tuple[str, IntegrationData, List[Commitment]]]
+    ) -> List[MemoryWriteResult]:
+        """
+        Write many sessions' integration and commitments in one batch.
+        Each entry stays atomic on its own; durable entries share one WAL
+        flush and are published under a single lock acquisition.
+        """
+        self._begin_write()
+        try:
+            return self._write_batch(entries)
+        finally:
+            self._end_write()
+    
+    def _write_batch(
+        self,
+        entries: List[Tuple[str, IntegrationData, List[Commitment]]]
+    ) -> List[MemoryWriteResult]:
+        results: List[Optional[MemoryWriteResult]] = []
+        prepared = []
+        
+        for session_id, integration_data, commitments in entries:
+            if not session_id or not integration_data or not commitments:
+                results.append(MemoryWriteResult(
+                    success=False,
+                    reason="Session ID, integration data and commitments are required for memory write",
+                    error_details=f"Incomplete batch entry for session '{session_id}'"
+                ))
+                continue
+            
+            memory_data = self._build_memory_data(session_id, integration_data, commitments)
+            write_record = {
+                "session_id": session_id,
+                "timestamp": memory_data["timestamp"],
+                "integration_written": True,
+                "commitments_written": len(commitments),
+                "success": True
+            }
+            prepared.append((len(results), memory_data, write_record))
+            results.append(None)
+        
+        try:
+            if self.wal and prepared:
+                self.wal.append_many([
+                    {"entry": memory_data, "write_record": write_record}
+                    for _, memory_data, write_record in prepared
+                ])
+        except Exception as e:
+            error_msg = f"Memory write failed: {str(e)}"
+            with self._publish_lock:
+                for index, memory_data, write_record in prepared:
+                    self._record_history({
+                        **write_record,
+                        "integration_written": False,
+                        "commitments_written": 0,
+                        "success": False,
+                        "error": error_msg
+                    })
+                    results[index] = MemoryWriteResult(
+                        success=False,
+                        reason="Memory write operation failed",
+                        error_details=error_msg
+                    )
+            return results
+        
+        with self._publish_lock:
+            for index, memory_data, write_record in prepared:
+                self._store_entry(memory_data, write_record)
+                results[index] = MemoryWriteResult(
+                    success=True,
+                    reason=f"Successfully wrote integration and {len(memory_data['commitments'])} commitments to memory",
+                    integration_written=True,
+                    commitments_written=len(memory_data["commitments"])
+                )
+        
+        return results
+    
+    def _begin_write(self):
+        """Register a write that may reach the WAL, waiting out a WAL rotation or clear"""
+        if not self.wal:
+            return
+        with self._checkpoint_cond:
+            while self._writes_blocked:
+                self._checkpoint_cond.wait()
+            self._writes_in_flight += 1
+    
+    def _end_write(self):
+        """Finish a write and checkpoint once enough records have accumulated"""
+        if not self.wal:
+            return
+        with self._checkpoint_cond:
+            self._writes_in_flight -= 1
+            if not self._writes_in_flight:
+                self._checkpoint_cond.notify_all()
+        if self.checkpoint_every and self.wal.records_since_checkpoint >= self.checkpoint_every:
+            self.checkpoint(wait=False)
+    
+    def checkpoint(self, wait: bool = True):
+        """
+        Save the applied state to the WAL checkpoint and drop the log it covers.
+        Writes are held back only while in-flight ones finish and the WAL is
+        rotated; the state is serialized on a background thread. wait blocks
+        until it is saved and raises RuntimeError if saving failed. Without
+        wait, nothing happens while another checkpoint is still running.
+        """
+        if not self.wal:
+            return
+        with self._checkpoint_cond:
+            if self._checkpoint_thread and not wait:
+                return
+            while self._checkpoint_thread or self._writes_blocked:
+                self._checkpoint_cond.wait()
+            self._writes_blocked = True
+            try:
+                while self._writes_in_flight:
+                    self._checkpoint_cond.wait()
+                with self._publish_lock:
+                    snapshot = self._snapshot()
+                epoch = self.wal.rotate()
+                thread = threading.Thread(
+                    target=self._write_checkpoint,
+                    args=(epoch, snapshot),
+                    name="memory-write-checkpoint",
+                    daemon=True
+                )
+                self._checkpoint_thread = thread
+                thread.start()
+            finally:
+                self._writes_blocked = False
+                self._checkpoint_cond.notify_all()
+        
+        if wait:
+            thread.join()
+            if self.checkpoint_error:
+                raise RuntimeError(self.checkpoint_error)
+    
+    def _write_checkpoint(self, epoch: int, snapshot: Dict[str, Any]):
+        """Serialize a snapshot and save it as the checkpoint for a WAL rotation"""
+        try:
+            state = dict(snapshot, memory_storage={
+                session_id: entries[:count]
+                for session_id, (entries, count) in snapshot["memory_storage"].items()
+            })
+            self.wal.write_checkpoint(epoch, state)
+            self.checkpoint_error = None
+        except Exception as e:
+            # The sealed log segments stay and are replayed on recovery, so
+            # nothing is lost; the next checkpoint covers them
+            self.checkpoint_error = f"Checkpoint failed: {str(e)}"
+        finally:
+            with self._checkpoint_cond:
+                self._checkpoint_thread = None
+                self._checkpoint_cond.notify_all()
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Copy-on-write view of the applied state for a checkpoint (publish lock held).
+        Session entry lists are only ever appended to, so each is captured as
+        (list, length) and copied when the checkpoint is serialized.
+        """
+        return {
+            "memory_storage": {
+                session_id: (entries, len(entries))
+                for session_id, entries in self.memory_storage.items()
+            },
+            "write_history": list(self.write_history),
+            "total_writes": self._total_writes,
+            "successful_writes": self._successful_writes,
+            "total_commitments": self._total_commitments
+        }
+    
+    def _restore(self, state: Dict[str, Any]):
+        """Load the state saved by a WAL checkpoint"""
+        self.memory_storage = state["memory_storage"]
+        for write_record in state["write_history"]:
+            self.write_history.append(write_record)
+            self._history_by_session.setdefault(write_record["session_id"], deque()).append(write_record)
+        self._total_writes = state["total_writes"]
+        self._successful_writes = state["successful_writes"]
+        self._total_commitments = state["total_commitments"]
+    
+    @staticmethod
+    def _build_memory_data(
+        session_id: str,
+        integration_data: IntegrationData,
+        commitments: List[Commitment]
+    ) -> Dict[str, Any]:
+        """Prepare the memory entry for one integration+commitments write"""
+        return {
+            "session_id": session_id,
+            "timestamp": integration_data.timestamp.isoformat(),
+            "integration": {
+                "integration_notes": integration_data.integration_notes,
+                "session_context": integration_data.session_context,
+                "key_insights": integration_data.key_insights,
+                "shifts_noted": integration_data.shifts_noted
+            },
+            "commitments": [
+                {
+                    "text": commitment.text,
+                    "context": commitment.context,
+                    "pace_state": commitment.pace_state.value,
+                    "session_ref": commitment.session_ref,
+                    "timestamp": commitment.timestamp.isoformat(),
+                    "commitment_id": commitment.commitment_id
+                }
+                for commitment in commitments
+            ]
+        }
+    
+    def _publish(self, memory_data: Dict[str, Any], write_record: Dict[str, Any]):
+        """Make a fully prepared entry and its history record visible"""
+        with self._publish_lock:
+            self._store_entry(memory_data, write_record)
+    
+    def _store_entry(self, memory_data: Dict[str, Any], write_record: Dict[str, Any]):
+        """Store an entry and record its history (publish lock held)"""
+        self.memory_storage.setdefault(memory_data["session_id"], []).append(memory_data)
+        self._total_commitments += len(memory_data["commitments"])
+        self._record_history(write_record)
+    
+    def _record_history(self, write_record: Dict[str, Any]):
+        """Append to the global ring buffer and per-session index (publish lock held)"""
+        if len(self.write_history) == self.write_history.maxlen:
+            evicted = self.write_history[0]
+            if self.history_spill_path:
+                self._spill_history(evicted)
+            # The ring's oldest record is also the oldest of its session
+            evicted_history = self._history_by_session[evicted["session_id"]]
+            evicted_history.popleft()
+            if not evicted_history:
+                del self._history_by_session[evicted["session_id"]]
+        self.write_history.append(write_record)
+        self._history_by_session.setdefault(write_record["session_id"], deque()).append(write_record)
+        
+        self._total_writes += 1
+        if write_record.get("success", False):
+            self._successful_writes += 1
+    
+    def _spill_history(self, write_record: Dict[str, Any]):
+        """Persist a record that is about to fall out of the ring buffer (publish lock held)"""
+        line = (json_codec.dumps(write_record, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.history_spill_path, "ab") as spill_file:
+            offset = spill_file.tell()
+            spill_file.write(line)
+        self._spill_offsets.setdefault(write_record["session_id"], []).append(offset)
+        self._spill_size = offset + len(line)
+    
+    def _index_spilled_history(self):
+        """Index the records already in the spill file by session"""
+        try:
+            with open(self.history_spill_path, "rb") as spill_file:
+                offset = 0
+                for line in spill_file:
+                    if line.strip():
+                        session_id = json_codec.loads(line.decode("utf-8"))["session_id"]
+                        self._spill_offsets.setdefault(session_id, []).append(offset)
+                    offset += len(line)
+                self._spill_size = offset
+        except FileNotFoundError:
+            pass
+    
+    def _read_spilled_records(self, offsets: List[int], size: int) -> List[Dict[str, Any]]:
+        """Read the spilled records at the given offsets, within the first size bytes"""
+        records = []
+        try:
+            with open(self.history_spill_path, "rb") as spill_file:
+                for offset in offsets:
+                    if offset >= size:
+                        break
+                    spill_file.seek(offset)
+                    records.append(json_codec.loads(spill_file.readline().decode("utf-8")))
+        except FileNotFoundError:
+            # Cleared since the offsets were taken
+            return []
+        return records
+    
+    def read_spilled_history(self) -> List[Dict[str, Any]]:
+        """Read write history records that were spilled out of the ring buffer"""
+        if not self.history_spill_path:
+            return []
+        try:
+            with open(self.history_spill_path, "r", encoding="utf-8") as spill_file:
+                return [json_codec.loads(line) for line in spill_file if line.strip()]
+        except FileNotFoundError:
+            return []
+    
     def read_integration_and_commitments(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Read integration and commitment data from memory"""
         if session_id not in self.memory_storage:
@@ -128,10 +452,22 @@ class MemoryWrite:
         return session_data[-1]  # Most recent entry
     
     def get_write_history(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get write history, optionally filtered by session"""
-        if session_id:
-            return [record for record in self.write_history if record["session_id"] == session_id]
-        return self.write_history
+        """
+        Get write history, optionally filtered by session.
+        The global history holds the most recent history_limit records. A
+        session's history also includes its spilled records, read from
+        history_spill_path, so it is complete when spilling is configured.
+        Only that session's spilled records are read, outside the publish lock.
+        """
+        with self._publish_lock:
+            if not session_id:
+                return list(self.write_history)
+            recent = list(self._history_by_session.get(session_id, ()))
+            offsets = list(self._spill_offsets.get(session_id, ()))
+            size = self._spill_size
+        if not offsets:
+            return recent
+        return self._read_spilled_records(offsets, size) + recent
     
     def validate_memory_data(
         self,
@@ -165,27 +501,58 @@ class MemoryWrite:
         return session_id == "test-failure-session"
     
     def clear_memory_storage(self):
-        """Clear in-memory storage (for testing)"""
-        self.memory_storage.clear()
-        self.write_history.clear()
+        """
+        Clear in-memory storage (for testing).
+        Waits for a running checkpoint and holds writes back, so a checkpoint
+        saved afterwards can never bring the cleared state back.
+        """
+        if not self.wal:
+            self._clear_state()
+            return
+        with self._checkpoint_cond:
+            while self._checkpoint_thread or self._writes_blocked:
+                self._checkpoint_cond.wait()
+            self._writes_blocked = True
+            try:
+                while self._writes_in_flight:
+                    self._checkpoint_cond.wait()
+                self._clear_state()
+                self.wal.truncate()
+            finally:
+                self._writes_blocked = False
+                self._checkpoint_cond.notify_all()
+    
+    def _clear_state(self):
+        with self._publish_lock:
+            self.memory_storage.clear()
+            self.write_history.clear()
+            self._history_by_session.clear()
+            if self._spill_offsets:
+                os.remove(self.history_spill_path)
+                self._spill_offsets.clear()
+                self._spill_size = 0
+            self._total_writes = 0
+            self._successful_writes = 0
+            self._total_commitments = 0
+    
+    def close(self):
+        """Close the durable backend, if any, once a running checkpoint is saved"""
+        if self.wal:
+            with self._checkpoint_cond:
+                while self._checkpoint_thread:
+                    self._checkpoint_cond.wait()
+            self.wal.close()
     
     def get_memory_statistics(self) -> Dict[str, Any]:
-        """Get statistics about memory storage"""
-        total_sessions = len(self.memory_storage)
-        total_writes = len(self.write_history)
-        successful_writes = sum(1 for record in self.write_history if record.get("success", False))
-        failed_writes = total_writes - successful_writes
-        
-        total_commitments = 0
-        for session_data in self.memory_storage.values():
-            for entry in session_data:
-                total_commitments += len(entry.get("commitments", []))
+        """Get statistics about memory storage from running counters"""
+        total_writes = self._total_writes
+        successful_writes = self._successful_writes
         
         return {
-            "total_sessions": total_sessions,
+            "total_sessions": len(self.memory_storage),
             "total_writes": total_writes,
             "successful_writes": successful_writes,
-            "failed_writes": failed_writes,
-            "total_commitments": total_commitments,
+            "failed_writes": total_writes - successful_writes,
+            "total_commitments": self._total_commitments,
             "success_rate": successful_writes / total_writes if total_writes > 0 else 0
         }
@@ -1,4 +1,6 @@
+import asyncio
 import pytest
+import threading
 from datetime import datetime
 from rooms.integration_commit_room.integration_commit_room import IntegrationCommitRoom, run_integration_commit_room
 from rooms.integration_commit_room.contract_types import (
@@ -9,6 +11,7 @@ from rooms.integration_commit_room.integration import IntegrationEnforcement
 from rooms.integration_commit_room.commits import CommitRecording
 from rooms.integration_commit_room.pace import PaceEnforcement
 from rooms.integration_commit_room.memory_write import MemoryWrite
+from rooms.integration_commit_room.wal import WriteAheadLog
 from rooms.integration_commit_room.completion import Completion
 
 
@@ -364,6 +367,432 @@ class TestMemoryWrite:
         assert len(stored_data["commitments"]) == 1
 
 
+class TestDurableMemoryWrite:
+    """Test WAL-backed memory write with group commit and crash recovery"""
+    
+    def _write(self, memory_write, session_id):
+        return memory_write.write_integration_and_commitments(
+            session_id,
+            IntegrationData(
+                integration_notes="Feeling grounded after session",
+                session_context="Morning meditation"
+            ),
+            [
+                Commitment(
+                    text="Practice daily meditation",
+                    context="Morning routine",
+                    pace_state=PaceState.NOW,
+                    session_ref=session_id
+                )
+            ]
+        )
+    
+    def test_writes_survive_restart(self, tmp_path):
+        """Test that committed writes are replayed from the WAL"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path)
+        assert self._write(memory_write, "session-1").success is True
+        assert self._write(memory_write, "session-2").success is True
+        memory_write.close()
+        
+        recovered = MemoryWrite(wal_path=wal_path)
+        stored_data = recovered.read_integration_and_commitments("session-2")
+        assert stored_data is not None
+        assert stored_data["integration"]["session_context"] == "Morning meditation"
+        assert len(stored_data["commitments"]) == 1
+        assert len(recovered.get_write_history()) == 2
+    
+    def test_torn_record_is_never_visible(self, tmp_path):
+        """Test that a partially written record is dropped on recovery"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path)
+        self._write(memory_write, "session-1")
+        memory_write.close()
+        
+        with open(wal_path, "ab") as wal_file:
+            wal_file.write(b'0badc0de {"entry": {"session_id": "session-2", "integ')
+        
+        recovered = MemoryWrite(wal_path=wal_path)
+        assert recovered.read_integration_and_commitments("session-2") is None
+        assert recovered.read_integration_and_commitments("session-1") is not None
+        
+        # New writes land after the valid prefix and are recoverable
+        assert self._write(recovered, "session-3").success is True
+        recovered.close()
+        assert MemoryWrite(wal_path=wal_path).read_integration_and_commitments("session-3") is not None
+    
+    def test_failed_wal_write_publishes_nothing(self, tmp_path):
+        """Test that a write is not visible when the WAL cannot persist it"""
+        memory_write = MemoryWrite(wal_path=str(tmp_path / "memory.wal"))
+        memory_write.wal._file.close()
+        
+        result = self._write(memory_write, "session-1")
+        
+        assert result.success is False
+        assert memory_write.read_integration_and_commitments("session-1") is None
+        assert memory_write.get_write_history()[-1]["success"] is False
+        assert memory_write.wal._failed_batches == {}
+    
+    def test_group_commit_batches_concurrent_writes(self, tmp_path):
+        """Test that concurrent writers share fsyncs"""
+        import threading
+        
+        memory_write = MemoryWrite(
+            wal_path=str(tmp_path / "memory.wal"), group_commit_window=0.01
+        )
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(self._write(memory_write, f"session-{i}")))
+            for i in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 16
+        assert all(result.success for result in results)
+        assert memory_write.wal.records_written == 16
+        assert memory_write.wal.fsync_count < 16
+    
+    def test_wal_rejects_bad_checksum(self, tmp_path):
+        """Test that records with a mismatched checksum end recovery"""
+        wal_path = str(tmp_path / "raw.wal")
+        wal = WriteAheadLog(wal_path, fsync=False)
+        wal.append({"n": 1})
+        wal.close()
+        
+        with open(wal_path, "ab") as wal_file:
+            wal_file.write(b'00000000 {"n": 2}\n')
+        
+        assert WriteAheadLog(wal_path, fsync=False).recover() == [{"n": 1}]
+    
+    def test_checkpoint_bounds_the_log(self, tmp_path):
+        """Test that checkpoints empty the WAL and restarts restore the checkpointed state"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path, checkpoint_every=3)
+        for i in range(5):
+            self._write(memory_write, f"session-{i}")
+        stats = memory_write.get_memory_statistics()
+        memory_write.close()
+        
+        assert memory_write.wal.checkpoint_count == 1
+        assert len(WriteAheadLog(wal_path, fsync=False).recover()) == 2
+        recovered = MemoryWrite(wal_path=wal_path)
+        assert recovered.get_memory_statistics() == stats
+        assert len(recovered.get_write_history()) == 5
+        assert len(recovered.get_write_history("session-0")) == 1
+    
+    def test_crash_before_log_is_emptied_does_not_replay_twice(self, tmp_path):
+        """Test that a log left over from before a checkpoint is not replayed on top of it"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path, checkpoint_every=0)
+        self._write(memory_write, "session-1")
+        self._write(memory_write, "session-2")
+        with open(wal_path, "rb") as wal_file:
+            old_log = wal_file.read()
+        memory_write.checkpoint()
+        memory_write.close()
+        with open(wal_path, "wb") as wal_file:
+            wal_file.write(old_log)
+        
+        recovered = MemoryWrite(wal_path=wal_path)
+        assert recovered.get_memory_statistics()["total_writes"] == 2
+        assert self._write(recovered, "session-3").success is True
+        recovered.close()
+        assert MemoryWrite(wal_path=wal_path).get_memory_statistics()["total_writes"] == 3
+    
+    def _hold_checkpoint(self, memory_write):
+        """Make checkpoints wait for the returned event before they are saved"""
+        release = threading.Event()
+        write_checkpoint = memory_write.wal.write_checkpoint
+        
+        def held_write_checkpoint(epoch, state):
+            release.wait(5)
+            write_checkpoint(epoch, state)
+        
+        memory_write.wal.write_checkpoint = held_write_checkpoint
+        return release
+    
+    def test_writes_continue_while_checkpoint_is_saved(self, tmp_path):
+        """Test that the checkpoint is serialized off the write path"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path, checkpoint_every=2)
+        release = self._hold_checkpoint(memory_write)
+        for i in range(2):
+            self._write(memory_write, f"session-{i}")
+        
+        # The checkpoint is still waiting to be saved; writes are not
+        assert memory_write._checkpoint_thread is not None
+        self._write(memory_write, "session-0")
+        assert memory_write._checkpoint_thread is not None
+        release.set()
+        memory_write.close()
+        
+        assert memory_write.wal.checkpoint_count == 1
+        assert len(WriteAheadLog(wal_path, fsync=False).recover()) == 1
+        recovered = MemoryWrite(wal_path=wal_path)
+        assert recovered.get_memory_statistics()["total_writes"] == 3
+        assert len(recovered.memory_storage["session-0"]) == 2
+    
+    def test_failed_checkpoint_keeps_the_sealed_log(self, tmp_path):
+        """Test that records sealed for a checkpoint that was never saved are replayed"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path, checkpoint_every=0)
+        self._write(memory_write, "session-1")
+        
+        def failing_write_checkpoint(epoch, state):
+            raise OSError("disk full")
+        
+        memory_write.wal.write_checkpoint = failing_write_checkpoint
+        with pytest.raises(RuntimeError, match="disk full"):
+            memory_write.checkpoint()
+        self._write(memory_write, "session-2")
+        memory_write.close()
+        
+        recovered = MemoryWrite(wal_path=wal_path)
+        assert recovered.get_memory_statistics()["total_writes"] == 2
+        recovered.checkpoint()
+        recovered.close()
+        assert MemoryWrite(wal_path=wal_path).get_memory_statistics()["total_writes"] == 2
+    
+    def test_clear_waits_for_running_checkpoint(self, tmp_path):
+        """Test that a checkpoint saved during a clear cannot bring the state back"""
+        wal_path = str(tmp_path / "memory.wal")
+        memory_write = MemoryWrite(wal_path=wal_path, checkpoint_every=0)
+        release = self._hold_checkpoint(memory_write)
+        self._write(memory_write, "session-1")
+        memory_write.checkpoint(wait=False)
+        
+        clearing = threading.Thread(target=memory_write.clear_memory_storage)
+        clearing.start()
+        clearing.join(0.1)
+        assert clearing.is_alive()
+        release.set()
+        clearing.join(5)
+        assert not clearing.is_alive()
+        memory_write.close()
+        
+        assert MemoryWrite(wal_path=wal_path).get_memory_statistics()["total_writes"] == 0
+
+
+class TestMemoryWriteStatistics:
+    """Test running statistics and indexed write history"""
+    
+    def _write(self, memory_write, session_id, commitment_count=1):
+        return memory_write.write_integration_and_commitments(
+            session_id,
+            IntegrationData(
+                integration_notes="Feeling grounded after session",
+                session_context="Morning meditation"
+            ),
+            [
+                Commitment(
+                    text=f"Commitment {i}",
+                    context="Morning routine",
+                    pace_state=PaceState.NOW,
+                    session_ref=session_id
+                )
+                for i in range(commitment_count)
+            ]
+        )
+    
+    def test_statistics_track_writes(self):
+        """Test that counters reflect successful and failed writes"""
+        memory_write = MemoryWrite()
+        self._write(memory_write, "session-1", commitment_count=2)
+        self._write(memory_write, "session-1", commitment_count=3)
+        self._write(memory_write, "session-2")
+        memory_write.write_integration_and_commitments("session-3", None, [])
+        
+        stats = memory_write.get_memory_statistics()
+        
+        assert stats["total_sessions"] == 2
+        assert stats["total_writes"] == 3
+        assert stats["successful_writes"] == 3
+        assert stats["total_commitments"] == 6
+    
+    def test_statistics_reset_on_clear(self):
+        """Test that clearing storage resets counters"""
+        memory_write = MemoryWrite()
+        self._write(memory_write, "session-1")
+        memory_write.clear_memory_storage()
+        
+        stats = memory_write.get_memory_statistics()
+        assert stats["total_writes"] == 0
+        assert stats["total_commitments"] == 0
+        assert memory_write.get_write_history("session-1") == []
+    
+    def test_session_history_index(self):
+        """Test that per-session history only holds that session's records"""
+        memory_write = MemoryWrite()
+        for i in range(5):
+            self._write(memory_write, f"session-{i % 2}")
+        
+        history = memory_write.get_write_history("session-1")
+        assert len(history) == 2
+        assert all(record["session_id"] == "session-1" for record in history)
+        assert len(memory_write.get_write_history()) == 5
+    
+    def test_global_history_is_bounded_and_spills(self, tmp_path):
+        """Test that evicted history records are spilled to disk"""
+        memory_write = MemoryWrite(
+            history_limit=3, history_spill_path=str(tmp_path / "history.jsonl")
+        )
+        for i in range(5):
+            self._write(memory_write, f"session-{i}")
+        
+        history = memory_write.get_write_history()
+        spilled = memory_write.read_spilled_history()
+        
+        assert [record["session_id"] for record in history] == ["session-2", "session-3", "session-4"]
+        assert [record["session_id"] for record in spilled] == ["session-0", "session-1"]
+        assert memory_write.get_memory_statistics()["total_writes"] == 5
+    
+    def test_session_history_follows_the_ring(self, tmp_path):
+        """Test that evicted sessions leave the index and session history includes spilled records"""
+        memory_write = MemoryWrite(
+            history_limit=2, history_spill_path=str(tmp_path / "history.jsonl")
+        )
+        for session_id in ["session-a", "session-a", "session-b", "session-c"]:
+            self._write(memory_write, session_id)
+        
+        assert set(memory_write._history_by_session) == {"session-b", "session-c"}
+        assert len(memory_write.get_write_history("session-a")) == 2
+        
+        unspilled = MemoryWrite(history_limit=1)
+        self._write(unspilled, "session-a")
+        self._write(unspilled, "session-b")
+        assert unspilled.get_write_history("session-a") == []
+        assert list(unspilled._history_by_session) == ["session-b"]
+    
+    def test_session_history_reads_only_its_spilled_records(self, tmp_path):
+        """Test that spilled records are indexed by offset and read without the publish lock"""
+        spill_path = str(tmp_path / "history.jsonl")
+        memory_write = MemoryWrite(history_limit=1, history_spill_path=spill_path)
+        for session_id in ["session-a", "session-b", "session-a", "session-b", "session-c"]:
+            self._write(memory_write, session_id)
+        assert len(memory_write._spill_offsets["session-a"]) == 2
+        
+        reads = []
+        read_spilled_records = memory_write._read_spilled_records
+        
+        def checked_read(offsets, size):
+            assert not memory_write._publish_lock.locked()
+            records = read_spilled_records(offsets, size)
+            reads.append(records)
+            return records
+        
+        memory_write._read_spilled_records = checked_read
+        history = memory_write.get_write_history("session-a")
+        assert [record["session_id"] for record in history] == ["session-a", "session-a"]
+        assert reads == [history]
+        
+        reopened = MemoryWrite(history_limit=1, history_spill_path=spill_path)
+        assert len(reopened.get_write_history("session-b")) == 2
+        reopened.clear_memory_storage()
+        assert reopened.get_write_history("session-b") == []
+        assert reopened.read_spilled_history() == []
+
+
+class TestBulkCommitmentIngestion:
+    """Test bulk commitment validation and batched memory writes"""
+    
+    def _payload(self, session_id, **overrides):
+        payload = {
+            "integration_notes": "Felt a clear shift in how I hold the work",
+            "session_context": "Weekly review session",
+            "commitments": [
+                {"text": "Block focus time", "context": "Calendar", "pace_state": "NOW", "session_ref": session_id},
+                {"text": "Revisit pricing", "context": "Product", "pace_state": "LATER", "session_ref": session_id}
+            ]
+        }
+        payload.update(overrides)
+        return payload
+    
+    def test_bulk_validation_collects_all_errors(self):
+        """Test that every invalid field of every item is reported"""
+        results = CommitRecording.validate_commitments_bulk({
+            "good": self._payload("good"),
+            "bad": {"commitments": [
+                {"text": "x", "context": "y", "pace_state": "SOON", "session_ref": ""},
+                {"text": "Valid text", "context": "Valid", "pace_state": "HOLD", "session_ref": "bad"},
+                "not a dict"
+            ]},
+            "empty": {"commitments": []}
+        })
+        by_session = {result.session_id: result for result in results}
+        
+        assert by_session["good"].is_valid
+        assert len(by_session["good"].commitments) == 2
+        assert by_session["good"].commitments[0].pace_state is PaceState.NOW
+        assert len(by_session["bad"].errors) == 5
+        assert by_session["bad"].commitments == []
+        assert not by_session["empty"].is_valid
+    
+    def test_bulk_validation_shares_timestamp(self):
+        """Test that commitments in one batch share a timestamp"""
+        stamp = datetime(2024, 1, 1, 12, 0, 0)
+        results = CommitRecording.validate_commitments_bulk(
+            {"a": self._payload("a"), "b": self._payload("b")}, timestamp=stamp
+        )
+        
+        assert all(c.timestamp == stamp for result in results for c in result.commitments)
+    
+    def test_bulk_ingestion_writes_valid_sessions(self):
+        """Test that valid sessions are written and invalid ones are not"""
+        room = IntegrationCommitRoom()
+        results = room.ingest_commitments_bulk({
+            "session-a": self._payload("session-a"),
+            "session-b": self._payload("session-b", session_context="")
+        })
+        by_session = {result.session_id: result for result in results}
+        
+        assert by_session["session-a"].memory_written is True
+        assert by_session["session-b"].memory_written is False
+        assert "session_context" in by_session["session-b"].errors[0]
+        assert room.memory_write.read_integration_and_commitments("session-a") is not None
+        assert room.memory_write.read_integration_and_commitments("session-b") is None
+        assert room.memory_write.get_memory_statistics()["total_commitments"] == 2
+    
+    def test_malformed_record_declines_alone(self):
+        """Test that a record that breaks integration validation does not abort the batch"""
+        room = IntegrationCommitRoom()
+        results = room.ingest_commitments_bulk({
+            "session-a": self._payload("session-a"),
+            "session-b": self._payload("session-b", integration_notes=["not", "text"])
+        })
+        by_session = {result.session_id: result for result in results}
+        
+        assert by_session["session-a"].memory_written is True
+        assert by_session["session-b"].memory_written is False
+        assert by_session["session-b"].errors[0].startswith("Integration validation failed")
+        assert by_session["session-b"].commitments == []
+    
+    def test_single_and_bulk_validation_agree(self):
+        """Test that the single-item path reports the bulk path's first error"""
+        commit_data = {"text": "x", "context": "y", "pace_state": "SOON", "session_ref": ""}
+        
+        is_valid, commitment, error = CommitRecording._validate_single_commitment(commit_data, 0)
+        _, errors = CommitRecording._build_commitment(commit_data, 0)
+        
+        assert (is_valid, commitment) == (False, None)
+        assert error == errors[0] and len(errors) == 4
+    
+    def test_bulk_ingestion_uses_one_wal_flush(self, tmp_path):
+        """Test that a bulk batch is made durable with a single fsync"""
+        memory_write = MemoryWrite(wal_path=str(tmp_path / "memory.wal"))
+        room = IntegrationCommitRoom(memory_write=memory_write)
+        
+        results = room.ingest_commitments_bulk({
+            f"session-{i}": self._payload(f"session-{i}") for i in range(50)
+        })
+        
+        assert all(result.memory_written for result in results)
+        assert memory_write.wal.fsync_count == 1
+        assert memory_write.wal.records_written == 50
+
+
 class TestCompletion:
     """Test completion functionality"""
     
@@ -651,6 +1080,39 @@ class TestIntegrationCommitRoom:
         assert result.display_text.endswith(" [[COMPLETE]]")
 
 
+class TestAsyncIntegrationCommitRoom:
+    """Test the async room protocol entry point"""
+    
+    def _input(self, session_ref):
+        return IntegrationCommitRoomInput(
+            session_state_ref=session_ref,
+            payload={
+                "integration_notes": "Feeling centered and present",
+                "session_context": "Evening reflection session"
+            }
+        )
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_sync_entry_point(self):
+        """Test that run returns what run_integration_commit_room returns"""
+        result = await IntegrationCommitRoom().run(self._input("session-1"))
+        expected = IntegrationCommitRoom().run_integration_commit_room(self._input("session-1"))
+        
+        assert result == expected
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_with_wal(self, tmp_path):
+        """Test that WAL-backed sessions run off the event loop and all persist"""
+        memory_write = MemoryWrite(wal_path=str(tmp_path / "memory.wal"))
+        room = IntegrationCommitRoom(memory_write=memory_write)
+        refs = [f"session-{i}" for i in range(10)]
+        
+        results = await asyncio.gather(*(room.run(self._input(ref)) for ref in refs))
+        
+        assert all("Integration Captured Successfully" in result.display_text for result in results)
+        assert all(room.get_room_state(ref).integration_captured for ref in refs)
+
+
 class TestRunIntegrationCommitRoomFunction:
     """Test standalone run_integration_commit_room function"""
     
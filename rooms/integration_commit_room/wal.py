@@ -0,0 +1,331 @@
+"""
+Write-Ahead Log
+Checksummed, group-committed log of memory writes, checkpointed so it stays
+bounded in a long-running process
+"""
+
+import glob
+import os
+import threading
+import time
+import zlib
+from typing import List, Dict, Any, Optional, Tuple
+from .. import json_codec
+
+
+EPOCH_KEY = "_wal_epoch"
+
+
+class WALWriteError(Exception):
+    """Raised when a batch of WAL records could not be made durable"""
+
+
+class WriteAheadLog:
+    """
+    Append-only, checksummed write-ahead log with group commit.
+
+    Each record is one line: ``<crc32> <json>``. A record is only trusted on
+    recovery if its checksum matches, so a torn write from a crash is never
+    replayed. Concurrent appenders are batched: the first waiter becomes the
+    flush leader and writes every pending record with a single fsync, while
+    the others wait for that fsync to cover their record.
+
+    Checkpointing is split so the state can be saved off the write path.
+    rotate() seals the log as ``<path>.<epoch>.sealed`` and starts a fresh
+    one under the next epoch; it is quick and needs appends held back.
+    write_checkpoint() then atomically saves a state covering every sealed
+    record to ``<path>.checkpoint`` and deletes the sealed segments, while
+    new appends go on. Recovery replays sealed segments the checkpoint does
+    not cover, then the live log, so a crash at any step neither loses nor
+    repeats a record. checkpoint() runs both steps in one call.
+    """
+
+    def __init__(self, path: str, fsync: bool = True, group_commit_window: float = 0.0):
+        self.path = path
+        self.fsync = fsync
+        self.group_commit_window = group_commit_window
+        self.checkpoint_path = path + ".checkpoint"
+        self.fsync_count = 0
+        self.records_written = 0
+        self.records_since_checkpoint = 0
+        self.checkpoint_count = 0
+
+        self._cond = threading.Condition()
+        self._pending: List[bytes] = []
+        self._last_seq = 0
+        self._durable_seq = 0
+        self._flushing = False
+        self._pending_callers = 0
+        # Failed batches by their last sequence number: [first, error, callers yet to see it]
+        self._failed_batches: Dict[int, List[Any]] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        checkpoint_epoch, self._checkpoint_state = self._load_checkpoint(self.checkpoint_path)
+
+        recovered = []
+        next_epoch = checkpoint_epoch
+        for segment_epoch, segment_path in self._sealed_segments():
+            next_epoch = max(next_epoch, segment_epoch + 1)
+            if segment_epoch < checkpoint_epoch:
+                # Crashed before deleting a segment the checkpoint covers
+                os.remove(segment_path)
+                continue
+            recovered.extend(self._scan_segment(segment_path)[0])
+
+        records, valid_size = self._scan(path)
+        log_epoch = 0
+        if records and self._is_epoch_marker(records[0]):
+            log_epoch = records.pop(0)[EPOCH_KEY]
+        if self._checkpoint_state is not None and log_epoch < checkpoint_epoch:
+            # A log from before the checkpoint; it already covers these records
+            records, valid_size = [], 0
+        self._recovered = recovered + records
+        # A crash mid-rotate can leave no live log; never reuse a sealed epoch
+        self._epoch = max(log_epoch, next_epoch)
+
+        self._file = open(path, "ab")
+        if self._file.tell() != valid_size:
+            # Drop a torn tail so new records never follow garbage
+            self._file.truncate(valid_size)
+            self._file.seek(valid_size)
+        if valid_size == 0 and self._epoch:
+            self._file.write(self._encode({EPOCH_KEY: self._epoch}))
+            self._sync()
+
+    def recover(self) -> List[Dict[str, Any]]:
+        """Return every complete record logged after the checkpoint when the log was opened"""
+        return list(self._recovered)
+
+    def recover_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the state saved by the last checkpoint when the log was opened, or None"""
+        return self._checkpoint_state
+
+    def append(self, record: Dict[str, Any]):
+        """Append one record and block until it is durable"""
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]):
+        """
+        Append records and block until all of them are durable.
+        Raises WALWriteError if the batch carrying them failed to persist.
+        """
+        if not records:
+            return
+
+        lines = [self._encode(record) for record in records]
+
+        with self._cond:
+            self._pending.extend(lines)
+            self._pending_callers += 1
+            self._last_seq += len(lines)
+            last_seq = self._last_seq
+
+            while self._durable_seq < last_seq:
+                if self._flushing:
+                    self._cond.wait()
+                else:
+                    self._lead_flush()
+
+            # A call's records always travel in one batch
+            for end, failure in self._failed_batches.items():
+                start, error, callers = failure
+                if start <= last_seq <= end:
+                    if callers <= 1:
+                        del self._failed_batches[end]
+                    else:
+                        failure[2] = callers - 1
+                    raise WALWriteError(error)
+
+    def checkpoint(self, state: Dict[str, Any]):
+        """
+        Save state, which must reflect every record appended so far, then empty the log.
+        Callers keep new appends out until this returns.
+        """
+        self.write_checkpoint(self.rotate(), state)
+
+    def rotate(self) -> int:
+        """
+        Seal the log and start an empty one under the next epoch; returns that epoch.
+        Callers keep new appends out until this returns. A state saved with
+        write_checkpoint(epoch, ...) must then reflect every sealed record.
+        """
+        with self._cond:
+            while self._flushing:
+                self._cond.wait()
+            if self._pending:
+                raise RuntimeError("Cannot rotate while records are waiting to be flushed")
+
+            epoch = self._epoch + 1
+            self._file.close()
+            os.replace(self.path, self._sealed_path(self._epoch))
+            self._file = open(self.path, "ab")
+            self._file.write(self._encode({EPOCH_KEY: epoch}))
+            self._sync()
+            self._epoch = epoch
+            self._recovered = []
+            self.records_since_checkpoint = 0
+            return epoch
+
+    def write_checkpoint(self, epoch: int, state: Dict[str, Any]):
+        """
+        Atomically save state for a rotation's epoch, then delete the segments it covers.
+        Safe to run while appends continue; only one may run at a time.
+        """
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "wb") as checkpoint_file:
+            checkpoint_file.write(json_codec.dumps_bytes({"epoch": epoch, "state": state}, ensure_ascii=False))
+            checkpoint_file.flush()
+            if self.fsync:
+                os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+        for segment_epoch, segment_path in self._sealed_segments():
+            if segment_epoch < epoch:
+                os.remove(segment_path)
+        self._checkpoint_state = None
+        self.checkpoint_count += 1
+
+    def truncate(self):
+        """Discard every record in the log, its sealed segments and its checkpoint"""
+        with self._cond:
+            while self._flushing:
+                self._cond.wait()
+            if os.path.exists(self.checkpoint_path):
+                os.remove(self.checkpoint_path)
+            for _, segment_path in self._sealed_segments():
+                os.remove(segment_path)
+            self._file.truncate(0)
+            self._file.seek(0)
+            self._sync()
+            self._epoch = 0
+            self._checkpoint_state = None
+            self._recovered = []
+            self.records_since_checkpoint = 0
+
+    def close(self):
+        """Close the underlying log file"""
+        with self._cond:
+            while self._flushing:
+                self._cond.wait()
+            self._file.close()
+
+    def _lead_flush(self):
+        """Flush every pending record with one write and one fsync (lock held on entry/exit)"""
+        self._flushing = True
+        try:
+            if self.group_commit_window > 0:
+                # Let concurrent writers join this batch
+                self._cond.release()
+                try:
+                    time.sleep(self.group_commit_window)
+                finally:
+                    self._cond.acquire()
+
+            batch = self._pending
+            callers = self._pending_callers
+            self._pending = []
+            self._pending_callers = 0
+            batch_start = self._durable_seq + 1
+            batch_end = self._last_seq
+
+            self._cond.release()
+            try:
+                error = self._write_batch(batch)
+            finally:
+                self._cond.acquire()
+
+            if error is not None:
+                self._failed_batches[batch_end] = [batch_start, error, callers]
+            else:
+                self.records_written += len(batch)
+                self.records_since_checkpoint += len(batch)
+            self._durable_seq = batch_end
+        finally:
+            self._flushing = False
+            self._cond.notify_all()
+
+    def _write_batch(self, batch: List[bytes]) -> Optional[str]:
+        offset = self._file.tell()
+        try:
+            self._file.write(b"".join(batch))
+            self._sync()
+            return None
+        except Exception as e:
+            # Roll the file back so a failed batch leaves no partial records
+            try:
+                self._file.truncate(offset)
+                self._file.seek(offset)
+            except Exception:
+                pass
+            return f"WAL write failed: {str(e)}"
+
+    def _sync(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+            self.fsync_count += 1
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        payload = json_codec.dumps_bytes(record, ensure_ascii=False)
+        return b"%08x " % zlib.crc32(payload) + payload + b"\n"
+
+    def _sealed_path(self, epoch: int) -> str:
+        return f"{self.path}.{epoch}.sealed"
+
+    def _sealed_segments(self) -> List[Tuple[int, str]]:
+        """Sealed log segments as (epoch, path), oldest first"""
+        prefix, suffix = self.path + ".", ".sealed"
+        segments = []
+        for segment_path in glob.glob(glob.escape(self.path) + ".*" + suffix):
+            epoch = segment_path[len(prefix):-len(suffix)]
+            if epoch.isdigit():
+                segments.append((int(epoch), segment_path))
+        return sorted(segments)
+
+    def _scan_segment(self, path: str) -> Tuple[List[Dict[str, Any]], int]:
+        """Like _scan, without the segment's epoch marker"""
+        records, valid_size = self._scan(path)
+        if records and self._is_epoch_marker(records[0]):
+            records.pop(0)
+        return records, valid_size
+
+    @staticmethod
+    def _is_epoch_marker(record: Any) -> bool:
+        return isinstance(record, dict) and list(record) == [EPOCH_KEY]
+
+    @staticmethod
+    def _load_checkpoint(path: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Read the last checkpoint; it is replaced atomically, so it is complete or absent"""
+        if not os.path.exists(path):
+            return 0, None
+        with open(path, "rb") as checkpoint_file:
+            checkpoint = json_codec.loads(checkpoint_file.read())
+        return checkpoint["epoch"], checkpoint["state"]
+
+    @staticmethod
+    def _scan(path: str) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read complete, checksum-valid records from the start of the log.
+        Returns: (records, byte_length_of_valid_prefix)
+        """
+        if not os.path.exists(path):
+            return [], 0
+
+        records = []
+        valid_size = 0
+        with open(path, "rb") as log_file:
+            for line in log_file:
+                if not line.endswith(b"\n") or len(line) < 10:
+                    break
+                checksum, _, payload = line[:-1].partition(b" ")
+                try:
+                    if int(checksum, 16) != zlib.crc32(payload):
+                        break
+                    records.append(json_codec.loads(payload.decode("utf-8")))
+                except ValueError:
+                    break
+                valid_size += len(line)
+
+        return records, valid_size
@@ -0,0 +1,227 @@
+"""
+JSON Codec
+Shared JSON encode/decode with optional orjson acceleration
+
+Output is always byte-identical to the stdlib ``json.dumps`` call it
+replaces. orjson is tried first and its result is kept only when it
+cannot differ from stdlib: anything containing floats, nulls (orjson
+writes NaN and Infinity as null), characters stdlib would escape, or
+types stdlib handles differently is re-encoded with stdlib.
+
+The one extension over stdlib is that UUIDs and Enum members encode the
+way orjson writes them natively, as ``str(uuid)`` and the member's value,
+so both backends give the same output for them instead of only stdlib
+raising TypeError.
+"""
+
+import enum
+import functools
+import json
+import uuid
+from json.encoder import c_make_encoder, encode_basestring, encode_basestring_ascii
+from typing import Any, Callable, Dict, IO, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKENDS = ("orjson", "stdlib")
+
+# Accelerated output is unsafe when it may differ from stdlib: float tokens
+# (a digit then '.' or an exponent) and null. Matches inside strings only
+# cost a fallback. Digits are folded to '0' so the scan is plain substring
+# searches rather than a regex.
+_FOLD_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+# orjson reads integers beyond 64 bits as floats; stdlib keeps them exact
+_LONG_DIGITS = b"0" * 19
+
+
+class _Fallback(Exception):
+    """Raised from an accelerated encoder's default hook to defer to stdlib"""
+
+
+def _defer(obj: Any) -> Any:
+    raise _Fallback
+
+
+def _encode_native(obj: Any) -> Any:
+    """Stdlib default hook for the types orjson encodes natively"""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _stdlib_encoder(sort_keys: bool, ensure_ascii: bool) -> Callable[[Any], str]:
+    """Build a compact stdlib encoder once instead of per call"""
+    encoder = json.JSONEncoder(
+        separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii, default=_encode_native
+    )
+    if c_make_encoder is None:
+        return encoder.encode
+
+    c_encoder = c_make_encoder(
+        None, encoder.default, encode_basestring_ascii if ensure_ascii else encode_basestring,
+        None, ":", ",", sort_keys, False, True
+    )
+
+    def encode(obj: Any) -> str:
+        if isinstance(obj, (dict, list, tuple)):
+            return "".join(c_encoder(obj, 0))
+        return encoder.encode(obj)
+
+    return encode
+
+
+_STDLIB_ENCODERS: Dict[Tuple[bool, bool], Callable[[Any], str]] = {
+    (sort_keys, ensure_ascii): _stdlib_encoder(sort_keys, ensure_ascii)
+    for sort_keys in (False, True)
+    for ensure_ascii in (False, True)
+}
+
+
+def _orjson_encoder(sort_keys: bool) -> Callable[[Any], bytes]:
+    option = orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return functools.partial(orjson.dumps, default=_defer, option=option)
+
+
+_backend: Optional[str] = None
+_accelerated: Dict[bool, Callable[[Any], bytes]] = {}
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Get the backends importable in this environment, fastest first"""
+    installed = {"orjson": orjson is not None, "stdlib": True}
+    return tuple(name for name in BACKENDS if installed[name])
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Select the encoder backend; None picks the fastest installed one.
+    Raises ValueError for unknown or uninstalled backends.
+    """
+    global _backend
+    if name is None:
+        name = available_backends()[0]
+    if name not in available_backends():
+        raise ValueError(f"JSON backend {name!r} is not available (have {', '.join(available_backends())})")
+
+    _accelerated.clear()
+    if name == "orjson":
+        _accelerated[False] = _orjson_encoder(False)
+        _accelerated[True] = _orjson_encoder(True)
+    _backend = name
+    return name
+
+
+def get_backend() -> str:
+    """Get the name of the active encoder backend"""
+    return _backend
+
+
+def _accelerated_dumps(obj: Any, sort_keys: bool, ensure_ascii: bool) -> Optional[bytes]:
+    encode = _accelerated.get(sort_keys)
+    if encode is None:
+        return None
+    try:
+        encoded = encode(obj)
+    except (_Fallback, TypeError, ValueError, OverflowError):
+        return None
+    if _is_unsafe(encoded, ensure_ascii):
+        return None
+    return encoded
+
+
+def _is_unsafe(encoded: bytes, ensure_ascii: bool) -> bool:
+    # With ensure_ascii, stdlib escapes everything outside printable ASCII
+    if ensure_ascii and (not encoded.isascii() or b"\x7f" in encoded):
+        return True
+    if b"null" in encoded:
+        return True
+    folded = encoded.translate(_FOLD_DIGITS)
+    return b"0." in folded or b"0e" in folded or b"0E" in folded
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    ensure_ascii: bool = True,
+    default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """
+    Compact JSON, identical to ``json.dumps(obj, separators=(",", ":"), ...)``
+    apart from UUIDs and Enum members. A ``default`` hook always uses stdlib
+    so hook results match exactly, and then handles those types itself.
+    """
+    if default is not None:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii, default=default)
+
+    encoded = _accelerated_dumps(obj, sort_keys, ensure_ascii)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return _STDLIB_ENCODERS[(sort_keys, ensure_ascii)](obj)
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    ensure_ascii: bool = True,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """UTF-8 bytes of ``dumps``, skipping the str round trip where possible"""
+    if default is None:
+        encoded = _accelerated_dumps(obj, sort_keys, ensure_ascii)
+        if encoded is not None:
+            return encoded
+    return dumps(obj, sort_keys=sort_keys, ensure_ascii=ensure_ascii, default=default).encode("utf-8")
+
+
+def stdlib_dumps_bytes(obj: Any, *, sort_keys: bool = False, ensure_ascii: bool = True) -> bytes:
+    """
+    ``dumps_bytes`` without trying the accelerated encoder, for payloads
+    known to contain nulls or floats, which would always fall back anyway.
+    """
+    return _STDLIB_ENCODERS[(sort_keys, ensure_ascii)](obj).encode("utf-8")
+
+
+def canonical_dumps(obj: Any) -> str:
+    """Sorted keys, no whitespace, ASCII-only: the form audit hashes are taken over"""
+    return dumps(obj, sort_keys=True)
+
+
+def loads(
+    data: Union[str, bytes, bytearray],
+    *,
+    object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Any:
+    """
+    Parse JSON, accepting exactly what ``json.loads`` accepts.
+    Documents the accelerated parser rejects (NaN, lone surrogates) or
+    may read differently (integers of 19+ digits) are parsed with stdlib,
+    which also raises the usual JSONDecodeError. An ``object_hook``
+    always uses stdlib, like ``default`` in ``dumps``.
+    """
+    if object_hook is not None:
+        return json.loads(data, object_hook=object_hook)
+    if _backend == "orjson":
+        try:
+            raw = data.encode("utf-8") if isinstance(data, str) else data
+            if _LONG_DIGITS not in raw.translate(_FOLD_DIGITS):
+                return orjson.loads(raw)
+        except (UnicodeEncodeError, orjson.JSONDecodeError):
+            pass
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Parse JSON from a file object, like ``json.load``"""
+    return loads(fp.read())
+
+
+set_backend()
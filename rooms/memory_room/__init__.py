@@ -4,6 +4,9 @@ Implements the Memory Room Protocol and Contract for Lichen Protocol Room Archit
 """
 
 from .memory_room import MemoryRoom, run_memory_room
+from .context_cache import MemoryContextCache
+from .memory_index import MemoryIndex
+from .memory_stats import MemoryStats
 from .contract_types import (
     MemoryRoomInput,
     MemoryRoomOutput,
@@ -17,6 +20,9 @@ from .contract_types import (
 __all__ = [
     'MemoryRoom',
     'run_memory_room',
+    'MemoryContextCache',
+    'MemoryIndex',
+    'MemoryStats',
     'MemoryRoomInput',
     'MemoryRoomOutput',
     'MemoryItem',
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .contract_types import MemoryItem, CaptureData
 
 
@@ -18,31 +18,45 @@ class MemoryCompletion:
     def format_memory_summary(
         session_id: str,
         items: List[MemoryItem],
-        governance_summary: Optional[dict] = None
+        governance_summary: Optional[dict] = None,
+        counts: Optional[Dict[str, int]] = None,
+        recent_items: Optional[List[MemoryItem]] = None
     ) -> str:
-        """Format a comprehensive summary of memory operations"""
+        """
+        Format a comprehensive summary of memory operations.
+        Precomputed counts (total/active/deleted/pinned_items) and the most
+        recent items skip the passes over items when given.
+        """
+        if counts is None or recent_items is None:
+            active_items = [item for item in items if not item.deleted_at]
+        if counts is None:
+            counts = {
+                "total_items": len(items),
+                "active_items": len(active_items),
+                "deleted_items": len(items) - len(active_items),
+                "pinned_items": sum(1 for item in active_items if item.is_pinned)
+            }
+        if recent_items is None:
+            recent_items = sorted(active_items, key=lambda x: x.updated_at, reverse=True)[:5]
+        
         summary_parts = [
             f"# Memory Room Summary - Session {session_id}",
             "",
-            f"**Total Memory Items**: {len(items)}",
+            f"**Total Memory Items**: {counts['total_items']}",
             ""
         ]
         
         # Add active vs deleted counts
-        active_items = [item for item in items if not item.deleted_at]
-        deleted_items = [item for item in items if item.deleted_at]
-        
         summary_parts.extend([
-            f"**Active Items**: {len(active_items)}",
-            f"**Deleted Items**: {len(deleted_items)}",
+            f"**Active Items**: {counts['active_items']}",
+            f"**Deleted Items**: {counts['deleted_items']}",
             ""
         ])
         
         # Add pinned items count
-        pinned_items = [item for item in active_items if item.is_pinned]
-        if pinned_items:
+        if counts['pinned_items']:
             summary_parts.extend([
-                f"**Pinned Items**: {len(pinned_items)}",
+                f"**Pinned Items**: {counts['pinned_items']}",
                 ""
             ])
         
@@ -57,15 +71,12 @@ class MemoryCompletion:
             ])
         
         # Add recent items summary
-        if active_items:
+        if recent_items:
             summary_parts.extend([
                 "## Recent Memory Items",
                 ""
             ])
             
-            # Sort by most recent
-            recent_items = sorted(active_items, key=lambda x: x.updated_at, reverse=True)[:5]
-            
             for item in recent_items:
                 summary_parts.append(
                     f"- **{item.capture_data.tone_label}** | "
@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+
+ContextKey = Tuple[str, Optional[str]]
+
+
+class MemoryContextCache:
+    """
+    Per-session cache of downstream room contexts.
+
+    Every memory write bumps the session's version and drops its cached
+    contexts. A context computed from an older version is never stored, so
+    a prefetch racing a write cannot cache stale memory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._contexts: Dict[str, Dict[ContextKey, Dict[str, Any]]] = {}
+
+    def version(self, session_id: str) -> int:
+        """Get the session's current memory version"""
+        return self._versions.get(session_id, 0)
+
+    def get(self, session_id: str, room_id: str, protocol_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get a cached context, or None if it was never computed or has been invalidated"""
+        contexts = self._contexts.get(session_id)
+        if contexts is None:
+            return None
+        return contexts.get((room_id, protocol_id))
+
+    def put(
+        self,
+        session_id: str,
+        room_id: str,
+        protocol_id: Optional[str],
+        context: Dict[str, Any],
+        version: int
+    ) -> bool:
+        """Cache a context computed at the given version; returns False if memory changed since"""
+        with self._lock:
+            if self._versions.get(session_id, 0) != version:
+                return False
+            self._contexts.setdefault(session_id, {})[(room_id, protocol_id)] = context
+            return True
+
+    def invalidate(self, session_id: str):
+        """Drop a session's cached contexts after a memory write"""
+        with self._lock:
+            self._versions[session_id] = self._versions.get(session_id, 0) + 1
+            self._contexts.pop(session_id, None)
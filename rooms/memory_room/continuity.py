@@ -191,8 +191,25 @@ class MemoryContinuity:
             residue_counts[residue] = residue_counts.get(residue, 0) + 1
             readiness_counts[readiness] = readiness_counts.get(readiness, 0) + 1
         
-        # Build summary
-        summary_parts = [f"{len(items)} {scope.value} memory items"]
+        pinned_count = sum(1 for item in items if item.is_pinned)
+        
+        return MemoryContinuity.format_summary_text(
+            scope, len(items), tone_counts, residue_counts, pinned_count
+        )
+    
+    @staticmethod
+    def format_summary_text(
+        scope: MemoryScope,
+        item_count: int,
+        tone_counts: Dict[str, int],
+        residue_counts: Dict[str, int],
+        pinned_count: int
+    ) -> str:
+        """Build summary text from label counts, however they were gathered"""
+        if not item_count:
+            return f"No {scope.value} memory items found"
+        
+        summary_parts = [f"{item_count} {scope.value} memory items"]
         
         if tone_counts:
             dominant_tone = max(tone_counts, key=tone_counts.get)
@@ -202,7 +219,6 @@ class MemoryContinuity:
             dominant_residue = max(residue_counts, key=residue_counts.get)
             summary_parts.append(f"dominant residue: {dominant_residue}")
         
-        pinned_count = sum(1 for item in items if item.is_pinned)
         if pinned_count > 0:
             summary_parts.append(f"{pinned_count} pinned items")
         
@@ -0,0 +1,134 @@
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from .contract_types import MemoryItem
+
+
+IndexKey = Tuple[str, str]
+LabelFilter = Dict[str, Union[str, Iterable[str]]]
+
+LABEL_FIELDS = ('tone_label', 'residue_label', 'readiness_state')
+TEXT_FIELDS = ('integration_notes', 'commitments')
+TOKEN_FIELD = 'token'
+UNSPECIFIED = 'unspecified'
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercase word tokens of a free-text field"""
+    return set(_TOKEN_PATTERN.findall(text.lower())) if text else set()
+
+
+class MemoryIndex:
+    """
+    Inverted index from labels and note tokens to a session's active items.
+
+    Postings map (field, value) keys to item ids, for the tone, residue and
+    readiness labels and for tokens of integration_notes and commitments
+    (field 'token'). Labels and tokens are matched case-insensitively.
+    Items are added on capture, re-indexed after an edit and removed on
+    delete, so searches never scan the session.
+    """
+
+    def __init__(self):
+        self._postings: Dict[IndexKey, Set[str]] = {}
+        self._keys: Dict[str, Set[IndexKey]] = {}
+        self._items: Dict[str, MemoryItem] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._items
+
+    def add(self, item: MemoryItem):
+        """Index an item, replacing its previous entries; deleted items are removed instead"""
+        self.remove(item.item_id)
+        if item.deleted_at:
+            return
+
+        keys = self._item_keys(item)
+        for key in keys:
+            self._postings.setdefault(key, set()).add(item.item_id)
+        self._keys[item.item_id] = keys
+        self._items[item.item_id] = item
+
+    def remove(self, item_id: str):
+        """Drop an item from the index; unknown ids are ignored"""
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return
+        del self._items[item_id]
+        for key in keys:
+            posting = self._postings[key]
+            posting.discard(item_id)
+            if not posting:
+                del self._postings[key]
+
+    def label_count(self, field: str, value: str) -> int:
+        """Number of active items with the given label"""
+        return len(self._postings.get((field, value.lower()), ()))
+
+    def search(
+        self,
+        labels: Optional[LabelFilter] = None,
+        terms: Optional[Union[str, Iterable[str]]] = None,
+        exclude: Optional[LabelFilter] = None,
+        limit: Optional[int] = 10
+    ) -> List[MemoryItem]:
+        """
+        Find active items matching a boolean label filter, most recent first.
+
+        Values listed for one label field are alternatives (OR); different
+        fields and every term must all match (AND). Items matching any label
+        in exclude are left out. Recency is the capture timestamp.
+        """
+        clauses: List[Set[str]] = []
+        for field, values in (labels or {}).items():
+            clauses.append(self._union(field, values))
+        if terms:
+            if isinstance(terms, str):
+                terms = [terms]
+            tokens = set().union(*(tokenize(term) for term in terms))
+            clauses.extend(self._postings.get((TOKEN_FIELD, token), set()) for token in tokens)
+
+        if clauses:
+            # Intersect smallest first so a rare label keeps the work small
+            clauses.sort(key=len)
+            matches = set(clauses[0])
+            for clause in clauses[1:]:
+                if not matches:
+                    break
+                matches &= clause
+        else:
+            matches = set(self._items)
+
+        for field, values in (exclude or {}).items():
+            matches -= self._union(field, values)
+
+        candidates = (self._items[item_id] for item_id in matches)
+        recency = lambda item: (item.capture_data.timestamp, item.created_at)
+        if limit is None:
+            return sorted(candidates, key=recency, reverse=True)
+        return heapq.nlargest(limit, candidates, key=recency)
+
+    def _union(self, field: str, values: Union[str, Iterable[str]]) -> Set[str]:
+        if field not in LABEL_FIELDS:
+            raise ValueError(f"Cannot filter on '{field}'; label fields are: {', '.join(LABEL_FIELDS)}")
+        if isinstance(values, str):
+            values = [values]
+        matched: Set[str] = set()
+        for value in values:
+            matched |= self._postings.get((field, value.lower()), set())
+        return matched
+
+    @staticmethod
+    def _item_keys(item: MemoryItem) -> Set[IndexKey]:
+        data = item.capture_data
+        keys = {(field, str(getattr(data, field)).lower()) for field in LABEL_FIELDS}
+        for field in TEXT_FIELDS:
+            text = str(getattr(data, field))
+            if text != UNSPECIFIED:
+                keys.update((TOKEN_FIELD, token) for token in tokenize(text))
+        return keys
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, Optional, List
 from .contract_types import (
     MemoryRoomInput, MemoryRoomOutput, MemoryItem, MemorySession,
@@ -8,6 +9,9 @@ from .control import UserControl
 from .continuity import MemoryContinuity
 from .governance import MemoryGovernance
 from .completion import MemoryCompletion
+from .context_cache import MemoryContextCache
+from .memory_index import MemoryIndex, LabelFilter
+from .memory_stats import MemoryStats
 
 
 class MemoryRoom:
@@ -15,6 +19,13 @@ class MemoryRoom:
     
     def __init__(self):
         self.sessions: Dict[str, MemorySession] = {}
+        self.context_cache = MemoryContextCache()
+        self.indexes: Dict[str, MemoryIndex] = {}
+        self.stats: Dict[str, MemoryStats] = {}
+    
+    async def run(self, input_data: MemoryRoomInput) -> MemoryRoomOutput:
+        """Async room protocol entry point; memory operations are in-memory and run inline"""
+        return self.run_memory_room(input_data)
     
     def run_memory_room(self, input_data: MemoryRoomInput) -> MemoryRoomOutput:
         """
@@ -33,6 +44,8 @@ class MemoryRoom:
                 return self._handle_retrieve(input_data)
             elif operation == "summary":
                 return self._handle_summary(input_data)
+            elif operation == "search":
+                return self._handle_search(input_data)
             else:
                 return self._handle_default(input_data)
                 
@@ -97,6 +110,9 @@ class MemoryRoom:
         session = self._get_or_create_session(input_data.session_state_ref)
         session.items.append(memory_item)
         session.last_accessed = memory_item.created_at
+        self._get_index(input_data.session_state_ref).add(memory_item)
+        self._get_stats(input_data.session_state_ref).track(memory_item)
+        self.context_cache.invalidate(input_data.session_state_ref)
         
         # Format response
         summary = MemoryCapture.format_capture_summary(capture_data)
@@ -152,6 +168,15 @@ class MemoryRoom:
                 next_action="continue"
             )
         
+        if result.success:
+            self.context_cache.invalidate(input_data.session_state_ref)
+            # Re-index and recount touched items; deleted items leave the index
+            index = self._get_index(input_data.session_state_ref)
+            stats = self._get_stats(input_data.session_state_ref)
+            for item in result.affected_items:
+                index.add(item)
+                stats.track(item)
+        
         # Format response
         if result.success:
             response_text = MemoryCompletion.format_operation_result(
@@ -192,11 +217,13 @@ class MemoryRoom:
             limit=payload.get("limit") if isinstance(payload, dict) else None
         )
         
-        # Get summary
-        summary = MemoryContinuity.get_memory_summary(
-            session.items, scope, input_data.session_state_ref,
-            payload.get("protocol_id") if isinstance(payload, dict) else None
-        )
+        # Get summary from the session's maintained counters
+        scope_ids = {
+            MemoryScope.SESSION: input_data.session_state_ref,
+            MemoryScope.PROTOCOL: payload.get("protocol_id") if isinstance(payload, dict) else None,
+            MemoryScope.GLOBAL: None
+        }
+        summary = self._get_stats(input_data.session_state_ref).summary(scope, scope_ids[scope])
         
         # Format response
         response_parts = [
@@ -235,16 +262,62 @@ class MemoryRoom:
             next_action="continue"
         )
     
+    def _handle_search(self, input_data: MemoryRoomInput) -> MemoryRoomOutput:
+        """Handle label and term searches over the session's memory index"""
+        payload = input_data.payload
+        items = self.search_memory(
+            input_data.session_state_ref,
+            labels=payload.get("labels"),
+            terms=payload.get("terms"),
+            exclude=payload.get("exclude"),
+            limit=payload.get("limit", 10)
+        )
+        
+        response_parts = [
+            "# Memory Search",
+            "",
+            f"**Matches**: {len(items)}",
+        ]
+        
+        if items:
+            response_parts.append(f"**Last Seen**: {items[0].capture_data.timestamp.isoformat(timespec='minutes')}")
+            response_parts.append("")
+            response_parts.append("## Most Recent First")
+            for item in items:
+                response_parts.append(
+                    f"- {item.capture_data.timestamp.isoformat(timespec='minutes')} | "
+                    f"**{item.capture_data.tone_label}** | "
+                    f"{item.capture_data.residue_label} | "
+                    f"{item.capture_data.readiness_state}"
+                )
+                if item.is_pinned:
+                    response_parts[-1] += " 📌"
+        else:
+            response_parts.append("")
+            response_parts.append("No items match the search.")
+        
+        response_text = "\n".join(response_parts)
+        
+        # Append completion marker
+        response_text = MemoryCompletion.append_completion_marker(response_text)
+        
+        return MemoryRoomOutput(
+            display_text=response_text,
+            next_action="continue"
+        )
+    
     def _handle_summary(self, input_data: MemoryRoomInput) -> MemoryRoomOutput:
         """Handle memory summary requests"""
         session = self._get_or_create_session(input_data.session_state_ref)
+        stats = self._get_stats(input_data.session_state_ref)
         
-        # Get governance summary
-        governance_summary = MemoryGovernance.get_governance_summary(session.items)
-        
-        # Format memory summary
+        # Format memory summary from the maintained counters
         response_text = MemoryCompletion.format_memory_summary(
-            input_data.session_state_ref, session.items, governance_summary
+            input_data.session_state_ref,
+            session.items,
+            stats.governance_summary(),
+            counts=stats.counts(MemoryScope.GLOBAL).as_dict(),
+            recent_items=stats.recent_items(5)
         )
         
         # Append completion marker
@@ -274,6 +347,7 @@ class MemoryRoom:
             "4. **Delete Item**: `{'action': 'delete', 'item_id': 'id'}`",
             "5. **Retrieve Memory**: `{'scope': 'session|protocol|global'}`",
             "6. **Get Summary**: `{'summary': true}`",
+            "7. **Search Memory**: `{'operation': 'search', 'labels': {'tone_label': ['overwhelm']}, 'terms': 'text', 'limit': 5}`",
             "",
             "## Memory Room Features",
             "✅ Minimal capture policy enforced",
@@ -298,32 +372,93 @@ class MemoryRoom:
             self.sessions[session_id] = MemorySession(session_id=session_id)
         return self.sessions[session_id]
     
+    def _get_index(self, session_id: str) -> MemoryIndex:
+        """Get the session's memory index, building it from existing items on first use"""
+        index = self.indexes.get(session_id)
+        if index is None:
+            index = MemoryIndex()
+            for item in self._get_or_create_session(session_id).items:
+                index.add(item)
+            self.indexes[session_id] = index
+        return index
+    
+    def _get_stats(self, session_id: str) -> MemoryStats:
+        """Get the session's memory counters, building them from existing items on first use"""
+        stats = self.stats.get(session_id)
+        if stats is None:
+            stats = MemoryStats(self._get_or_create_session(session_id).items)
+            self.stats[session_id] = stats
+        return stats
+    
+    def search_memory(
+        self,
+        session_id: str,
+        labels: Optional[LabelFilter] = None,
+        terms: Optional[Any] = None,
+        exclude: Optional[LabelFilter] = None,
+        limit: Optional[int] = 10
+    ) -> List[MemoryItem]:
+        """
+        Search a session's active memory by labels and note terms, most recent first.
+        See MemoryIndex.search for the filter semantics.
+        """
+        return self._get_index(session_id).search(labels, terms, exclude, limit)
+    
     def get_memory_for_room(
         self,
         room_id: str,
         session_id: str,
         protocol_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get memory context for a downstream room"""
+        """
+        Get memory context for a downstream room.
+        Served from the context cache when prefetched or computed since the
+        last memory write; the returned dict is shared and must not be mutated.
+        """
+        context = self.context_cache.get(session_id, room_id, protocol_id)
+        if context is not None:
+            return context
+        
         session = self._get_or_create_session(session_id)
-        return MemoryContinuity.get_context_for_room(
+        version = self.context_cache.version(session_id)
+        context = MemoryContinuity.get_context_for_room(
             session.items, room_id, session_id, protocol_id
         )
+        self.context_cache.put(session_id, room_id, protocol_id, context, version)
+        return context
+    
+    async def prefetch_memory_for_room(
+        self,
+        room_id: str,
+        session_id: str,
+        protocol_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute a downstream room's memory context on a worker thread and
+        cache it, so the room's later get_memory_for_room is a cache hit.
+        """
+        context = self.context_cache.get(session_id, room_id, protocol_id)
+        if context is not None:
+            return context
+        
+        # Snapshot the items here; a write during the computation bumps the
+        # version, and the stale result is then returned but not cached
+        items = list(self._get_or_create_session(session_id).items)
+        version = self.context_cache.version(session_id)
+        context = await asyncio.to_thread(
+            MemoryContinuity.get_context_for_room, items, room_id, session_id, protocol_id
+        )
+        self.context_cache.put(session_id, room_id, protocol_id, context, version)
+        return context
     
     def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """Get statistics for a specific session"""
         session = self._get_or_create_session(session_id)
-        
-        active_items = [item for item in session.items if not item.deleted_at]
-        deleted_items = [item for item in session.items if item.deleted_at]
-        pinned_items = [item for item in active_items if item.is_pinned]
+        counts = self._get_stats(session_id).counts(MemoryScope.GLOBAL)
         
         return {
             "session_id": session_id,
-            "total_items": len(session.items),
-            "active_items": len(active_items),
-            "deleted_items": len(deleted_items),
-            "pinned_items": len(pinned_items),
+            **counts.as_dict(),
             "created_at": session.created_at.isoformat(),
             "last_accessed": session.last_accessed.isoformat()
         }
@@ -0,0 +1,216 @@
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .contract_types import MemoryItem, MemoryScope
+from .continuity import MemoryContinuity
+from .governance import MemoryGovernance
+
+
+ScopeKey = Tuple[MemoryScope, Optional[str]]
+
+RECENT_WINDOW = timedelta(hours=24)
+RECENT_BUCKET = timedelta(hours=1)
+
+
+class RecentCounter:
+    """
+    Counts timestamps inside a sliding window using fixed-width buckets.
+
+    Counting sums at most window/bucket buckets, however many items there
+    are. A bucket is counted while any part of it is inside the window, so
+    counts are exact to within one bucket at the old edge.
+    """
+
+    def __init__(self, window: timedelta = RECENT_WINDOW, bucket: timedelta = RECENT_BUCKET):
+        if bucket <= timedelta(0) or window < bucket:
+            raise ValueError("bucket must be positive and no longer than window")
+        self.window = window
+        self._bucket_s = bucket.total_seconds()
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, when: datetime, amount: int = 1, now: Optional[datetime] = None):
+        """Count a timestamp; negative amounts uncount one, and expired buckets are ignored"""
+        index = self._index(when)
+        if index < self._oldest_index(now):
+            return
+        count = self._buckets.get(index, 0) + amount
+        if count > 0:
+            self._buckets[index] = count
+        else:
+            self._buckets.pop(index, None)
+
+    def count(self, now: Optional[datetime] = None) -> int:
+        """Timestamps counted within the window ending now"""
+        oldest = self._oldest_index(now)
+        for index in [index for index in self._buckets if index < oldest]:
+            del self._buckets[index]
+        return sum(self._buckets.values())
+
+    def _index(self, when: datetime) -> int:
+        return int(when.timestamp() // self._bucket_s)
+
+    def _oldest_index(self, now: Optional[datetime]) -> int:
+        return self._index((now or datetime.now()) - self.window)
+
+
+class MemoryCounts:
+    """Aggregate counters for the items in one memory scope"""
+
+    def __init__(self):
+        self.total = 0
+        self.active = 0
+        self.deleted = 0
+        self.pinned = 0
+        self.compliant = 0
+        self.tones: Counter = Counter()
+        self.residues: Counter = Counter()
+        self.readiness: Counter = Counter()
+        self.recent = RecentCounter()
+
+    def as_dict(self) -> Dict[str, int]:
+        """Item counts in the keys used by session stats"""
+        return {
+            "total_items": self.total,
+            "active_items": self.active,
+            "deleted_items": self.deleted,
+            "pinned_items": self.pinned
+        }
+
+    def _apply(self, entry: "_Entry", sign: int):
+        self.total += sign
+        if entry.deleted:
+            self.deleted += sign
+            return
+        self.active += sign
+        self.pinned += sign if entry.pinned else 0
+        self.compliant += sign if entry.compliant else 0
+        for counter, label in ((self.tones, entry.tone), (self.residues, entry.residue), (self.readiness, entry.readiness)):
+            counter[label] += sign
+            if counter[label] <= 0:
+                del counter[label]
+        self.recent.add(entry.updated_at, sign)
+
+
+class _Entry(NamedTuple):
+    """What one item contributed to the counters when it was last tracked"""
+    scopes: Tuple[ScopeKey, ...]
+    tone: str
+    residue: str
+    readiness: str
+    pinned: bool
+    deleted: bool
+    compliant: bool
+    updated_at: datetime
+
+
+_EMPTY = MemoryCounts()
+
+
+class MemoryStats:
+    """
+    Incrementally maintained memory counters for one room session.
+
+    Every capture and user control write re-tracks the items it touched:
+    the item's previous contribution is subtracted and its current one
+    added, per session, per protocol and globally. Summaries then read
+    counters instead of walking the items.
+    """
+
+    def __init__(self, items: Iterable[MemoryItem] = ()):
+        self._counts: Dict[ScopeKey, MemoryCounts] = {}
+        self._entries: Dict[str, _Entry] = {}
+        # Active item ids, least recently written first
+        self._recent: "OrderedDict[str, MemoryItem]" = OrderedDict()
+        for item in sorted(items, key=lambda item: item.updated_at):
+            self.track(item)
+
+    def track(self, item: MemoryItem):
+        """Count an item as it is now, replacing what it counted before"""
+        previous = self._entries.get(item.item_id)
+        if previous is not None:
+            self._apply(previous, -1)
+
+        entry = self._entry(item)
+        self._entries[item.item_id] = entry
+        self._apply(entry, 1)
+
+        self._recent.pop(item.item_id, None)
+        if not item.deleted_at:
+            self._recent[item.item_id] = item
+
+    def counts(self, scope: MemoryScope, scope_id: Optional[str] = None) -> MemoryCounts:
+        """Counters for a scope; session and protocol scopes need their id. Do not mutate."""
+        if scope == MemoryScope.GLOBAL:
+            scope_id = None
+        elif not scope_id:
+            return _EMPTY
+        return self._counts.get((scope, scope_id), _EMPTY)
+
+    def recent_items(self, limit: int = 5) -> List[MemoryItem]:
+        """Most recently written active items, newest first"""
+        recent = []
+        for item_id in reversed(self._recent):
+            if len(recent) >= limit:
+                break
+            recent.append(self._recent[item_id])
+        return recent
+
+    def summary(self, scope: MemoryScope, scope_id: Optional[str] = None, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Scope summary in the shape of MemoryContinuity.get_memory_summary"""
+        counts = self.counts(scope, scope_id)
+        if not counts.active:
+            return {
+                "scope": scope.value,
+                "total_items": 0,
+                "pinned_items": 0,
+                "recent_items": 0,
+                "summary": "No memory items found"
+            }
+        return {
+            "scope": scope.value,
+            "total_items": counts.active,
+            "pinned_items": counts.pinned,
+            "recent_items": counts.recent.count(now),
+            "summary": MemoryContinuity.format_summary_text(
+                scope, counts.active, counts.tones, counts.residues, counts.pinned
+            )
+        }
+
+    def governance_summary(self) -> Dict[str, Any]:
+        """Compliance counts in the shape of MemoryGovernance.get_governance_summary, without per-item details"""
+        counts = self.counts(MemoryScope.GLOBAL)
+        return {
+            "total_items": counts.total,
+            "active_items": counts.active,
+            "deleted_items": counts.deleted,
+            "governance_compliant": counts.compliant,
+            "governance_non_compliant": counts.active - counts.compliant,
+            "compliance_rate": counts.compliant / counts.active if counts.active else 0
+        }
+
+    def _apply(self, entry: _Entry, sign: int):
+        for key in entry.scopes:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = MemoryCounts()
+            counts._apply(entry, sign)
+
+    @staticmethod
+    def _entry(item: MemoryItem) -> _Entry:
+        data = item.capture_data
+        scopes: List[ScopeKey] = [(MemoryScope.GLOBAL, None)]
+        if data.session_id:
+            scopes.append((MemoryScope.SESSION, data.session_id))
+        if data.protocol_id:
+            scopes.append((MemoryScope.PROTOCOL, data.protocol_id))
+        deleted = item.deleted_at is not None
+        return _Entry(
+            scopes=tuple(scopes),
+            tone=data.tone_label,
+            residue=data.residue_label,
+            readiness=data.readiness_state,
+            pinned=item.is_pinned,
+            deleted=deleted,
+            compliant=not deleted and MemoryGovernance.validate_memory_item(item).is_allowed,
+            updated_at=item.updated_at
+        )
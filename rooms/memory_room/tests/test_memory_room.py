@@ -1,6 +1,7 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from rooms.memory_room.memory_room import MemoryRoom, run_memory_room
+from rooms.room_protocol import AsyncRoom
 from rooms.memory_room.contract_types import (
     MemoryRoomInput, MemoryRoomOutput, MemoryItem, MemoryScope,
     UserAction, CaptureData, MemoryQuery, MemorySession
@@ -10,6 +11,8 @@ from rooms.memory_room.control import UserControl
 from rooms.memory_room.continuity import MemoryContinuity
 from rooms.memory_room.governance import MemoryGovernance
 from rooms.memory_room.completion import MemoryCompletion
+from rooms.memory_room.memory_index import MemoryIndex
+from rooms.memory_room.memory_stats import MemoryStats, RecentCounter
 
 
 class TestMemoryCapture:
@@ -519,6 +522,227 @@ class TestRunMemoryRoomFunction:
         assert result.next_action == "continue"
 
 
+class TestAsyncMemoryRoom:
+    """Test the async room protocol entry point"""
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_sync_entry_point(self):
+        """Test that run conforms to AsyncRoom and returns what run_memory_room returns"""
+        room = MemoryRoom()
+        input_data = MemoryRoomInput(session_state_ref="session-async", payload={"tone_label": "calm"})
+        
+        assert isinstance(room, AsyncRoom)
+        result = await room.run(input_data)
+        
+        assert result == MemoryRoom().run_memory_room(input_data)
+
+
+class TestMemoryContextCache:
+    """Test cached and prefetched downstream room contexts"""
+    
+    def _capture(self, room, session_id="session-ctx", tone="calm"):
+        room.run_memory_room(MemoryRoomInput(session_state_ref=session_id, payload={"tone_label": tone}))
+    
+    def _count_context_builds(self, monkeypatch):
+        calls = []
+        original = MemoryContinuity.get_context_for_room
+        
+        def counting(*args, **kwargs):
+            calls.append(args[1])
+            return original(*args, **kwargs)
+        
+        monkeypatch.setattr(MemoryContinuity, "get_context_for_room", staticmethod(counting))
+        return calls
+    
+    def test_context_cached_until_write(self, monkeypatch):
+        """Test that contexts are reused until a capture or user control write"""
+        room = MemoryRoom()
+        self._capture(room)
+        calls = self._count_context_builds(monkeypatch)
+        
+        first = room.get_memory_for_room("walk_room", "session-ctx")
+        assert room.get_memory_for_room("walk_room", "session-ctx") is first
+        assert calls == ["walk_room"]
+        
+        self._capture(room, tone="focused")
+        assert room.get_memory_for_room("walk_room", "session-ctx")["session_context"]["count"] == 2
+        
+        item_id = room.sessions["session-ctx"].items[0].item_id
+        room.run_memory_room(MemoryRoomInput(
+            session_state_ref="session-ctx", payload={"action": "pin", "item_id": item_id}
+        ))
+        context = room.get_memory_for_room("walk_room", "session-ctx")
+        assert any(item["is_pinned"] for item in context["session_context"]["items"])
+        assert calls == ["walk_room", "walk_room", "walk_room"]
+    
+    def test_contexts_are_per_session(self):
+        """Test that a write to one session keeps other sessions cached"""
+        room = MemoryRoom()
+        self._capture(room, "session-a")
+        self._capture(room, "session-b")
+        context_b = room.get_memory_for_room("exit_room", "session-b")
+        
+        self._capture(room, "session-a")
+        
+        assert room.context_cache.get("session-a", "exit_room") is None
+        assert room.get_memory_for_room("exit_room", "session-b") is context_b
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_makes_lookup_a_cache_hit(self, monkeypatch):
+        """Test that a prefetched context is served without recompute"""
+        room = MemoryRoom()
+        self._capture(room)
+        calls = self._count_context_builds(monkeypatch)
+        
+        prefetched = await room.prefetch_memory_for_room("protocol_room", "session-ctx")
+        
+        assert room.get_memory_for_room("protocol_room", "session-ctx") is prefetched
+        assert calls == ["protocol_room"]
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_racing_a_write_is_not_cached(self, monkeypatch):
+        """Test that a context computed before a concurrent write is discarded"""
+        room = MemoryRoom()
+        self._capture(room)
+        original = MemoryContinuity.get_context_for_room
+        
+        def racing(*args, **kwargs):
+            context = original(*args, **kwargs)
+            self._capture(room, tone="focused")
+            return context
+        
+        monkeypatch.setattr(MemoryContinuity, "get_context_for_room", staticmethod(racing))
+        stale = await room.prefetch_memory_for_room("walk_room", "session-ctx")
+        monkeypatch.setattr(MemoryContinuity, "get_context_for_room", staticmethod(original))
+        
+        assert stale["session_context"]["count"] == 1
+        assert room.context_cache.get("session-ctx", "walk_room") is None
+        assert room.get_memory_for_room("walk_room", "session-ctx")["session_context"]["count"] == 2
+
+
+class TestMemoryIndex:
+    """Test the inverted label index and memory search"""
+    
+    def _item(self, item_id, day, tone="calm", residue="none", readiness="NOW", notes="unspecified"):
+        data = MemoryCapture.create_capture_data(
+            tone_label=tone, residue_label=residue, readiness_state=readiness,
+            integration_notes=notes, session_id="session-idx"
+        )
+        data.timestamp = datetime(2025, 1, day)
+        return MemoryCapture.create_memory_item(data, item_id)
+    
+    def test_boolean_label_filters(self):
+        """Test OR within a field, AND across fields and terms, and exclusions"""
+        index = MemoryIndex()
+        index.add(self._item("a", 1, tone="Overwhelm", readiness="HOLD", notes="Too many launches"))
+        index.add(self._item("b", 2, tone="overwhelm", readiness="NOW"))
+        index.add(self._item("c", 3, tone="anxious", readiness="HOLD", notes="launches again"))
+        
+        ids = lambda items: [item.item_id for item in items]
+        assert ids(index.search(labels={"tone_label": "overwhelm"})) == ["b", "a"]
+        assert ids(index.search(labels={"tone_label": ["overwhelm", "anxious"], "readiness_state": "HOLD"})) == ["c", "a"]
+        assert ids(index.search(terms="Launches", exclude={"tone_label": "anxious"})) == ["a"]
+        assert ids(index.search(labels={"tone_label": "overwhelm"}, limit=1)) == ["b"]
+        assert index.label_count("tone_label", "OVERWHELM") == 2
+        with pytest.raises(ValueError):
+            index.search(labels={"integration_notes": "x"})
+    
+    def test_index_follows_edit_and_delete(self):
+        """Test that edits re-index and deletes remove items through the room"""
+        room = MemoryRoom()
+        for tone in ["overwhelm", "calm"]:
+            room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={"tone_label": tone}))
+        first, second = room._get_or_create_session("session-idx").items
+        
+        room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={
+            "action": "edit", "item_id": second.item_id, "field_name": "tone_label", "new_value": "overwhelm"
+        }))
+        assert {item.item_id for item in room.search_memory("session-idx", {"tone_label": "overwhelm"})} == {first.item_id, second.item_id}
+        assert room.search_memory("session-idx", {"tone_label": "calm"}) == []
+        
+        room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={"action": "delete", "item_id": first.item_id}))
+        assert room.search_memory("session-idx", {"tone_label": "overwhelm"}) == [second]
+    
+    def test_search_operation(self):
+        """Test that the search operation reports the most recent match"""
+        room = MemoryRoom()
+        room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={"tone_label": "overwhelm"}))
+        
+        result = room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={
+            "operation": "search", "labels": {"tone_label": ["overwhelm"]}
+        }))
+        missing = room.run_memory_room(MemoryRoomInput(session_state_ref="session-idx", payload={
+            "operation": "search", "labels": {"tone_label": "joy"}
+        }))
+        
+        assert "**Matches**: 1" in result.display_text
+        assert "**Last Seen**" in result.display_text
+        assert "No items match the search." in missing.display_text
+        assert result.display_text.endswith(" [[COMPLETE]]")
+
+
+class TestMemoryStats:
+    """Test incrementally maintained memory counters"""
+    
+    def _run(self, room, payload, session_id="session-stats"):
+        return room.run_memory_room(MemoryRoomInput(session_state_ref=session_id, payload=payload))
+    
+    def test_recent_counter_window(self):
+        """Test that the bucketed counter drops buckets that leave the window"""
+        counter = RecentCounter(window=timedelta(hours=24), bucket=timedelta(hours=1))
+        now = datetime(2025, 1, 2, 12, 30)
+        
+        counter.add(now - timedelta(hours=30), now=now)
+        counter.add(now - timedelta(hours=20), now=now)
+        counter.add(now, now=now)
+        assert counter.count(now) == 2
+        counter.add(now, -1, now=now)
+        assert counter.count(now) == 1
+        counter.add(now, now=now)
+        assert counter.count(now + timedelta(hours=5)) == 1
+        with pytest.raises(ValueError):
+            RecentCounter(window=timedelta(minutes=1), bucket=timedelta(hours=1))
+    
+    def test_counters_match_full_recount(self):
+        """Test that counters after captures and user control equal a recount of the items"""
+        room = MemoryRoom()
+        for tone, protocol in [("calm", "grounding"), ("anxious", "grounding"), ("calm", None)]:
+            payload = {"tone_label": tone, "residue_label": "light"}
+            if protocol:
+                payload["protocol_id"] = protocol
+            self._run(room, payload)
+        items = room._get_or_create_session("session-stats").items
+        self._run(room, {"action": "pin", "item_id": items[0].item_id})
+        self._run(room, {"action": "edit", "item_id": items[1].item_id, "field_name": "tone_label", "new_value": "calm"})
+        self._run(room, {"action": "delete", "item_id": items[2].item_id})
+        
+        stats = room._get_stats("session-stats")
+        for scope, scope_id in [(MemoryScope.SESSION, "session-stats"), (MemoryScope.PROTOCOL, "grounding"), (MemoryScope.GLOBAL, None)]:
+            expected = MemoryContinuity.get_memory_summary(items, scope, "session-stats", "grounding")
+            assert stats.summary(scope, scope_id) == expected
+        
+        expected = MemoryGovernance.get_governance_summary(items)
+        del expected["governance_details"]
+        assert stats.governance_summary() == expected
+        assert MemoryStats(items).counts(MemoryScope.GLOBAL).as_dict() == stats.counts(MemoryScope.GLOBAL).as_dict()
+        assert [item.item_id for item in stats.recent_items()] == [items[1].item_id, items[0].item_id]
+    
+    def test_session_stats_and_summary_use_counters(self):
+        """Test that session stats and the summary report the maintained counts"""
+        room = MemoryRoom()
+        self._run(room, {"tone_label": "calm"})
+        self._run(room, {"tone_label": "open"})
+        item_id = room._get_or_create_session("session-stats").items[0].item_id
+        self._run(room, {"action": "delete", "item_id": item_id})
+        
+        stats = room.get_session_stats("session-stats")
+        summary = self._run(room, {"summary": True})
+        
+        assert (stats["total_items"], stats["active_items"], stats["deleted_items"], stats["pinned_items"]) == (2, 1, 1, 0)
+        assert "**Deleted Items**: 1" in summary.display_text
+        assert "**open**" in summary.display_text and "**calm**" not in summary.display_text
+
+
 class TestNoTypeScriptArtifacts:
     """Test that no TypeScript artifacts are present"""
     
@@ -5,7 +5,7 @@ Demonstrates basic and advanced usage patterns
 """
 
 from .protocol_room import run_protocol_room
-from .types import ProtocolRoomInput
+from .room_types import ProtocolRoomInput
 
 
 def basic_protocol_request_example():
@@ -19,6 +19,10 @@ class ProtocolRoom:
         """Initialize Protocol Room with default settings"""
         pass
     
+    async def run(self, input_data: ProtocolRoomInput) -> ProtocolRoomOutput:
+        """Async room protocol entry point; canon lookups are in-memory and run inline"""
+        return self.run_protocol_room(input_data)
+    
     def run_protocol_room(self, input_data: ProtocolRoomInput) -> ProtocolRoomOutput:
         """
         Main entry point that orchestrates the Protocol Room protocol.
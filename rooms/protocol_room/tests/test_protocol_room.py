@@ -4,13 +4,10 @@ Tests all behavioral invariants and edge cases using pytest
 """
 
 import pytest
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from rooms.protocol_room.protocol_room import ProtocolRoom, run_protocol_room
+from rooms.room_protocol import AsyncRoom
 from rooms.protocol_room.room_types import ProtocolRoomInput, ProtocolRoomOutput, ProtocolDepth, ProtocolText, ScenarioMapping, IntegrityResult
 from rooms.protocol_room.canon import fetch_protocol_text, get_protocol_by_depth, list_available_protocols
 from rooms.protocol_room.depth import select_protocol_depth, format_depth_label, get_depth_description
@@ -387,6 +384,39 @@ class TestRunProtocolRoomFunction:
         assert result.display_text.endswith(" [[COMPLETE]]")
 
 
+class TestAsyncProtocolRoom:
+    """Test suite for the async room protocol entry point"""
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_sync_entry_point(self):
+        """Test that run conforms to AsyncRoom and returns what run_protocol_room returns"""
+        room = ProtocolRoom()
+        input_data = ProtocolRoomInput(
+            session_state_ref='async-test',
+            payload={'protocol_id': 'clearing_entry', 'depth': 'theme'}
+        )
+        
+        assert isinstance(room, AsyncRoom)
+        result = await room.run(input_data)
+        
+        assert result == room.run_protocol_room(input_data)
+
+
+class TestLegacyImportPath:
+    """Test suite for the top-level protocol_room alias package"""
+    
+    def test_legacy_imports_share_modules(self):
+        """Test that old import paths resolve to the rooms.protocol_room modules"""
+        import protocol_room
+        from protocol_room.types import ProtocolRoomInput as LegacyInput
+        import protocol_room.canon as legacy_canon
+        import rooms.protocol_room.canon as canon
+        
+        assert legacy_canon is canon
+        assert LegacyInput is ProtocolRoomInput
+        assert protocol_room.run_protocol_room is run_protocol_room
+
+
 class TestNoTypeScriptArtifacts:
     """Test suite to ensure no TypeScript artifacts remain"""
     
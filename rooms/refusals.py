@@ -0,0 +1,55 @@
+"""
+Refusal Library
+Safe fallback refusals from contracts/gates/refusal_library.json, and the
+orchestrator's on_gate_failure policy that routes to them
+"""
+
+import os
+from typing import Any, Dict, Optional
+from . import json_codec
+
+
+CONTRACTS_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "contracts")
+REFUSAL_LIBRARY_PATH = os.path.join(CONTRACTS_ROOT, "gates", "refusal_library.json")
+ORCHESTRATOR_CONTRACT_PATH = os.path.join(CONTRACTS_ROOT, "orchestrator.json")
+
+DEFAULT_REFUSAL_MODE = "not_now"
+
+
+class RefusalLibrary:
+    """Refusal texts keyed by refusal mode (not_now, not_like_this, not_us)"""
+
+    def __init__(self, contract: Dict[str, Any]):
+        self.contract = contract
+        self.modes: Dict[str, str] = dict(contract.get("refusal_modes", {}))
+        if DEFAULT_REFUSAL_MODE not in self.modes:
+            raise ValueError(f"Refusal library must define the '{DEFAULT_REFUSAL_MODE}' mode")
+
+    @classmethod
+    def load(cls, path: str = REFUSAL_LIBRARY_PATH) -> "RefusalLibrary":
+        """Load a refusal library contract from disk"""
+        with open(path, "r", encoding="utf-8") as contract_file:
+            return cls(json_codec.load(contract_file))
+
+    def refuse(self, mode: str = DEFAULT_REFUSAL_MODE) -> Dict[str, str]:
+        """Get the library's output for a refusal mode; unknown modes fall back to not_now"""
+        if mode not in self.modes:
+            mode = DEFAULT_REFUSAL_MODE
+        return {"refusal_text": self.modes[mode], "refusal_mode": mode}
+
+
+_default_library: Optional[RefusalLibrary] = None
+
+
+def get_refusal_library() -> RefusalLibrary:
+    """Get the repository's refusal library, loaded once"""
+    global _default_library
+    if _default_library is None:
+        _default_library = RefusalLibrary.load()
+    return _default_library
+
+
+def load_on_gate_failure(path: str = ORCHESTRATOR_CONTRACT_PATH) -> Dict[str, Any]:
+    """Get the orchestrator contract's on_gate_failure policy"""
+    with open(path, "r", encoding="utf-8") as contract_file:
+        return json_codec.load(contract_file).get("on_gate_failure", {})
@@ -0,0 +1,130 @@
+"""
+Room Registry
+Declarative room_id -> entry point map built from contracts/rooms/*.json
+"""
+
+import importlib
+import os
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from . import json_codec
+
+
+CONTRACTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "contracts", "rooms")
+
+
+class RoomEntry(NamedTuple):
+    """Where a room's run function lives; nothing is imported until resolved"""
+    room_id: str
+    module: str
+    attribute: str
+    contract_path: str
+
+
+class RoomRegistry:
+    """
+    Registry of rooms declared by contract files.
+
+    Contracts are read on first use. A contract may name its entry point
+    as ``"entry_point": "package.module:function"``; otherwise the room is
+    expected at ``<package>.<room_id>`` exporting ``run_<room_id>`` (or
+    ``run``). Resolved callables are cached, so each room module is
+    imported at most once per registry.
+    """
+
+    def __init__(self, contracts_dir: str = CONTRACTS_DIR, package: str = "rooms"):
+        self.contracts_dir = contracts_dir
+        self.package = package
+        self._entries: Optional[Dict[str, RoomEntry]] = None
+        self._resolved: Dict[str, Callable[..., Any]] = {}
+        self._lock = threading.Lock()
+
+    def room_ids(self) -> List[str]:
+        """Get every declared room_id in sorted order"""
+        return sorted(self._load())
+
+    def get_entry(self, room_id: str) -> Optional[RoomEntry]:
+        """Get the declared entry point for a room, or None if undeclared"""
+        return self._load().get(room_id)
+
+    def resolve(self, room_id: str) -> Callable[..., Any]:
+        """
+        Import a room's module and return its run function, cached.
+        Raises ImportError for undeclared or unimportable rooms and
+        AttributeError when the module has no run function.
+        """
+        run_func = self._resolved.get(room_id)
+        if run_func is not None:
+            return run_func
+
+        entry = self.get_entry(room_id)
+        if entry is None:
+            raise ImportError(f"Room {room_id} is not declared in {self.contracts_dir}")
+
+        try:
+            room_module = importlib.import_module(entry.module)
+        except ImportError as e:
+            raise ImportError(f"Could not import room module: {entry.module}") from e
+
+        run_func = getattr(room_module, entry.attribute, None) or getattr(room_module, "run", None)
+        if run_func is None:
+            raise AttributeError(f"Room {room_id} does not have a run function")
+
+        self._resolved[room_id] = run_func
+        return run_func
+
+    def clear_cache(self):
+        """Forget resolved callables and re-read contracts on next use"""
+        with self._lock:
+            self._entries = None
+            self._resolved.clear()
+
+    def _load(self) -> Dict[str, RoomEntry]:
+        entries = self._entries
+        if entries is not None:
+            return entries
+
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._scan()
+            return self._entries
+
+    def _scan(self) -> Dict[str, RoomEntry]:
+        entries = {}
+        try:
+            file_names = sorted(name for name in os.listdir(self.contracts_dir) if name.endswith(".json"))
+        except OSError:
+            return entries
+
+        for file_name in file_names:
+            contract_path = os.path.join(self.contracts_dir, file_name)
+            try:
+                with open(contract_path, "r", encoding="utf-8") as contract_file:
+                    contract = json_codec.load(contract_file)
+            except (OSError, ValueError):
+                # An unreadable contract declares nothing
+                continue
+
+            room_id = contract.get("room_id") if isinstance(contract, dict) else None
+            if not isinstance(room_id, str) or not room_id:
+                continue
+
+            module, _, attribute = str(contract.get("entry_point", "")).partition(":")
+            entries[room_id] = RoomEntry(
+                room_id=room_id,
+                module=module or f"{self.package}.{room_id}",
+                attribute=attribute or f"run_{room_id}",
+                contract_path=contract_path
+            )
+        return entries
+
+
+_default_registry: Optional[RoomRegistry] = None
+
+
+def get_room_registry() -> RoomRegistry:
+    """Get the process-wide registry over the repository's room contracts"""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = RoomRegistry()
+    return _default_registry
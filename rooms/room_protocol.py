@@ -0,0 +1,59 @@
+"""
+Room Protocol
+Uniform async interface implemented by every room
+"""
+
+import asyncio
+import weakref
+from typing import Any, Callable, Protocol, TypeVar, runtime_checkable
+
+
+RoomOutput = TypeVar("RoomOutput")
+
+
+@runtime_checkable
+class AsyncRoom(Protocol):
+    """
+    Async room protocol: every room exposes ``async def run(input_data)``.
+    Rooms whose logic is pure computation run inline; rooms that touch
+    storage hand the blocking part to a worker thread so the event loop
+    keeps serving other sessions.
+    """
+
+    async def run(self, input_data: Any) -> Any:
+        ...
+
+
+class SessionLocks:
+    """
+    Per-session asyncio locks.
+    A lock lives only while some coroutine holds or awaits it, so idle
+    sessions cost nothing.
+    """
+
+    def __init__(self):
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def get(self, session_ref: str) -> asyncio.Lock:
+        lock = self._locks.get(session_ref)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[session_ref] = lock
+        return lock
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+async def run_session_blocking(
+    locks: SessionLocks,
+    session_ref: str,
+    func: Callable[[Any], RoomOutput],
+    input_data: Any
+) -> RoomOutput:
+    """
+    Run a blocking room entry point on a worker thread.
+    Calls for the same session are serialized; different sessions overlap.
+    """
+    async with locks.get(session_ref):
+        return await asyncio.to_thread(func, input_data)
@@ -4,6 +4,7 @@ Implements the Walk Room Protocol and Contract for Lichen Protocol Room Architec
 """
 
 from .walk_room import WalkRoom, run_walk_room
+from .persistence import WalkEventStore
 from .contract_types import (
     WalkRoomInput,
     WalkRoomOutput,
@@ -17,6 +18,7 @@ from .contract_types import (
 __all__ = [
     'WalkRoom',
     'run_walk_room',
+    'WalkEventStore',
     'WalkRoomInput',
     'WalkRoomOutput',
     'WalkStep',
@@ -7,6 +7,15 @@ from typing import List, Optional
 from .contract_types import CompletionPrompt, WalkStep
 
 
+COMPLETION_STATUS_LINES = (
+    "## Completion Status",
+    "✅ All steps completed in canonical order",
+    "✅ Pacing enforced at every step",
+    "✅ Diagnostics captured across the walk",
+    "✅ Closure confirmed before termination"
+)
+
+
 class WalkCompletion:
     """Handles walk completion and closure enforcement"""
     
@@ -28,28 +37,44 @@ class WalkCompletion:
         diagnostics_summary: str
     ) -> str:
         """Format a summary of the completed walk"""
+        return WalkCompletion.compose_walk_summary(
+            protocol_title,
+            len(steps),
+            WalkCompletion.format_step_summary(steps),
+            diagnostics_summary
+        )
+    
+    @staticmethod
+    def format_step_summary(steps: List[WalkStep]) -> str:
+        """Format the per-step summary lines (depends only on the protocol)"""
+        return "\n".join(f"- **{step.title}**: {step.description}" for step in steps)
+    
+    @staticmethod
+    def compose_walk_summary(
+        protocol_title: str,
+        total_steps: int,
+        step_summary: str,
+        diagnostics_summary: str
+    ) -> str:
+        """Compose the walk summary from pre-rendered fragments"""
         summary_parts = [
             f"# Walk Complete: {protocol_title}",
             "",
-            f"**Steps Completed**: {len(steps)}",
+            f"**Steps Completed**: {total_steps}",
             "",
             "## Step Summary"
         ]
         
-        for step in steps:
-            summary_parts.append(f"- **{step.title}**: {step.description}")
+        if step_summary:
+            summary_parts.append(step_summary)
         
         summary_parts.extend([
             "",
             "## Diagnostics Summary",
             diagnostics_summary,
-            "",
-            "## Completion Status",
-            "✅ All steps completed in canonical order",
-            "✅ Pacing enforced at every step",
-            "✅ Diagnostics captured across the walk",
-            "✅ Closure confirmed before termination"
+            ""
         ])
+        summary_parts.extend(COMPLETION_STATUS_LINES)
         
         return "\n".join(summary_parts)
     
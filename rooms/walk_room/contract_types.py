@@ -84,3 +84,5 @@ class WalkSession:
     diagnostics: List[StepDiagnostics]
     completion_confirmed: bool
     protocol_id: str
+    protocol_hash: Optional[str] = None  # fingerprint of steps, keys the render cache
+    revision: int = 0  # bumped on every mutation, invalidates cached status text
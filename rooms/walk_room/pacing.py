@@ -7,6 +7,21 @@ from typing import Literal, Optional, List
 from .contract_types import PaceState
 
 
+PACE_DESCRIPTIONS = {
+    PaceState.NOW.value: "Ready to proceed immediately",
+    PaceState.HOLD.value: "Pause here until ready to continue",
+    PaceState.LATER.value: "Schedule for later session",
+    PaceState.SOFT_HOLD.value: "Brief pause, can continue when ready"
+}
+
+PACE_GUIDANCE = {
+    PaceState.NOW.value: "You can proceed to the next step.",
+    PaceState.HOLD.value: "Take time to process this step before continuing.",
+    PaceState.LATER.value: "This step will be available in your next session.",
+    PaceState.SOFT_HOLD.value: "Take a moment, then continue when ready."
+}
+
+
 class PaceGovernor:
     """Governs pacing for walk steps with deterministic next_action mapping"""
     
@@ -41,24 +56,12 @@ class PaceGovernor:
     @staticmethod
     def get_pace_description(pace: str) -> str:
         """Get human-readable description of pace state"""
-        pace_descriptions = {
-            PaceState.NOW.value: "Ready to proceed immediately",
-            PaceState.HOLD.value: "Pause here until ready to continue",
-            PaceState.LATER.value: "Schedule for later session",
-            PaceState.SOFT_HOLD.value: "Brief pause, can continue when ready"
-        }
-        return pace_descriptions.get(pace, "Unknown pace state")
+        return PACE_DESCRIPTIONS.get(pace, "Unknown pace state")
     
     @staticmethod
     def get_pace_guidance(pace: str) -> str:
         """Get guidance text for the current pace state"""
-        guidance = {
-            PaceState.NOW.value: "You can proceed to the next step.",
-            PaceState.HOLD.value: "Take time to process this step before continuing.",
-            PaceState.LATER.value: "This step will be available in your next session.",
-            PaceState.SOFT_HOLD.value: "Take a moment, then continue when ready."
-        }
-        return guidance.get(pace, "Please select a valid pace.")
+        return PACE_GUIDANCE.get(pace, "Please select a valid pace.")
     
     @staticmethod
     def is_structural_pause(pace: str) -> bool:
@@ -0,0 +1,226 @@
+"""
+Persistence Module
+Append-only walk event log with periodic compact snapshots for session restore
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .contract_types import WalkSession, WalkStep, WalkState, StepDiagnostics
+from .. import json_codec
+
+
+# Event types recorded for every walk session mutation
+EVENT_START = "start"
+EVENT_SET_PACE = "set_pace"
+EVENT_ADVANCE = "advance"
+EVENT_CONFIRM_COMPLETION = "confirm_completion"
+
+WALK_EVENT_TYPES = (EVENT_START, EVENT_SET_PACE, EVENT_ADVANCE, EVENT_CONFIRM_COMPLETION)
+
+
+@dataclass
+class WalkEvent:
+    """Single entry in a session's append-only event log"""
+    seq: int
+    event_type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "type": self.event_type, "data": self.data}
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "WalkEvent":
+        return cls(seq=raw["seq"], event_type=raw["type"], data=raw.get("data", {}))
+
+
+def session_to_dict(session: WalkSession) -> Dict[str, Any]:
+    """Serialize a walk session into a compact snapshot dict"""
+    return {
+        "current_step_index": session.current_step_index,
+        "walk_state": session.walk_state.value,
+        "steps": [
+            [step.step_index, step.title, step.content, step.description, step.estimated_time]
+            for step in session.steps
+        ],
+        "diagnostics": [
+            [diag.step_index, diag.tone_label, diag.residue_label, diag.readiness_state]
+            for diag in session.diagnostics
+        ],
+        "completion_confirmed": session.completion_confirmed,
+        "protocol_id": session.protocol_id,
+        "protocol_hash": session.protocol_hash
+    }
+
+
+def session_from_dict(state: Dict[str, Any]) -> WalkSession:
+    """Rebuild a walk session from a snapshot dict"""
+    return WalkSession(
+        current_step_index=state["current_step_index"],
+        walk_state=WalkState(state["walk_state"]),
+        steps=[
+            WalkStep(
+                step_index=index,
+                title=title,
+                content=content,
+                description=description,
+                estimated_time=estimated_time
+            )
+            for index, title, content, description, estimated_time in state["steps"]
+        ],
+        diagnostics=[
+            StepDiagnostics(
+                step_index=index,
+                tone_label=tone,
+                residue_label=residue,
+                readiness_state=readiness
+            )
+            for index, tone, residue, readiness in state["diagnostics"]
+        ],
+        completion_confirmed=state["completion_confirmed"],
+        protocol_id=state["protocol_id"],
+        protocol_hash=state.get("protocol_hash")
+    )
+
+
+class WalkEventStore:
+    """
+    File-backed event log and snapshot store for walk sessions.
+
+    Each session has one append-only JSONL log and at most one snapshot.
+    Writing a snapshot compacts the log, so restoring a session reads one
+    snapshot plus at most ``snapshot_interval`` events regardless of how
+    long the walk has been running.
+    """
+
+    def __init__(self, base_dir: str, snapshot_interval: int = 16, fsync: bool = False):
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+        self.base_dir = base_dir
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self._last_seq: Dict[str, int] = {}
+        self._snapshot_seq: Dict[str, int] = {}
+        os.makedirs(base_dir, exist_ok=True)
+
+    def append(self, session_ref: str, event_type: str, data: Optional[Dict[str, Any]] = None) -> WalkEvent:
+        """Append an event to the session log and return it with its sequence number"""
+        if event_type not in WALK_EVENT_TYPES:
+            raise ValueError(f"Unknown walk event type: {event_type}")
+
+        if event_type == EVENT_START:
+            # A new walk supersedes everything recorded for this session
+            self.reset(session_ref)
+
+        event = WalkEvent(
+            seq=self._get_last_seq(session_ref) + 1,
+            event_type=event_type,
+            data=data or {}
+        )
+        line = json_codec.dumps(event.to_dict(), ensure_ascii=False)
+        with open(self._log_path(session_ref), "a", encoding="utf-8") as log_file:
+            log_file.write(line + "\n")
+            self._sync(log_file)
+
+        self._last_seq[session_ref] = event.seq
+        return event
+
+    def needs_snapshot(self, session_ref: str) -> bool:
+        """Check whether enough events accumulated since the last snapshot"""
+        last_seq = self._get_last_seq(session_ref)
+        return last_seq - self._snapshot_seq.get(session_ref, 0) >= self.snapshot_interval
+
+    def write_snapshot(self, session_ref: str, session: WalkSession):
+        """Atomically write a snapshot at the current sequence and compact the log"""
+        seq = self._get_last_seq(session_ref)
+        snapshot_path = self._snapshot_path(session_ref)
+        tmp_path = snapshot_path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as snapshot_file:
+            snapshot_file.write(json_codec.dumps(
+                {"seq": seq, "session": session_to_dict(session)},
+                ensure_ascii=False
+            ))
+            self._sync(snapshot_file)
+        os.replace(tmp_path, snapshot_path)
+
+        # Events up to seq are now covered by the snapshot; replay skips any
+        # that survive a crash between the replace above and this truncate.
+        with open(self._log_path(session_ref), "w", encoding="utf-8") as log_file:
+            self._sync(log_file)
+
+        self._snapshot_seq[session_ref] = seq
+
+    def load(self, session_ref: str) -> Tuple[Optional[WalkSession], List[WalkEvent]]:
+        """
+        Load the latest snapshot and the tail of events recorded after it
+        Returns: (snapshot_session_or_None, tail_events)
+        """
+        snapshot_seq = 0
+        session = None
+
+        snapshot_path = self._snapshot_path(session_ref)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                snapshot = json_codec.load(snapshot_file)
+            snapshot_seq = snapshot["seq"]
+            session = session_from_dict(snapshot["session"])
+
+        events = [event for event in self._read_log(session_ref) if event.seq > snapshot_seq]
+
+        self._snapshot_seq[session_ref] = snapshot_seq
+        self._last_seq[session_ref] = events[-1].seq if events else snapshot_seq
+        return session, events
+
+    def has_session(self, session_ref: str) -> bool:
+        """Check whether anything has been recorded for a session"""
+        return (
+            os.path.exists(self._snapshot_path(session_ref))
+            or os.path.exists(self._log_path(session_ref))
+        )
+
+    def reset(self, session_ref: str):
+        """Discard the snapshot and event log of a session"""
+        for path in (self._snapshot_path(session_ref), self._log_path(session_ref)):
+            if os.path.exists(path):
+                os.remove(path)
+        self._last_seq[session_ref] = 0
+        self._snapshot_seq[session_ref] = 0
+
+    def _read_log(self, session_ref: str) -> List[WalkEvent]:
+        log_path = self._log_path(session_ref)
+        if not os.path.exists(log_path):
+            return []
+
+        events = []
+        with open(log_path, "r", encoding="utf-8") as log_file:
+            for line in log_file:
+                try:
+                    events.append(WalkEvent.from_dict(json_codec.loads(line)))
+                except (json.JSONDecodeError, KeyError):
+                    # A torn final write from a crash ends the usable log
+                    break
+        return events
+
+    def _get_last_seq(self, session_ref: str) -> int:
+        if session_ref not in self._last_seq:
+            self.load(session_ref)
+        return self._last_seq[session_ref]
+
+    def _sync(self, file_obj):
+        file_obj.flush()
+        if self.fsync:
+            os.fsync(file_obj.fileno())
+
+    def _session_key(self, session_ref: str) -> str:
+        # Hash the reference so arbitrary session ids are safe file names
+        return hashlib.sha256(session_ref.encode("utf-8")).hexdigest()
+
+    def _log_path(self, session_ref: str) -> str:
+        return os.path.join(self.base_dir, self._session_key(session_ref) + ".events.jsonl")
+
+    def _snapshot_path(self, session_ref: str) -> str:
+        return os.path.join(self.base_dir, self._session_key(session_ref) + ".snapshot.json")
@@ -0,0 +1,213 @@
+"""
+Render Module
+Lazy, cached rendering of walk step, status and summary text
+"""
+
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from .contract_types import WalkStep, WalkSession
+from .pacing import PaceGovernor
+from .step_diag import StepDiagnosticCapture
+from .completion import WalkCompletion
+from .. import json_codec
+
+
+PACE_REQUIRED_FRAGMENT = "\n".join([
+    "",
+    "**Pace Required**: Please set your pace for this step",
+    "Options: NOW, HOLD, LATER, SOFT_HOLD"
+])
+
+_revision_counter = itertools.count(1)
+
+
+def next_revision() -> int:
+    """
+    Issue a process-unique session revision stamp.
+    Stamps never repeat, so a restarted session can never hit stale text.
+    """
+    return next(_revision_counter)
+
+
+def compute_protocol_hash(protocol_id: str, steps: List[WalkStep]) -> str:
+    """
+    Compute a stable fingerprint for a protocol's renderable content.
+    Two walks over identical steps share cached step bodies.
+    """
+    material = {
+        "protocol_id": protocol_id,
+        "steps": [
+            [step.step_index, step.title, step.content, step.description, step.estimated_time]
+            for step in steps
+        ]
+    }
+    encoded = json_codec.dumps(material, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class WalkRenderCache:
+    """
+    Bounded LRU cache of rendered walk text fragments.
+
+    Step text is keyed by (protocol hash, step index, pace) and is a pure
+    function of that key. Status and summary text are keyed by the session
+    revision, which the room bumps on every session mutation. The cache
+    is shared by sessions running on worker threads, so access is locked.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def _put(self, key: Hashable, text: str) -> str:
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return text
+
+    def render_step(
+        self,
+        session: WalkSession,
+        step: WalkStep,
+        pace: Optional[str] = None
+    ) -> str:
+        """Render step text, reusing the cached body and pace fragments"""
+        protocol_hash = self._protocol_hash(session)
+        key = ("step", protocol_hash, step.step_index, pace)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        body = self._step_body(protocol_hash, step, len(session.steps))
+        return self._put(key, body + "\n" + self._pace_fragment(pace))
+
+    def render_status(self, session: WalkSession) -> str:
+        """Render walk status text, recomposed only after a session mutation"""
+        key = ("status", self._protocol_hash(session), session.revision)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        current_step_num, total_steps = session.current_step_index + 1, len(session.steps)
+
+        status_parts = [
+            f"# Walk Status: {session.protocol_id}",
+            f"**Current Step**: {current_step_num} of {total_steps}",
+            f"**Walk State**: {session.walk_state.value}",
+            f"**Steps Completed**: {len(session.diagnostics)}",
+            f"**Completion Confirmed**: {session.completion_confirmed}",
+            ""
+        ]
+
+        if session.diagnostics:
+            status_parts.extend([
+                "## Recent Diagnostics",
+                StepDiagnosticCapture.format_diagnostics_summary(session.diagnostics[-3:])
+            ])
+
+        return self._put(key, "\n".join(status_parts))
+
+    def render_summary(self, session: WalkSession) -> str:
+        """Render the walk summary, reusing the cached per-protocol step summary"""
+        protocol_hash = self._protocol_hash(session)
+        key = ("summary", protocol_hash, session.revision)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        step_summary_key = ("step_summary", protocol_hash)
+        step_summary = self._get(step_summary_key)
+        if step_summary is None:
+            step_summary = self._put(
+                step_summary_key, WalkCompletion.format_step_summary(session.steps)
+            )
+
+        diagnostics_summary = StepDiagnosticCapture.format_diagnostics_summary(
+            session.diagnostics
+        )
+        summary_text = WalkCompletion.compose_walk_summary(
+            session.protocol_id,
+            len(session.steps),
+            step_summary,
+            diagnostics_summary
+        )
+        return self._put(key, summary_text)
+
+    def clear(self):
+        """Drop all cached fragments"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit statistics"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _protocol_hash(self, session: WalkSession) -> str:
+        if session.protocol_hash is None:
+            session.protocol_hash = compute_protocol_hash(session.protocol_id, session.steps)
+        return session.protocol_hash
+
+    def _step_body(self, protocol_hash: str, step: WalkStep, total_steps: int) -> str:
+        key = ("step_body", protocol_hash, step.step_index)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        output_parts = [
+            f"# {step.title}",
+            f"**Step {step.step_index + 1} of {total_steps}**",
+            "",
+            step.description,
+            ""
+        ]
+
+        if step.content:
+            output_parts.extend([
+                "## Content",
+                step.content,
+                ""
+            ])
+
+        if step.estimated_time:
+            output_parts.append(f"**Estimated Time**: {step.estimated_time} minutes")
+
+        return self._put(key, "\n".join(output_parts))
+
+    def _pace_fragment(self, pace: Optional[str]) -> str:
+        if not pace:
+            return PACE_REQUIRED_FRAGMENT
+
+        key = ("pace", pace)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        return self._put(key, "\n".join([
+            "",
+            f"**Current Pace**: {pace}",
+            PaceGovernor.get_pace_guidance(pace)
+        ]))
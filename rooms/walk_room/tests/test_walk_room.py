@@ -3,13 +3,10 @@ Test Suite for Walk Room
 Comprehensive testing of sequence enforcement, pacing, diagnostics, and completion
 """
 
+import asyncio
 import pytest
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from rooms.walk_room.walk_room import WalkRoom, run_walk_room
 from rooms.walk_room.contract_types import (
     WalkRoomInput, WalkRoomOutput, WalkStep, WalkState, 
@@ -19,6 +16,8 @@ from rooms.walk_room.sequencer import StepSequencer
 from rooms.walk_room.pacing import PaceGovernor
 from rooms.walk_room.step_diag import StepDiagnosticCapture
 from rooms.walk_room.completion import WalkCompletion
+from rooms.walk_room.render import WalkRenderCache, compute_protocol_hash
+from rooms.walk_room.persistence import WalkEventStore, session_to_dict
 
 
 class TestWalkRoom:
@@ -532,6 +531,236 @@ class TestWalkCompletion:
         assert "Step diagnostics not captured" in missing
 
 
+class TestWalkRenderCache:
+    """Test cached rendering of step, status and summary text"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.room = WalkRoom()
+        self.room.run_walk_room(WalkRoomInput(
+            session_state_ref='render-session',
+            payload={
+                'protocol_id': 'render_protocol',
+                'steps': [
+                    {'title': 'Step 1', 'content': 'Content 1', 'description': 'First', 'estimated_time': 2},
+                    {'title': 'Step 2', 'description': 'Second'}
+                ]
+            }
+        ))
+    
+    def _run(self, payload):
+        return self.room.run_walk_room(WalkRoomInput(
+            session_state_ref='render-session', payload=payload
+        ))
+    
+    def test_repeated_status_polls_hit_cache(self):
+        """Test that status polls without mutations reuse rendered text"""
+        first = self._run({'get_status': True})
+        hits_before = self.room.render_cache.hits
+        second = self._run({'get_status': True})
+        
+        assert first.display_text == second.display_text
+        assert self.room.render_cache.hits > hits_before
+    
+    def test_status_recomposed_after_mutation(self):
+        """Test that setting pace invalidates cached status text"""
+        before = self._run({'get_status': True}).display_text
+        self._run({'pace': 'NOW'})
+        after = self._run({'get_status': True}).display_text
+        
+        assert "**Steps Completed**: 0" in before
+        assert "**Steps Completed**: 1" in after
+        assert "Readiness: NOW" in after
+    
+    def test_cached_step_text_matches_uncached_layout(self):
+        """Test that cached step text keeps the original layout"""
+        result = self._run({'pace': 'HOLD'})
+        
+        assert result.display_text == "\n".join([
+            "# Step 1",
+            "**Step 1 of 2**",
+            "",
+            "First",
+            "",
+            "## Content",
+            "Content 1",
+            "",
+            "**Estimated Time**: 2 minutes",
+            "",
+            "**Current Pace**: HOLD",
+            PaceGovernor.get_pace_guidance('HOLD')
+        ])
+    
+    def test_summary_matches_format_walk_summary(self):
+        """Test that the cached summary equals the uncached summary"""
+        self._run({'pace': 'NOW'})
+        self._run({'action': 'advance_step'})
+        self._run({'pace': 'NOW'})
+        result = self._run({'confirm_completion': True})
+        
+        session = self.room._get_session('render-session')
+        expected = WalkCompletion.format_walk_summary(
+            session.protocol_id,
+            session.steps,
+            StepDiagnosticCapture.format_diagnostics_summary(session.diagnostics)
+        )
+        assert result.display_text == expected + " [[COMPLETE]]"
+    
+    def test_protocol_hash_tracks_step_content(self):
+        """Test that protocol hash changes when step content changes"""
+        steps = [WalkStep(step_index=0, title="A", content="x", description="d")]
+        changed = [WalkStep(step_index=0, title="A", content="y", description="d")]
+        
+        assert compute_protocol_hash("p", steps) == compute_protocol_hash("p", list(steps))
+        assert compute_protocol_hash("p", steps) != compute_protocol_hash("p", changed)
+    
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts least recently used entries"""
+        cache = WalkRenderCache(max_entries=2)
+        session = self.room._get_session('render-session')
+        
+        for pace in ['NOW', 'HOLD', 'LATER', 'SOFT_HOLD']:
+            cache.render_step(session, session.steps[0], pace)
+        
+        assert cache.get_stats()["entries"] <= 2
+
+
+class TestWalkSessionPersistence:
+    """Test event-sourced session restore across room instances"""
+    
+    def _start(self, room, session_ref='persist-session', step_count=6):
+        return room.run_walk_room(WalkRoomInput(
+            session_state_ref=session_ref,
+            payload={
+                'protocol_id': 'persist_protocol',
+                'steps': [
+                    {'title': f'Step {i + 1}', 'description': f'Description {i + 1}'}
+                    for i in range(step_count)
+                ]
+            }
+        ))
+    
+    def _run(self, room, payload, session_ref='persist-session'):
+        return room.run_walk_room(WalkRoomInput(session_state_ref=session_ref, payload=payload))
+    
+    def test_restart_restores_in_progress_walk(self, tmp_path):
+        """Test that a fresh room restores a walk lazily on first access"""
+        room = WalkRoom(event_store=WalkEventStore(str(tmp_path), snapshot_interval=4))
+        self._start(room)
+        for _ in range(3):
+            self._run(room, {'pace': 'NOW'})
+            self._run(room, {'action': 'advance_step'})
+        self._run(room, {'pace': 'HOLD'})
+        before = self._run(room, {'get_status': True}).display_text
+        
+        restarted = WalkRoom(event_store=WalkEventStore(str(tmp_path), snapshot_interval=4))
+        assert 'persist-session' not in restarted.sessions
+        
+        after = self._run(restarted, {'get_status': True}).display_text
+        assert after == before
+        assert session_to_dict(restarted.sessions['persist-session']) == \
+            session_to_dict(room.sessions['persist-session'])
+    
+    def test_snapshot_bounds_replay_tail(self, tmp_path):
+        """Test that replay after a snapshot only reads the events since it"""
+        store = WalkEventStore(str(tmp_path), snapshot_interval=3)
+        room = WalkRoom(event_store=store)
+        self._start(room)
+        for _ in range(4):
+            self._run(room, {'pace': 'NOW'})
+            self._run(room, {'action': 'advance_step'})
+        
+        snapshot, tail = WalkEventStore(str(tmp_path), snapshot_interval=3).load('persist-session')
+        assert snapshot is not None
+        assert len(tail) < store.snapshot_interval
+    
+    def test_restored_walk_can_complete(self, tmp_path):
+        """Test that a restored walk continues through completion"""
+        room = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        self._start(room, step_count=2)
+        self._run(room, {'pace': 'NOW'})
+        
+        restarted = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        self._run(restarted, {'action': 'advance_step'})
+        self._run(restarted, {'pace': 'NOW'})
+        result = self._run(restarted, {'confirm_completion': True})
+        
+        assert result.display_text.endswith("[[COMPLETE]]")
+    
+    def test_restart_of_walk_discards_previous_events(self, tmp_path):
+        """Test that starting a new walk supersedes the recorded one"""
+        room = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        self._start(room)
+        self._run(room, {'pace': 'NOW'})
+        self._run(room, {'action': 'advance_step'})
+        self._start(room, step_count=2)
+        
+        restarted = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        session = restarted._get_session('persist-session')
+        assert session.current_step_index == 0
+        assert len(session.steps) == 2
+        assert session.diagnostics == []
+    
+    def test_torn_log_tail_is_ignored(self, tmp_path):
+        """Test that a partially written final event does not break restore"""
+        store = WalkEventStore(str(tmp_path))
+        room = WalkRoom(event_store=store)
+        self._start(room)
+        self._run(room, {'pace': 'NOW'})
+        with open(store._log_path('persist-session'), 'a', encoding='utf-8') as log_file:
+            log_file.write('{"seq": 3, "type": "adv')
+        
+        restarted = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        session = restarted._get_session('persist-session')
+        assert session.current_step_index == 0
+        assert len(session.diagnostics) == 1
+    
+    def test_unknown_session_not_restored(self, tmp_path):
+        """Test that unknown sessions still produce the no-session error"""
+        room = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        result = self._run(room, {'get_status': True}, session_ref='missing')
+        
+        assert "No active walk session" in result.display_text
+
+
+class TestAsyncWalkRoom:
+    """Test the async room protocol entry point"""
+    
+    def _input(self, session_ref, payload):
+        return WalkRoomInput(session_state_ref=session_ref, payload=payload)
+    
+    def _start_payload(self):
+        return {
+            'protocol_id': 'async_protocol',
+            'steps': [{'title': f'Step {i + 1}', 'description': 'Description'} for i in range(3)]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_run_matches_sync_entry_point(self):
+        """Test that run returns what run_walk_room returns"""
+        async_room, sync_room = WalkRoom(), WalkRoom()
+        
+        result = await async_room.run(self._input('s', self._start_payload()))
+        expected = sync_room.run_walk_room(self._input('s', self._start_payload()))
+        
+        assert result == expected
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_with_event_store(self, tmp_path):
+        """Test that stored sessions run concurrently off the event loop"""
+        room = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        refs = [f'async-{i}' for i in range(10)]
+        
+        await asyncio.gather(*(room.run(self._input(ref, self._start_payload())) for ref in refs))
+        await asyncio.gather(*(room.run(self._input(ref, {'pace': 'NOW'})) for ref in refs))
+        results = await asyncio.gather(*(room.run(self._input(ref, {'action': 'advance_step'})) for ref in refs))
+        
+        assert all('Step 2 of 3' in result.display_text for result in results)
+        restarted = WalkRoom(event_store=WalkEventStore(str(tmp_path)))
+        assert all(restarted._get_session(ref).current_step_index == 1 for ref in refs)
+        assert len(room._session_locks) == 0
+
+
 class TestNoTypeScriptArtifacts:
     """Test that no TypeScript artifacts exist"""
     
@@ -12,14 +12,42 @@ from .sequencer import StepSequencer
 from .pacing import PaceGovernor
 from .step_diag import StepDiagnosticCapture
 from .completion import WalkCompletion
+from .render import WalkRenderCache, compute_protocol_hash, next_revision
+from ..room_protocol import SessionLocks, run_session_blocking
+from .persistence import (
+    WalkEventStore, WalkEvent,
+    EVENT_START, EVENT_SET_PACE, EVENT_ADVANCE, EVENT_CONFIRM_COMPLETION
+)
 
 
 class WalkRoom:
     """Main orchestrator for Walk Room protocol execution"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        render_cache: Optional[WalkRenderCache] = None,
+        event_store: Optional[WalkEventStore] = None
+    ):
         self.sessions: Dict[str, WalkSession] = {}
         self.protocol_structures: Dict[str, ProtocolStructure] = {}
+        self.render_cache = render_cache or WalkRenderCache()
+        self.event_store = event_store
+        self._session_locks = SessionLocks()
+    
+    async def run(self, input_data: WalkRoomInput) -> WalkRoomOutput:
+        """
+        Async room protocol entry point.
+        With an event store every mutation appends to disk, so the room
+        runs on a worker thread, one call per session at a time.
+        """
+        if self.event_store is None:
+            return self.run_walk_room(input_data)
+        return await run_session_blocking(
+            self._session_locks,
+            input_data.session_state_ref,
+            self.run_walk_room,
+            input_data
+        )
     
     def run_walk_room(self, input_data: WalkRoomInput) -> WalkRoomOutput:
         """
@@ -73,56 +101,70 @@ class WalkRoom:
         if not isinstance(payload, dict) or "protocol_id" not in payload:
             return self._create_error_output("Missing protocol_id in payload")
         
-        protocol_id = payload["protocol_id"]
-        steps_data = payload.get("steps", [])
+        start_data = {
+            "protocol_id": payload["protocol_id"],
+            "title": payload.get("title", payload["protocol_id"]),
+            "description": payload.get("description", ""),
+            "steps": [
+                step_data for step_data in payload.get("steps", [])
+                if isinstance(step_data, dict)
+            ]
+        }
+        
+        session = self._create_session(start_data)
+        if not session:
+            return self._create_error_output("No valid steps provided")
+        
+        self.sessions[input_data.session_state_ref] = session
+        self._record_event(input_data.session_state_ref, session, EVENT_START, start_data)
+        
+        # Return first step
+        return self._get_current_step(input_data)
+    
+    def _create_session(self, start_data: Dict[str, Any]) -> Optional[WalkSession]:
+        """Create a walk session and its protocol structure from start data"""
+        protocol_id = start_data["protocol_id"]
         
         # Create protocol structure
         steps = []
-        for i, step_data in enumerate(steps_data):
-            if isinstance(step_data, dict):
-                step = WalkStep(
-                    step_index=i,
-                    title=step_data.get("title", f"Step {i+1}"),
-                    content=step_data.get("content", ""),
-                    description=step_data.get("description", ""),
-                    estimated_time=step_data.get("estimated_time")
-                )
-                steps.append(step)
+        for i, step_data in enumerate(start_data["steps"]):
+            step = WalkStep(
+                step_index=i,
+                title=step_data.get("title", f"Step {i+1}"),
+                content=step_data.get("content", ""),
+                description=step_data.get("description", ""),
+                estimated_time=step_data.get("estimated_time")
+            )
+            steps.append(step)
         
         if not steps:
-            return self._create_error_output("No valid steps provided")
+            return None
         
         # Create completion prompt
         completion_prompt = WalkCompletion.create_completion_prompt(
-            payload.get("title", protocol_id), len(steps)
+            start_data["title"], len(steps)
         )
         
-        # Create protocol structure
-        protocol_structure = ProtocolStructure(
+        # Store protocol structure
+        self.protocol_structures[protocol_id] = ProtocolStructure(
             protocol_id=protocol_id,
-            title=payload.get("title", protocol_id),
-            description=payload.get("description", ""),
+            title=start_data["title"],
+            description=start_data["description"],
             steps=steps,
             completion_prompt=completion_prompt
         )
         
-        # Store protocol structure
-        self.protocol_structures[protocol_id] = protocol_structure
-        
         # Create walk session
-        session = WalkSession(
+        return WalkSession(
             current_step_index=0,
             walk_state=WalkState.PENDING,
             steps=steps,
             diagnostics=[],
             completion_confirmed=False,
-            protocol_id=protocol_id
+            protocol_id=protocol_id,
+            protocol_hash=compute_protocol_hash(protocol_id, steps),
+            revision=next_revision()
         )
-        
-        self.sessions[input_data.session_state_ref] = session
-        
-        # Return first step
-        return self._get_current_step(input_data)
     
     def _get_current_step(self, input_data: WalkRoomInput) -> WalkRoomOutput:
         """Get the current step for the session"""
@@ -161,8 +203,8 @@ class WalkRoom:
             return self._create_error_output("Cannot advance: pace must be set for current step before advancing")
         
         # Advance to next step
-        session.current_step_index += 1
-        session.walk_state = WalkState.IN_STEP
+        self._apply_advance(session)
+        self._record_event(input_data.session_state_ref, session, EVENT_ADVANCE)
         
         # Return new current step
         return self._get_current_step(input_data)
@@ -187,6 +229,10 @@ class WalkRoom:
             session.current_step_index,
             readiness_state=pace
         )
+        self._record_event(
+            input_data.session_state_ref, session, EVENT_SET_PACE,
+            {"step_index": session.current_step_index, "pace": pace}
+        )
         
         # Determine next action based on pace
         next_action = PaceGovernor.map_pace_to_action(pace)
@@ -211,8 +257,8 @@ class WalkRoom:
             return self._create_error_output("Cannot complete: not all steps delivered")
         
         # Mark completion as confirmed
-        session.completion_confirmed = True
-        session.walk_state = WalkState.COMPLETED
+        self._apply_confirm_completion(session)
+        self._record_event(input_data.session_state_ref, session, EVENT_CONFIRM_COMPLETION)
         
         # Return completion summary
         return self._handle_walk_completion(session)
@@ -232,16 +278,8 @@ class WalkRoom:
     
     def _handle_walk_completion(self, session: WalkSession) -> WalkRoomOutput:
         """Handle walk completion and return final output"""
-        # Format walk summary
-        diagnostics_summary = StepDiagnosticCapture.format_diagnostics_summary(
-            session.diagnostics
-        )
-        
-        summary_text = WalkCompletion.format_walk_summary(
-            session.protocol_id,
-            session.steps,
-            diagnostics_summary
-        )
+        # Format walk summary from cached fragments
+        summary_text = self.render_cache.render_summary(session)
         
         # Append completion marker
         final_text = WalkCompletion.append_completion_marker(summary_text)
@@ -252,8 +290,79 @@ class WalkRoom:
         )
     
     def _get_session(self, session_ref: str) -> Optional[WalkSession]:
-        """Get walk session by reference"""
-        return self.sessions.get(session_ref)
+        """Get walk session by reference, restoring it from the event store on first access"""
+        session = self.sessions.get(session_ref)
+        if session is None and self.event_store is not None:
+            session = self._restore_session(session_ref)
+        return session
+    
+    def _restore_session(self, session_ref: str) -> Optional[WalkSession]:
+        """Restore a session from its latest snapshot plus the tail of its event log"""
+        if not self.event_store.has_session(session_ref):
+            return None
+        
+        session, events = self.event_store.load(session_ref)
+        if session is not None:
+            session.revision = next_revision()
+        
+        for event in events:
+            session = self._replay_event(session, event)
+        
+        if session is not None:
+            self.sessions[session_ref] = session
+        return session
+    
+    def _replay_event(self, session: Optional[WalkSession], event: WalkEvent) -> Optional[WalkSession]:
+        """Apply one recorded event to a session without re-validating it"""
+        if event.event_type == EVENT_START:
+            return self._create_session(event.data)
+        
+        if session is None:
+            return None
+        
+        if event.event_type == EVENT_SET_PACE:
+            self._capture_step_diagnostics(
+                session,
+                event.data["step_index"],
+                readiness_state=event.data["pace"]
+            )
+        elif event.event_type == EVENT_ADVANCE:
+            self._apply_advance(session)
+        elif event.event_type == EVENT_CONFIRM_COMPLETION:
+            self._apply_confirm_completion(session)
+        
+        return session
+    
+    def _record_event(
+        self,
+        session_ref: str,
+        session: WalkSession,
+        event_type: str,
+        data: Optional[Dict[str, Any]] = None
+    ):
+        """Append a mutation to the event log and snapshot when the interval is reached"""
+        if self.event_store is None:
+            return
+        
+        self.event_store.append(session_ref, event_type, data)
+        if self.event_store.needs_snapshot(session_ref):
+            self.event_store.write_snapshot(session_ref, session)
+    
+    def _apply_advance(self, session: WalkSession):
+        """Move the session to its next step"""
+        session.current_step_index += 1
+        session.walk_state = WalkState.IN_STEP
+        self._touch_session(session)
+    
+    def _apply_confirm_completion(self, session: WalkSession):
+        """Mark the session's closure as confirmed"""
+        session.completion_confirmed = True
+        session.walk_state = WalkState.COMPLETED
+        self._touch_session(session)
+    
+    def _touch_session(self, session: WalkSession):
+        """Record a session mutation so cached status text is recomposed"""
+        session.revision = next_revision()
     
     def _has_diagnostics_for_step(self, session: WalkSession, step_index: int) -> bool:
         """Check if diagnostics exist for a specific step"""
@@ -278,6 +387,7 @@ class WalkRoom:
         ]
         
         session.diagnostics.append(diagnostics)
+        self._touch_session(session)
     
     def _format_step_output(
         self, 
@@ -286,61 +396,11 @@ class WalkRoom:
         pace: Optional[str] = None
     ) -> str:
         """Format step output with pacing information"""
-        current_step_num, total_steps = session.current_step_index + 1, len(session.steps)
-        
-        output_parts = [
-            f"# {step.title}",
-            f"**Step {current_step_num} of {total_steps}**",
-            "",
-            step.description,
-            ""
-        ]
-        
-        if step.content:
-            output_parts.extend([
-                "## Content",
-                step.content,
-                ""
-            ])
-        
-        if step.estimated_time:
-            output_parts.append(f"**Estimated Time**: {step.estimated_time} minutes")
-        
-        if pace:
-            output_parts.extend([
-                "",
-                f"**Current Pace**: {pace}",
-                PaceGovernor.get_pace_guidance(pace)
-            ])
-        else:
-            output_parts.extend([
-                "",
-                "**Pace Required**: Please set your pace for this step",
-                "Options: NOW, HOLD, LATER, SOFT_HOLD"
-            ])
-        
-        return "\n".join(output_parts)
+        return self.render_cache.render_step(session, step, pace)
     
     def _format_walk_status(self, session: WalkSession) -> str:
         """Format walk status information"""
-        current_step_num, total_steps = session.current_step_index + 1, len(session.steps)
-        
-        status_parts = [
-            f"# Walk Status: {session.protocol_id}",
-            f"**Current Step**: {current_step_num} of {total_steps}",
-            f"**Walk State**: {session.walk_state.value}",
-            f"**Steps Completed**: {len(session.diagnostics)}",
-            f"**Completion Confirmed**: {session.completion_confirmed}",
-            ""
-        ]
-        
-        if session.diagnostics:
-            status_parts.extend([
-                "## Recent Diagnostics",
-                StepDiagnosticCapture.format_diagnostics_summary(session.diagnostics[-3:])
-            ])
-        
-        return "\n".join(status_parts)
+        return self.render_cache.render_status(session)
     
     def _create_error_output(self, error_message: str) -> WalkRoomOutput:
         """Create error output with structured message"""
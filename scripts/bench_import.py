@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the hallway and rooms packages.
+
+Runs each import in a fresh interpreter under ``python -X importtime`` and
+reports the cumulative microseconds of the top-level module, plus wall time.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+    ("rooms.index (lazy)", "import rooms.index", "rooms.index"),
+    ("rooms.index + all names", "import rooms.index as i; [getattr(i, n) for n in i.__all__]", "rooms.index"),
+    ("rooms.registry", "import rooms.registry", "rooms.registry"),
+    ("hallway", "import hallway", "hallway"),
+]
+
+
+def measure(code: str, module: str):
+    """Return (cumulative_us_for_module, wall_seconds) for one fresh interpreter"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative = int(parts[1])
+    return cumulative, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hallway and rooms import time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<26} {'cumulative us':>14} {'wall ms':>10}")
+    for label, code, module in SCENARIOS:
+        samples = [measure(code, module) for _ in range(args.runs)]
+        cumulative = statistics.median(sample[0] for sample in samples)
+        wall = statistics.median(sample[1] for sample in samples) * 1000
+        print(f"{label:<26} {cumulative:>14.0f} {wall:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
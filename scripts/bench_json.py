@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark across the hallway, memory and validator paths.
+
+Each path is timed once per installed codec backend and once with plain
+``json`` calls as they were written before the codec existed.
+
+Run from the repository root with: python -m scripts.bench_json
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import tempfile
+import time
+import zlib
+
+from rooms import json_codec
+from rooms.integration_commit_room.wal import WriteAheadLog
+from hallway.audit import sha256_hex
+from hallway.hallway import _get_default_orchestrator
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _room_output(index: int) -> dict:
+    """A v0.1 room output shaped like what rooms return"""
+    return {
+        "room_id": "memory_room",
+        "display_text": "Captured memory for the session " * 4,
+        "next_action": "continue",
+        "items": [{"label": f"item-{index}-{i}", "tags": ["stone", "clarity"], "weight": i} for i in range(20)],
+        "flags": {"consent": True, "pinned": False}
+    }
+
+
+def _memory_record(index: int) -> dict:
+    """A memory write record as appended to the integration WAL"""
+    return {
+        "session_id": f"session-{index % 32}",
+        "record_id": index,
+        "integration": {"summary": "Integrated insight " * 8, "commitments": [f"commit-{i}" for i in range(6)]},
+        "labels": ["integration", "commitment", "memory"]
+    }
+
+
+def bench(func, seconds: float) -> float:
+    """Return calls per second of func over roughly the given duration"""
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        func()
+        calls += 1
+    return calls / (time.perf_counter() - start)
+
+
+def hallway_hash(plain: bool):
+    outputs = [_room_output(i) for i in range(64)]
+    if plain:
+        return lambda: [sha256_hex(json.dumps(o, sort_keys=True, separators=(",", ":"))) for o in outputs]
+    return lambda: [sha256_hex(json_codec.canonical_dumps(o)) for o in outputs]
+
+
+def hallway_envelope(plain: bool):
+    orchestrator = _get_default_orchestrator()
+    output = asyncio.run(orchestrator.run("bench-session"))
+    if plain:
+        return lambda: json.dumps(output, separators=(",", ":")).encode("utf-8")
+    return lambda: orchestrator.envelope.output_to_bytes(output)
+
+
+def memory_wal(plain: bool):
+    records = [_memory_record(i) for i in range(256)]
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "bench.wal")
+    wal = WriteAheadLog(path, fsync=False)
+    wal.append_many(records)
+    wal.close()
+
+    if plain:
+        def run():
+            for record in records:
+                payload = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+                b"%08x " % zlib.crc32(payload) + payload + b"\n"
+            with open(path, "rb") as wal_file:
+                for line in wal_file:
+                    checksum, _, payload = line[:-1].partition(b" ")
+                    if int(checksum, 16) == zlib.crc32(payload):
+                        json.loads(payload.decode("utf-8"))
+        return run
+
+    def run():
+        for record in records:
+            WriteAheadLog._encode(record)
+        WriteAheadLog._scan(path)
+    return run
+
+
+def validator_load(plain: bool):
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, "contracts", "**", "*.json"), recursive=True))
+    load = json.load if plain else json_codec.load
+
+    def run():
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                load(f)
+    return run
+
+
+SCENARIOS = [
+    ("hallway step hashes", hallway_hash),
+    ("hallway envelope bytes", hallway_envelope),
+    ("memory WAL encode+scan", memory_wal),
+    ("validator contract load", validator_load),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the JSON codec backends")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per scenario and backend")
+    args = parser.parse_args()
+
+    backends = json_codec.available_backends()
+    columns = ["json (plain)"] + [f"codec:{name}" for name in backends]
+    print(f"{'scenario (ops/sec)':<26}" + "".join(f"{column:>16}" for column in columns))
+    for label, scenario in SCENARIOS:
+        rates = [bench(scenario(True), args.seconds)]
+        for name in backends:
+            json_codec.set_backend(name)
+            rates.append(bench(scenario(False), args.seconds))
+        json_codec.set_backend()
+        print(f"{label:<26}" + "".join(f"{rate:>16.1f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
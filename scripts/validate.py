@@ -3,6 +3,8 @@
 JSON Schema validation script for Lichen Protocol contracts.
 
 Validates all JSON contracts in the repo against their JSON Schemas.
+Run from the repository root as a module (python3 -m scripts.validate) or
+with the package installed, so that rooms is importable.
 """
 
 import argparse
@@ -14,6 +16,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import os
 
+from rooms import json_codec
+
 try:
     from jsonschema import Draft7Validator, FormatChecker, ValidationError
     from jsonschema.exceptions import SchemaError
@@ -56,7 +60,7 @@ class ContractValidator:
         
         try:
             with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+                schema = json_codec.load(f)
         except (IOError, json.JSONDecodeError) as e:
             raise ValueError(f"Could not read/parse schema {schema_path}: {e}")
         
@@ -78,7 +82,7 @@ class ContractValidator:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = json_codec.load(f)
         except (IOError, json.JSONDecodeError) as e:
             return ValidationResult(
                 file=str(file_path.relative_to(self.repo_root)),
@@ -434,12 +438,12 @@ if __name__ == "__main__":
 
 
 # Validate everything:
-#   python3 scripts/validate.py
+#   python3 -m scripts.validate
 # Only rooms:
-#   python3 scripts/validate.py --only rooms
+#   python3 -m scripts.validate --only rooms
 # Ad-hoc:
-#   python3 scripts/validate.py --schema ./contracts/schema/rooms.schema.json --data "./contracts/rooms/*.json"
+#   python3 -m scripts.validate --schema ./contracts/schema/rooms.schema.json --data "./contracts/rooms/*.json"
 # JSON report:
-#   python3 scripts/validate.py --json > validation_report.json
+#   python3 -m scripts.validate --json > validation_report.json
 # Strict mode (warnings fail the build):
-#   python3 scripts/validate.py --strict
+#   python3 -m scripts.validate --strict